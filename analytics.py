@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+SectorFlow - Batch Analytics
+
+Headless command line entry point to summarize userdata library.
+
+Scan userdata directory (deltabest, fuel, energy, sector, consumption files),
+compute per-combo stats in a process pool, and write indexed summary database
+(combo_summary.db) to the same directory. Only combos with changed files
+are recomputed unless --force is set.
+
+Usage:
+    python analytics.py [path] [--workers N] [--force] [--list]
+"""
+
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from validadorers.userfile.combo_summary import (
+    connect_summary_db,
+    delete_combo_summary,
+    load_summary_modified,
+    save_combo_summary,
+    scan_combo_files,
+    summarize_combo,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _summarize_task(task):
+    """Process pool task"""
+    return summarize_combo(*task)
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="SectorFlow batch analytics")
+    parser.add_argument(
+        "path", nargs="?", default="deltabest/",
+        help="userdata directory to scan (default: deltabest/)")
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="number of worker processes (default: CPU count)")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="recompute all combos, ignore last modified time")
+    parser.add_argument(
+        "--list", action="store_true",
+        help="print summary after update")
+    return parser.parse_args()
+
+
+def main():
+    """Update combo summary database"""
+    args = parse_args()
+    filepath = os.path.join(args.path, "")
+    if not os.path.isdir(filepath):
+        logger.error("Userdata directory not found: %s", filepath)
+        return 1
+
+    combos = scan_combo_files(filepath)
+    connection = connect_summary_db(filepath)
+    try:
+        summarized = {} if args.force else load_summary_modified(connection)
+        tasks = [
+            (filepath, combo_name, modified)
+            for combo_name, modified in sorted(combos.items())
+            if summarized.get(combo_name) != modified
+        ]
+        removed = [combo_name for combo_name in summarized if combo_name not in combos]
+
+        if tasks:
+            workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+            chunksize = max(len(tasks) // (4 * workers), 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                save_combo_summary(connection, executor.map(_summarize_task, tasks, chunksize=chunksize))
+        if removed:
+            delete_combo_summary(connection, removed)
+
+        logger.info(
+            "Combos: %d scanned, %d updated, %d removed", len(combos), len(tasks), len(removed))
+
+        if args.list:
+            for row in connection.execute("SELECT * FROM combo_summary ORDER BY combo"):
+                print("\t".join(str(value) for value in row))
+    finally:
+        connection.close()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    logging.getLogger("validadorers").setLevel(logging.WARNING)
+    sys.exit(main())
@@ -0,0 +1,157 @@
+from math import isnan
+
+from pytest import approx
+
+from validadorers.gap_history import LAP_SAMPLES, NAN, TREND_SAMPLES, GapHistory
+from validadorers.timing_loop import TimingLoop
+
+
+def run_laps(gap_history, laps, laptimes, start_offsets=None):
+    """Run laps of vehicles with constant lap time per vehicle, update at each finish line crossing"""
+    if start_offsets is None:
+        start_offsets = [0.0] * len(laptimes)
+    for lap in range(1, laps + 1):
+        crossings = sorted(
+            (offset + lap * laptime, index)
+            for index, (laptime, offset) in enumerate(zip(laptimes, start_offsets))
+        )
+        for cross_time, index in crossings:
+            gap_history.update(index, index + 10, lap, cross_time)
+
+
+def test_lap_gaps():
+    gap_history = GapHistory(max_vehicles=3)
+    run_laps(gap_history, 5, (100.0, 101.0, 99.0), (0.0, 0.5, 3.0))
+    assert gap_history.last_lap(1) == 5
+    # Vehicle 1 loses 1 second per lap to vehicle 0
+    assert list(gap_history.lap_gaps(1, 0, 3)) == [
+        (3, approx(3.5)), (4, approx(4.5)), (5, approx(5.5))]
+    assert list(gap_history.lap_gaps(0, 1, 1)) == [(5, approx(-5.5))]
+    # Gap between any two vehicles, not only to reference vehicle
+    assert list(gap_history.lap_gaps(2, 1, 1)) == [(5, approx(-7.5))]
+
+
+def test_lap_gaps_skip_missing_laps():
+    gap_history = GapHistory(max_vehicles=2)
+    run_laps(gap_history, 3, (100.0,))
+    run_laps(gap_history, 3, (100.0, 105.0))
+    gap_history.update(0, 10, 4, 400.0)
+    # Vehicle 1 has no record of lap 4
+    assert [lap for lap, _ in gap_history.lap_gaps(0, 1, 10)] == [1, 2, 3]
+
+
+def test_lap_ring_overwritten():
+    gap_history = GapHistory(max_vehicles=2)
+    run_laps(gap_history, LAP_SAMPLES + 10, (100.0, 101.0))
+    gaps = list(gap_history.lap_gaps(1, 0, LAP_SAMPLES * 2))
+    assert len(gaps) == LAP_SAMPLES
+    assert gaps[0][0] == 11
+    assert gaps[-1] == (LAP_SAMPLES + 10, approx(LAP_SAMPLES + 10))
+
+
+def test_reset_on_slot_change_or_lap_going_back():
+    gap_history = GapHistory(max_vehicles=2)
+    run_laps(gap_history, 3, (100.0, 101.0))
+    gap_history.update(1, 99, 3, 303.0)
+    assert gap_history.last_lap(1) == 3
+    assert list(gap_history.lap_gaps(1, 0, 5)) == [(3, approx(3.0))]
+    # Records of later laps are cleared
+    gap_history.update(1, 99, 1, 310.0)
+    assert gap_history.last_lap(1) == 1
+    assert [lap for lap, _ in gap_history.lap_gaps(1, 0, 5)] == [1]
+    gap_history.update(1, 99, 3, 330.0)
+    assert [lap for lap, _ in gap_history.lap_gaps(1, 0, 5)] == [1, 3]
+
+
+def sample_trend(gap_history, elapsed_time, intervals):
+    """Sample trend of vehicles in same class, intervals - interval to vehicle ahead"""
+    gap_history.begin_update(elapsed_time)
+    for index in range(len(intervals) + 1):
+        gap_history.update(index, index + 10, 0, 0.0)
+    gap_history.update_trend(
+        [(index, index - 1) for index in range(len(intervals) + 1)],
+        lambda ahead, behind: intervals[behind - 1],
+    )
+    gap_history.end_update()
+
+
+def test_trend_gaps():
+    gap_history = GapHistory(trend_interval=5.0, max_vehicles=2)
+    version = gap_history.version
+    for step in range(20):
+        elapsed_time = step * 1.0
+        sample_trend(gap_history, elapsed_time, (elapsed_time * 0.1,))
+    # One sample per 5 seconds
+    assert gap_history.trend_count == 4
+    assert gap_history.version == version + 4
+    assert list(gap_history.trend_gaps(1, 0, 10)) == approx([0.0, 0.5, 1.0, 1.5])
+    assert list(gap_history.trend_gaps(1, 0, 2)) == approx([1.0, 1.5])
+
+
+def test_trend_gaps_not_available():
+    gap_history = GapHistory(trend_interval=1.0, max_vehicles=2)
+    gap_history.begin_update(0.0)
+    gap_history.update(0, 10, 0, 0.0)
+    gap_history.update_trend([(0, -1)], lambda ahead, behind: 0.0)
+    gap_history.end_update()
+    assert all(isnan(gap) for gap in gap_history.trend_gaps(1, 0, 10))
+
+
+def test_trend_ring_overwritten():
+    gap_history = GapHistory(trend_interval=1.0, max_vehicles=2)
+    for step in range(TREND_SAMPLES + 5):
+        sample_trend(gap_history, float(step), (float(step),))
+    gaps = list(gap_history.trend_gaps(1, 0, TREND_SAMPLES * 2))
+    assert len(gaps) == TREND_SAMPLES
+    assert gaps[0] == 5.0
+    assert gaps[-1] == TREND_SAMPLES + 4
+
+
+def test_session_time_going_back():
+    gap_history = GapHistory(trend_interval=5.0, max_vehicles=1)
+    gap_history.begin_update(100.0)
+    gap_history.end_update()
+    gap_history.begin_update(0.0)
+    assert gap_history.trend_due
+
+
+def test_trend_gaps_chained_in_class():
+    gap_history = GapHistory(trend_interval=1.0, max_vehicles=4)
+    sample_trend(gap_history, 0.0, (2.0, 3.0, 4.0))
+    assert list(gap_history.trend_gaps(3, 0, 1)) == approx([9.0])
+    assert list(gap_history.trend_gaps(3, 2, 1)) == approx([4.0])
+    # Interval not available breaks chain for vehicles behind
+    sample_trend(gap_history, 1.0, (2.0, NAN, 4.0))
+    assert list(gap_history.trend_gaps(1, 0, 1)) == approx([2.0])
+    assert isnan(list(gap_history.trend_gaps(3, 2, 1))[0])
+    # Vehicle not sampled
+    gap_history.begin_update(2.0)
+    gap_history.update_trend([(0, -1)], lambda ahead, behind: 1.0)
+    gap_history.end_update()
+    assert isnan(list(gap_history.trend_gaps(1, 0, 1))[0])
+
+
+def test_trend_gaps_lapped_by_leader():
+    # Vehicle 0 leads other class and laps vehicle 1 & 2, which run 2 seconds apart
+    track_length = 1000.0
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=3)
+    timing_loop.resize(track_length)
+    gap_history = GapHistory(trend_interval=5.0, max_vehicles=3)
+
+    def interval(ahead, behind):
+        gap = timing_loop.gap(ahead, behind)
+        return gap if gap >= 0 else NAN
+
+    for step in range(1, 1201):
+        elapsed_time = step * 0.1
+        gap_history.begin_update(elapsed_time)
+        for index, speed, start_time in ((0, 60.0, 0.0), (1, 20.0, 0.0), (2, 20.0, 2.0)):
+            distance = max(elapsed_time - start_time, 0.0) * speed
+            timing_loop.update(index, index + 10, distance, elapsed_time)
+            gap_history.update(index, index + 10, int(distance // track_length), 0.0)
+        gap_history.update_trend(((0, -1), (1, -1), (2, 1)), interval)
+        gap_history.end_update()
+    # Leader is more than 2 laps ahead, gap to overall leader no longer available
+    assert timing_loop.gap(0, 2) == -1
+    gaps = list(gap_history.trend_gaps(2, 1, 10))
+    assert gaps == approx([2.0] * 10)
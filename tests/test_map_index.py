@@ -0,0 +1,129 @@
+import random
+
+from validadorers.const_common import FLOAT_INF
+from validadorers.map_index import (
+    LOD_FULL_DETAIL,
+    MapIndex,
+    MapLOD,
+    max_pixel_error,
+    rdp_significance,
+)
+
+
+def test_rdp_significance_endpoints_always_kept():
+    coords = ((0, 0), (1, 0.5), (2, 0), (3, 0))
+    significance = rdp_significance(coords)
+    assert significance[0] == FLOAT_INF
+    assert significance[-1] == FLOAT_INF
+
+
+def test_rdp_significance_collinear_nodes_are_insignificant():
+    coords = tuple((index, index * 2.0) for index in range(10))
+    significance = rdp_significance(coords)
+    assert all(value == 0 for value in significance[1:-1])
+
+
+def test_rdp_significance_child_not_above_parent():
+    # Peak at index 2 is the most significant, bump at index 4 is nested
+    coords = ((0, 0), (1, 0), (2, 10), (3, 0), (4, 1), (5, 0), (6, 0))
+    significance = rdp_significance(coords)
+    assert significance[2] == max(significance[1:-1])
+    assert significance[4] <= significance[2]
+    assert 0 < significance[4] < 10
+
+
+def test_rdp_significance_vertical_distance():
+    coords = ((0, 0), (1, 3), (10, 0))
+    assert rdp_significance(coords, vertical=True)[1] == 3
+
+
+def test_rdp_significance_empty():
+    assert len(rdp_significance(())) == 0
+
+
+def test_map_lod_level():
+    assert MapLOD.level(0) == LOD_FULL_DETAIL
+    assert MapLOD.level(1) == 0
+    assert MapLOD.level(3) == 1
+    assert MapLOD.level(0.5) == -1
+
+
+def test_map_lod_level_index():
+    coords = ((0, 0), (1, 0), (2, 10), (3, 0), (4, 1), (5, 0), (6, 0))
+    lod = MapLOD(coords)
+    assert lod.level_index(0) == tuple(range(len(coords)))
+    # Only end nodes & peak remain at coarse level
+    assert lod.level_index(8) == (0, 2, 6)
+    assert lod.level_coords(8) == ((0, 0), (2, 10), (6, 0))
+    # Finer level keeps more nodes, cached per level
+    fine = lod.level_index(0.1)
+    assert set(lod.level_index(8)) < set(fine)
+    assert lod.level_index(0.1) is fine
+
+
+def test_max_pixel_error():
+    assert max_pixel_error(0) == 0
+    assert max_pixel_error(-1) == 0
+    assert max_pixel_error(2) == 1
+
+
+def create_map(total=500, seed=1):
+    """Random walk map coordinates & cumulative distances"""
+    rng = random.Random(seed)
+    coords = [(0.0, 0.0)]
+    dists = [(0.0, 0.0)]
+    for _ in range(total - 1):
+        last_x, last_y = coords[-1]
+        step_x, step_y = rng.uniform(-10, 10), rng.uniform(-10, 10)
+        coords.append((last_x + step_x, last_y + step_y))
+        dists.append((dists[-1][0] + (step_x * step_x + step_y * step_y) ** 0.5, 0.0))
+    return coords, dists
+
+
+def test_map_index_nearest_node_matches_brute_force():
+    coords, dists = create_map()
+    map_index = MapIndex(coords, dists)
+    rng = random.Random(2)
+    for _ in range(200):
+        x, y = rng.uniform(-300, 300), rng.uniform(-300, 300)
+        expected = min(
+            (px - x) ** 2 + (py - y) ** 2 for px, py in coords)
+        px, py = coords[map_index.nearest_node(x, y)]
+        assert (px - x) ** 2 + (py - y) ** 2 == expected
+
+
+def test_map_index_nodes_in_rect_matches_brute_force():
+    coords, dists = create_map()
+    map_index = MapIndex(coords, dists)
+    rng = random.Random(3)
+    for _ in range(50):
+        x1, x2 = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        y1, y2 = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        expected = [
+            index for index, (px, py) in enumerate(coords)
+            if min(x1, x2) <= px <= max(x1, x2) and min(y1, y2) <= py <= max(y1, y2)
+        ]
+        assert map_index.nodes_in_rect(x1, y1, x2, y2) == expected
+
+
+def test_map_index_distance_lookup():
+    coords = ((0, 0), (10, 0), (10, 10), (0, 10))
+    dists = ((0, 0), (10, 0), (20, 0), (30, 0))
+    map_index = MapIndex(coords, dists)
+    assert map_index.length == 30
+    assert map_index.node_at_distance(-5) == 0
+    assert map_index.node_at_distance(10) == 1
+    assert map_index.node_at_distance(10.1) == 2
+    assert map_index.node_at_distance(100) == 3
+    assert map_index.coords_at_distance(5) == (5, 0)
+    assert map_index.coords_at_distance(15) == (10, 5)
+    assert map_index.coords_at_distance(0) == (0, 0)
+    assert map_index.coords_at_distance(100) == (0, 10)
+
+
+def test_map_index_empty():
+    map_index = MapIndex((), ())
+    assert map_index.length == 0
+    assert map_index.node_at_distance(10) == -1
+    assert map_index.nearest_node(0, 0) == -1
+    assert map_index.nodes_in_rect(-1, -1, 1, 1) == []
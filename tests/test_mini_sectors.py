@@ -0,0 +1,127 @@
+from validadorers.mini_sectors import (
+    MIN_MINI_SECTORS,
+    STATE_CLASS_BEST,
+    STATE_NONE,
+    STATE_PERSONAL_BEST,
+    STATE_SLOWER,
+    MiniSectorTiming,
+)
+
+TRACK_LENGTH = 1000.0
+
+
+def drive_lap(mini_sectors, index, slot_id, class_name, lap, laptime, valid=True, start_time=None):
+    """Drive one lap at constant speed, update every 0.1 seconds, return end time"""
+    if start_time is None:
+        start_time = lap * laptime
+    speed = TRACK_LENGTH / laptime
+    samples = round(laptime / 0.1)
+    for sample in range(1, samples + 1):
+        seconds = sample * laptime / samples
+        mini_sectors.update(
+            index, slot_id, class_name,
+            lap * TRACK_LENGTH + seconds * speed, start_time + seconds, valid)
+    return start_time + laptime
+
+
+def create_timing():
+    mini_sectors = MiniSectorTiming(sectors=MIN_MINI_SECTORS, max_vehicles=3)
+    mini_sectors.resize(TRACK_LENGTH, MIN_MINI_SECTORS)
+    return mini_sectors
+
+
+def test_resize_clamps_sectors():
+    mini_sectors = MiniSectorTiming(sectors=5, max_vehicles=1)
+    assert mini_sectors.sectors == MIN_MINI_SECTORS
+    mini_sectors.resize(TRACK_LENGTH, 1000)
+    assert mini_sectors.sectors == 100
+    assert mini_sectors.sector_length == 10
+
+
+def test_sector_times_rounded_to_milliseconds():
+    mini_sectors = create_timing()
+    for lap in range(2):
+        drive_lap(mini_sectors, 0, 10, "GT3", lap, 100.0 / 3)
+    for sector in range(1, mini_sectors.sectors):
+        sector_time = mini_sectors.times[sector]
+        assert sector_time == round(sector_time, 3)
+        # Same pace every lap, interpolation error no longer shows as slower
+        assert mini_sectors.state(0, sector) == STATE_CLASS_BEST
+
+
+def test_sector_states():
+    mini_sectors = create_timing()
+    # Vehicle 1 is faster in same class
+    for lap in range(2):
+        drive_lap(mini_sectors, 0, 10, "GT3", lap, 100.0)
+        drive_lap(mini_sectors, 1, 11, "GT3", lap, 90.0)
+    assert mini_sectors.state(0, 5) == STATE_PERSONAL_BEST
+    assert mini_sectors.state(1, 5) == STATE_CLASS_BEST
+    # Slower lap
+    drive_lap(mini_sectors, 0, 10, "GT3", 2, 110.0, start_time=200.0)
+    assert mini_sectors.state(0, 5) == STATE_SLOWER
+    # Pit lap is not valid
+    drive_lap(mini_sectors, 0, 10, "GT3", 3, 100.0, valid=False, start_time=310.0)
+    assert mini_sectors.state(0, 5) == STATE_NONE
+
+
+def test_lap_state():
+    mini_sectors = create_timing()
+    # First lap starts from standstill at start line, no full lap yet
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 0, 100.0)
+    assert mini_sectors.lap_state(0) == STATE_NONE
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 1, 100.0, start_time=end_time)
+    assert mini_sectors.last_lap[0] == 100.0
+    assert mini_sectors.lap_state(0) == STATE_CLASS_BEST
+    drive_lap(mini_sectors, 1, 11, "GT3", 0, 90.0)
+    drive_lap(mini_sectors, 1, 11, "GT3", 1, 90.0)
+    assert mini_sectors.lap_state(0) == STATE_PERSONAL_BEST
+    assert mini_sectors.lap_state(1) == STATE_CLASS_BEST
+    # Lap state is kept while next (slower) lap is in progress
+    for step in range(1, 121):
+        mini_sectors.update(
+            0, 10, "GT3", 2 * TRACK_LENGTH + step * TRACK_LENGTH / 120, end_time + step, True)
+        if step == 60:
+            assert mini_sectors.lap_state(0) == STATE_PERSONAL_BEST
+    assert mini_sectors.lap_state(0) == STATE_SLOWER
+
+
+def test_small_backward_movement_keeps_records():
+    mini_sectors = create_timing()
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 0, 100.0)
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 1, 100.0, start_time=end_time)
+    # Distance briefly runs backwards at finish line
+    mini_sectors.update(0, 10, "GT3", 2 * TRACK_LENGTH - 5, end_time + 0.05, True)
+    assert mini_sectors.lap_state(0) == STATE_CLASS_BEST
+    assert mini_sectors.personal_best[5] > 0
+    drive_lap(mini_sectors, 0, 10, "GT3", 2, 100.0, start_time=end_time + 0.05)
+    assert mini_sectors.personal_best[5] > 0
+
+
+def test_large_backward_movement_restarts():
+    mini_sectors = create_timing()
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 0, 100.0)
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 1, 100.0, start_time=end_time)
+    personal_best = mini_sectors.personal_best[5]
+    # Reset to pit, current lap cleared, personal best kept
+    mini_sectors.update(0, 10, "GT3", TRACK_LENGTH + 500, end_time + 1, True)
+    assert mini_sectors.lap_state(0) == STATE_NONE
+    assert mini_sectors.state(0, 5) == STATE_NONE
+    assert mini_sectors.personal_best[5] == personal_best
+    assert mini_sectors.best_lap[0] == 100.0
+    assert mini_sectors.last_sector[0] == -1
+    # Slower lap after restart compared against kept personal best
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 1, 110.0, start_time=end_time + 2)
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 2, 110.0, start_time=end_time)
+    assert mini_sectors.state(0, 5) == STATE_SLOWER
+    assert mini_sectors.lap_state(0) == STATE_SLOWER
+
+
+def test_slot_change_resets():
+    mini_sectors = create_timing()
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 0, 100.0)
+    end_time = drive_lap(mini_sectors, 0, 10, "GT3", 1, 100.0, start_time=end_time)
+    mini_sectors.update(0, 11, "GT3", 2 * TRACK_LENGTH + 5, end_time + 0.1, True)
+    assert mini_sectors.personal_best[5] == 0
+    assert mini_sectors.best_lap[0] == 0
+    assert mini_sectors.last_sector[0] == -1
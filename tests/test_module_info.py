@@ -0,0 +1,135 @@
+import random
+
+from pytest import approx
+
+from validadorers.module_info import ConsumptionColumns, ConsumptionDataSet, DistanceCursor
+
+
+def create_lap(lap_number, valid=1, fuel=3.0, laptime=100.0, energy=5.0, wear=0.2):
+    return ConsumptionDataSet(
+        lapNumber=lap_number,
+        isValidLap=valid,
+        lapTimeLast=laptime,
+        lastLapUsedFuel=fuel,
+        lastLapUsedEnergy=energy,
+        tyreAvgWearLast=wear,
+    )
+
+
+def brute_force_stats(laps, channel):
+    values = [getattr(lap, channel) for lap in laps if lap.isValidLap]
+    if not values:
+        return 0, 0.0, 0.0, 0.0
+    return len(values), sum(values) / len(values), min(values), max(values)
+
+
+def test_consumption_stats():
+    summary = ConsumptionColumns(max_laps=10)
+    assert summary.stats("lastLapUsedFuel").count == 0
+    summary.append(create_lap(1, fuel=3.0))
+    summary.append(create_lap(2, fuel=2.0))
+    summary.append(create_lap(3, valid=0, fuel=9.0))
+    summary.append(create_lap(4, fuel=4.0))
+    stats = summary.stats("lastLapUsedFuel")
+    assert stats.count == 3
+    assert stats.mean == approx(3.0)
+    assert stats.min == 2.0
+    assert stats.max == 4.0
+    assert summary.last_valid("lastLapUsedFuel") == 4.0
+
+
+def test_placeholder_skipped():
+    summary = ConsumptionColumns(max_laps=10)
+    summary.append(ConsumptionDataSet())
+    assert len(summary) == 0
+
+
+def test_stats_after_eviction():
+    summary = ConsumptionColumns(max_laps=3)
+    summary.append(create_lap(1, fuel=1.0))  # min
+    summary.append(create_lap(2, fuel=9.0))  # max
+    summary.append(create_lap(3, fuel=5.0))
+    summary.append(create_lap(4, fuel=6.0))  # evict lap 1
+    stats = summary.stats("lastLapUsedFuel")
+    assert tuple(summary.lapNumber) == (2, 3, 4)
+    assert stats.count == 3
+    assert stats.min == 5.0
+    assert stats.max == 9.0
+    assert stats.mean == approx(20 / 3)
+    summary.append(create_lap(5, fuel=7.0))  # evict lap 2
+    stats = summary.stats("lastLapUsedFuel")
+    assert stats.min == 5.0
+    assert stats.max == 7.0
+    assert stats.mean == approx(6.0)
+
+
+def test_all_valid_laps_evicted():
+    summary = ConsumptionColumns(max_laps=2)
+    summary.append(create_lap(1, fuel=3.0))
+    summary.append(create_lap(2, valid=0))
+    summary.append(create_lap(3, valid=0))
+    assert summary.stats("lastLapUsedFuel").count == 0
+    assert summary.lastValidIndex == -1
+    assert summary.last_valid("lastLapUsedFuel") == 0
+    summary.append(create_lap(4, fuel=2.0))
+    assert summary.stats("lastLapUsedFuel") == (1, 2.0, 2.0, 2.0)
+
+
+def test_stats_match_brute_force():
+    rng = random.Random(7)
+    summary = ConsumptionColumns(max_laps=20)
+    laps = []
+    for lap_number in range(1, 300):
+        lap = create_lap(
+            lap_number,
+            valid=int(rng.random() > 0.2),
+            fuel=rng.uniform(2, 4),
+            energy=rng.uniform(4, 6),
+            wear=rng.uniform(0.1, 0.3),
+        )
+        laps.append(lap)
+        summary.append(lap)
+        for channel in ConsumptionColumns.CHANNELS:
+            assert summary.stats(channel) == approx(brute_force_stats(laps[-20:], channel))
+
+
+def test_reset_and_extend():
+    summary = ConsumptionColumns(max_laps=3)
+    summary.append(create_lap(1, fuel=9.0))
+    summary.reset()
+    assert summary.stats("lastLapUsedFuel").count == 0
+    # History data set is newest first
+    summary.extend((create_lap(lap, fuel=lap) for lap in (5, 4, 3, 2, 1)))
+    assert tuple(summary.lapNumber) == (3, 4, 5)
+    assert summary.stats("lastLapUsedFuel") == approx((3, 4.0, 3.0, 5.0))
+
+
+REFERENCE = tuple(float(dist) for dist in range(0, 1000, 10))
+
+
+def test_distance_cursor_forward_seek():
+    cursor = DistanceCursor(REFERENCE)
+    assert cursor.seek(-5.0) == -1
+    assert cursor.seek(0.0) == 0
+    assert cursor.seek(15.0) == 1
+    assert cursor.seek(15.0) == 1
+    assert cursor.seek(20.0) == 2
+    # Jump beyond max forward steps
+    assert cursor.seek(905.0) == 90
+    assert cursor.seek(2000.0) == 99
+
+
+def test_distance_cursor_wrap_at_finish_line():
+    cursor = DistanceCursor(REFERENCE)
+    for step in range(0, 2000, 3):
+        position = step % 1000 + 0.5
+        assert cursor.seek(position) == int(position // 10)
+
+
+def test_distance_cursor_backward_seek():
+    cursor = DistanceCursor(REFERENCE)
+    assert cursor.seek(500.0) == 50
+    assert cursor.seek(495.0) == 49
+    assert cursor.seek(5.0) == 0
+    cursor.reset(())
+    assert cursor.seek(5.0) == -1
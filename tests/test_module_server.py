@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from validadorers.async_request import (
+    BUFFER_LIMIT,
+    WEBSOCKET_CLOSE,
+    WEBSOCKET_PING,
+    WEBSOCKET_TEXT,
+    read_websocket_frame,
+    websocket_frame,
+)
+from validadorers.module.module_server import SKIP, delta_fields, delta_value, jsonable
+
+MASK = b"\x12\x34\x56\x78"
+
+
+def read_frame(data):
+    """Read websocket frame from raw bytes"""
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_websocket_frame(reader)
+
+    return asyncio.run(run())
+
+
+def masked_frame(payload, opcode=WEBSOCKET_TEXT, length_bytes=0):
+    """Encode client websocket frame (final, masked)
+
+    length_bytes: 0 for auto, 2 or 8 to force extended length form.
+    """
+    length = len(payload)
+    if length_bytes == 8:
+        header = bytes((0x80 | opcode, 0x80 | 127)) + length.to_bytes(8, "big")
+    elif length_bytes == 2 or length >= 126:
+        header = bytes((0x80 | opcode, 0x80 | 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 0x80 | length))
+    masked = bytes(byte ^ MASK[pos % 4] for pos, byte in enumerate(payload))
+    return header + MASK + masked
+
+
+@pytest.mark.parametrize("length", (0, 1, 125, 126, 1000, 65535))
+def test_websocket_frame_round_trip(length):
+    payload = bytes(range(256)) * (length // 256) + bytes(range(length % 256))
+    frame = websocket_frame(payload)
+    assert frame[0] == 0x80 | WEBSOCKET_TEXT
+    if length < 126:
+        assert frame[1] == length
+    else:
+        assert frame[1] == 126
+        assert int.from_bytes(frame[2:4], "big") == length
+    if length <= BUFFER_LIMIT:
+        assert read_frame(frame) == (WEBSOCKET_TEXT, payload)
+
+
+def test_websocket_frame_64bit_length():
+    payload = b"x" * 65536
+    frame = websocket_frame(payload, WEBSOCKET_CLOSE)
+    assert frame[0] == 0x80 | WEBSOCKET_CLOSE
+    assert frame[1] == 127
+    assert int.from_bytes(frame[2:10], "big") == 65536
+    assert frame[10:] == payload
+    # Client frame over buffer limit is rejected
+    with pytest.raises(ConnectionError):
+        read_frame(frame)
+
+
+@pytest.mark.parametrize("length_bytes", (0, 2, 8))
+def test_read_masked_frame(length_bytes):
+    payload = b"ping data"
+    frame = masked_frame(payload, WEBSOCKET_PING, length_bytes)
+    assert read_frame(frame) == (WEBSOCKET_PING, payload)
+
+
+def test_read_masked_frame_extended_length():
+    payload = bytes(range(200))
+    assert read_frame(masked_frame(payload)) == (WEBSOCKET_TEXT, payload)
+    assert read_frame(masked_frame(b"")) == (WEBSOCKET_TEXT, b"")
+
+
+def test_read_incomplete_frame():
+    frame = masked_frame(b"close")
+    with pytest.raises(asyncio.IncompleteReadError):
+        read_frame(frame[:-1])
+
+
+def test_jsonable():
+    assert jsonable(1.234567) == 1.2346
+    assert jsonable(float("nan")) is None
+    assert jsonable((1, 2.0, "a")) == [1, 2.0, "a"]
+    assert jsonable({1: 0.5}) == {"1": 0.5}
+    assert jsonable(object()) is SKIP
+
+
+def test_delta_value_replaced():
+    assert delta_value(SKIP, 5) == 5
+    assert delta_value(1, [1, 2]) == [1, 2]
+    # Length changed, full list
+    last = [{"a": 1}]
+    new = [{"a": 1}, {"a": 2}]
+    assert delta_value(last, new) is new
+    # List of values, full list
+    assert delta_value([1, 2], [1, 3]) == [1, 3]
+
+
+def test_delta_value_index_delta():
+    last = [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}]
+    new = [{"a": 1, "b": 2}, {"a": 3, "b": 7}, {"a": 0, "b": 6}]
+    # Only changed items by index, only changed fields of item
+    assert delta_value(last, new) == {"1": {"b": 7}, "2": {"a": 0}}
+    assert delta_value(last, last) == {}
+
+
+def test_delta_fields_nested():
+    last = {"name": "A", "timer": {"elapsed": 1.0, "laps": 2}, "history": [{"t": 1}, {"t": 2}]}
+    new = {"name": "A", "timer": {"elapsed": 1.5, "laps": 2}, "history": [{"t": 1}, {"t": 3}]}
+    assert delta_fields(last, new) == {"timer": {"elapsed": 1.5, "laps": 2}, "history": {"1": {"t": 3}}}
+    # New field
+    assert delta_fields({}, {"name": "A"}) == {"name": "A"}
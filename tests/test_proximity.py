@@ -0,0 +1,124 @@
+from pytest import approx
+
+from validadorers.const_common import MAX_METERS
+from validadorers.proximity import ClosingPrediction, VehicleProximity
+
+
+def create_proximity(max_range, distances):
+    proximity = VehicleProximity(max_range)
+    for index, distance in enumerate(distances):
+        proximity.add(distance, index)
+    proximity.commit()
+    return proximity
+
+
+def test_vehicles_sorted_and_out_of_range_skipped():
+    proximity = create_proximity(100.0, (50.0, 150.0, 10.0, 100.0, 30.0))
+    assert proximity.vehicles == ((10.0, 2), (30.0, 4), (50.0, 0), (100.0, 3))
+    assert proximity.nearest() == 10.0
+
+
+def test_within():
+    proximity = create_proximity(100.0, (50.0, 150.0, 10.0, 100.0, 30.0))
+    assert proximity.within(30.0) == (2, 4)
+    assert proximity.within(5.0) == ()
+    assert proximity.within(1000.0) == (2, 4, 0, 3)
+
+
+def test_same_distance_kept():
+    proximity = create_proximity(100.0, (20.0, 20.0))
+    assert proximity.within(20.0) == (0, 1)
+
+
+def test_covers():
+    proximity = VehicleProximity(100.0)
+    assert proximity.covers(100.0)
+    assert not proximity.covers(100.1)
+
+
+def test_commit_replaces_list():
+    proximity = create_proximity(100.0, (50.0, 10.0))
+    proximity.commit()
+    assert proximity.vehicles == ()
+    assert proximity.nearest() == MAX_METERS
+
+
+class VehicleData:
+    """Vehicle data with prediction outputs"""
+
+    def __init__(self, pos_x=0.0, pos_y=0.0, distance=0.0):
+        self.worldPositionX = pos_x
+        self.worldPositionY = pos_y
+        self.relativeStraightDistance = distance
+        self.closingSpeed = 0.0
+        self.timeToClosestApproach = -1.0
+        self.closestApproachDistance = MAX_METERS
+
+
+def drive(prediction, index, slot_id, start, velocity, steps, step_time=0.1):
+    """Record constant velocity positions, return last position"""
+    for step in range(steps):
+        pos_x = start[0] + velocity[0] * step * step_time
+        pos_y = start[1] + velocity[1] * step * step_time
+        prediction.record(index, slot_id, pos_x, pos_y, step * step_time)
+    return pos_x, pos_y
+
+
+def test_velocity():
+    prediction = ClosingPrediction(max_vehicles=2)
+    assert prediction.velocity(0) is None
+    drive(prediction, 0, 10, (0.0, 0.0), (30.0, -10.0), 20)
+    assert prediction.velocity(0) == approx((30.0, -10.0))
+
+
+def test_record_skips_same_time_and_resets_on_time_going_back():
+    prediction = ClosingPrediction(max_vehicles=1)
+    prediction.record(0, 10, 0.0, 0.0, 1.0)
+    prediction.record(0, 10, 5.0, 0.0, 1.0)
+    assert prediction.velocity(0) is None
+    prediction.record(0, 10, 10.0, 0.0, 2.0)
+    assert prediction.velocity(0) == approx((10.0, 0.0))
+    prediction.record(0, 10, 0.0, 0.0, 0.5)
+    assert prediction.velocity(0) is None
+    # Slot change clears history
+    prediction.record(0, 11, 10.0, 0.0, 1.5)
+    assert prediction.velocity(0) is None
+
+
+def test_predict_closing_vehicle():
+    prediction = ClosingPrediction(max_vehicles=2)
+    # Player at 50 m/s, vehicle 1 is 40 m behind at 60 m/s, offset 2 m sideways
+    player_pos = drive(prediction, 0, 10, (0.0, 0.0), (50.0, 0.0), 10)
+    other_pos = drive(prediction, 1, 11, (-40.0, 2.0), (60.0, 0.0), 10)
+    rel_x = other_pos[0] - player_pos[0]
+    rel_y = other_pos[1] - player_pos[1]
+    distance = (rel_x * rel_x + rel_y * rel_y) ** 0.5
+    data_set = (
+        VehicleData(*player_pos),
+        VehicleData(*other_pos, distance=distance),
+    )
+    prediction.predict(data_set, 0, (1,))
+    data = data_set[1]
+    assert data.closingSpeed == approx(10.0 * -rel_x / distance)
+    assert data.timeToClosestApproach == approx(-rel_x / 10.0)
+    assert data.closestApproachDistance == approx(2.0)
+
+
+def test_predict_moving_apart_and_candidate_removed():
+    prediction = ClosingPrediction(max_vehicles=2)
+    player_pos = drive(prediction, 0, 10, (0.0, 0.0), (50.0, 0.0), 10)
+    other_pos = drive(prediction, 1, 11, (20.0, 0.0), (60.0, 0.0), 10)
+    distance = other_pos[0] - player_pos[0]
+    data_set = (
+        VehicleData(*player_pos),
+        VehicleData(*other_pos, distance=distance),
+    )
+    prediction.predict(data_set, 0, (1,))
+    data = data_set[1]
+    assert data.closingSpeed == approx(-10.0)
+    assert data.timeToClosestApproach == -1
+    assert data.closestApproachDistance == approx(distance)
+    # Outputs are cleared once vehicle is no longer candidate
+    prediction.predict(data_set, 0, ())
+    assert data.closingSpeed == 0
+    assert data.closestApproachDistance == MAX_METERS
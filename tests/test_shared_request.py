@@ -0,0 +1,189 @@
+import asyncio
+
+from pytest import approx
+
+from validadorers import shared_request as shared_request_module
+from validadorers.async_loop import async_loop
+from validadorers.async_request import set_header_get
+from validadorers.shared_request import RequestStats, SharedRequest, request_path
+
+HOST = "localhost"
+PORT = 6397
+REQUEST = set_header_get("/rest/watch/standings", HOST)
+ENDPOINT = f"{HOST}:{PORT}/rest/watch/standings"
+
+
+class FakeResponse:
+    """Fake get_response, count calls & return preset response after delay"""
+
+    def __init__(self, response=b"data", delay=0.01):
+        self.response = response
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, request, host, port, time_out, ssl=False):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.response
+
+
+def patch_response(monkeypatch, **kwargs):
+    fake_response = FakeResponse(**kwargs)
+    monkeypatch.setattr(shared_request_module, "get_response", fake_response)
+    return fake_response
+
+
+def test_request_path():
+    assert request_path(REQUEST) == "/rest/watch/standings"
+    assert request_path(b"") == ""
+    assert request_path(b"GET") == ""
+
+
+def test_request_stats_record():
+    stats = RequestStats()
+    stats.record(0.2, True)
+    assert stats.latencyAvg == approx(0.2)
+    stats.record(1.2, False)
+    assert stats.requests == 2
+    assert stats.errors == 1
+    assert stats.latency == approx(1.2)
+    assert stats.latencyMax == approx(1.2)
+    assert stats.latencyAvg == approx(0.2 + (1.2 - 0.2) * shared_request_module.LATENCY_EMA_FACTOR)
+
+
+def test_concurrent_requests_coalesced(monkeypatch):
+    fake_response = patch_response(monkeypatch)
+    shared = SharedRequest()
+
+    async def run():
+        return await asyncio.gather(*(shared.get(REQUEST, HOST, PORT, 1.0) for _ in range(5)))
+
+    assert asyncio.run(run()) == [b"data"] * 5
+    assert fake_response.calls == 1
+    stats = shared.stats[ENDPOINT]
+    assert stats.requests == 1
+    assert stats.coalesced == 4
+
+
+def test_sequential_requests_not_coalesced(monkeypatch):
+    fake_response = patch_response(monkeypatch)
+    shared = SharedRequest()
+
+    async def run():
+        for _ in range(3):
+            await shared.get(REQUEST, HOST, PORT, 1.0)
+
+    asyncio.run(run())
+    assert fake_response.calls == 3
+    assert shared.stats[ENDPOINT].coalesced == 0
+
+
+def test_cancelled_caller_does_not_cancel_shared_request(monkeypatch):
+    fake_response = patch_response(monkeypatch, delay=0.05)
+    shared = SharedRequest()
+
+    async def run():
+        first = asyncio.ensure_future(shared.get(REQUEST, HOST, PORT, 1.0))
+        second = asyncio.ensure_future(shared.get(REQUEST, HOST, PORT, 1.0))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == b"data"
+    assert fake_response.calls == 1
+
+
+def test_ttl_cache(monkeypatch):
+    fake_response = patch_response(monkeypatch)
+    clock = [100.0]
+    monkeypatch.setattr(shared_request_module, "monotonic", lambda: clock[0])
+    shared = SharedRequest()
+
+    async def run():
+        await shared.get(REQUEST, HOST, PORT, 1.0, ttl=1.0)
+        clock[0] += 0.5
+        await shared.get(REQUEST, HOST, PORT, 1.0, ttl=1.0)
+        # No cache reuse without ttl
+        await shared.get(REQUEST, HOST, PORT, 1.0)
+        clock[0] += 1.5
+        await shared.get(REQUEST, HOST, PORT, 1.0, ttl=1.0)
+
+    asyncio.run(run())
+    assert fake_response.calls == 3
+    assert shared.stats[ENDPOINT].cached == 1
+
+
+def test_clear_cache(monkeypatch):
+    fake_response = patch_response(monkeypatch)
+    shared = SharedRequest()
+
+    async def run():
+        await shared.get(REQUEST, HOST, PORT, 1.0, ttl=10.0)
+        shared.clear_cache()
+        await shared.get(REQUEST, HOST, PORT, 1.0, ttl=10.0)
+
+    asyncio.run(run())
+    assert fake_response.calls == 2
+
+
+def test_failed_request_not_cached(monkeypatch):
+    fake_response = patch_response(monkeypatch, response=b"")
+    shared = SharedRequest()
+
+    async def run():
+        first = await shared.get(REQUEST, HOST, PORT, 1.0, ttl=10.0)
+        second = await shared.get(REQUEST, HOST, PORT, 1.0, ttl=10.0)
+        return first, second
+
+    assert asyncio.run(run()) == (b"", b"")
+    assert fake_response.calls == 2
+    stats = shared.stats[ENDPOINT]
+    assert stats.errors == 2
+    assert stats.cached == 0
+
+
+def test_summary(monkeypatch):
+    patch_response(monkeypatch)
+    shared = SharedRequest()
+    assert shared.summary() == (0, 0, 0.0)
+
+    async def run():
+        await shared.get(REQUEST, HOST, PORT, 1.0)
+        await shared.get(set_header_get("/rest/sessions", HOST), HOST, PORT, 1.0)
+
+    asyncio.run(run())
+    requests, errors, latency = shared.summary()
+    assert len(shared.stats) == 2
+    assert requests == 2
+    assert errors == 0
+    assert latency > 0
+
+
+def test_top_endpoints(monkeypatch):
+    patch_response(monkeypatch)
+    shared = SharedRequest()
+    shared.endpoint_stats(HOST, PORT, REQUEST).record(0.5, True)
+    shared.endpoint_stats(HOST, PORT, set_header_get("/rest/sessions", HOST)).record(0.1, True)
+    shared.endpoint_stats(HOST, PORT, set_header_get("/rest/garage", HOST)).record(0.9, False)
+    endpoints = shared.top_endpoints(2)
+    assert [endpoint for endpoint, _ in endpoints] == [
+        f"{HOST}:{PORT}/rest/garage",
+        ENDPOINT,
+    ]
+    assert shared.top_endpoints(0) == ()
+
+
+def test_group_cancel_cancels_inflight_request(monkeypatch):
+    patch_response(monkeypatch, delay=10.0)
+    shared = SharedRequest()
+    future = async_loop.submit(shared.get(REQUEST, HOST, PORT, 1.0), "restapi")
+    try:
+        async_loop.run(asyncio.sleep(0.05))
+        tasks = tuple(shared._inflight.values())
+        assert len(tasks) == 1
+        async_loop.cancel("restapi")
+        assert future.cancelled()
+        assert tasks[0].cancelled()
+        assert not shared._inflight
+    finally:
+        async_loop.stop()
@@ -0,0 +1,120 @@
+from pytest import approx
+
+from validadorers.strategy import (
+    StrategySetup,
+    laps_lost,
+    minimum_stops,
+    simulate_layout,
+    simulate_strategy,
+    stint_layouts,
+    stop_refills,
+)
+
+
+def create_setup(**kwargs):
+    """Setup of 30 laps race, 10 laps per full tank, start full"""
+    setup = StrategySetup(
+        laps=30,
+        laptime=100.0,
+        consumption=3.0,
+        capacity=30.0,
+        amount_start=30.0,
+        pit_pass_time=20.0,
+        refill_base=2.0,
+        refill_rate=2.0,
+    )
+    return setup._replace(**kwargs)
+
+
+def test_minimum_stops():
+    assert minimum_stops(create_setup()) == 2
+    assert minimum_stops(create_setup(laps=10)) == 0
+    assert minimum_stops(create_setup(laps=10.1)) == 1
+    assert minimum_stops(create_setup(consumption=0)) == 0
+    assert minimum_stops(create_setup(capacity=0)) == -1
+
+
+def test_stint_layouts():
+    assert stint_layouts(create_setup(), 2) == [(10, 10, 10)]
+    # Not enough stops to finish
+    assert stint_layouts(create_setup(), 1) == []
+    layouts = stint_layouts(create_setup(laps=25), 2)
+    assert (25 / 3,) * 3 in layouts
+    assert (10, 10, 5) in layouts
+    assert (5, 10, 10) in layouts
+    for layout in layouts:
+        assert sum(layout) == approx(25)
+        assert max(layout) <= 10
+
+
+def test_stint_layouts_limited_start_amount():
+    layouts = stint_layouts(create_setup(laps=20, amount_start=15.0), 2)
+    for layout in layouts:
+        assert layout[0] <= 5 + 0.000001
+        assert sum(layout) == approx(20)
+
+
+def test_stop_refills():
+    setup = create_setup(laps=25)
+    assert stop_refills(setup, (10, 10, 5)) == approx([30, 15])
+    assert stop_refills(setup, (5, 10, 10)) == approx([15, 30])
+    # Refill is capped by tank space
+    assert stop_refills(setup, (10, 15)) == approx([30])
+    assert stop_refills(create_setup(consumption=0), (10, 10)) == [0.0]
+
+
+def test_simulate_layout_pit_time():
+    setup = create_setup(laps=25)
+    plans = list(simulate_layout(setup, (10, 10, 5)))
+    # No tyre wear, every tyre change plan is feasible
+    assert len(plans) == 4
+    plan = plans[0]
+    assert plan.tyre_change == (False, False)
+    # 2 pass through + refill (2 + 30 / 2) + refill (2 + 15 / 2)
+    assert plan.pit_time == approx(40 + 17 + 9.5)
+    assert plan.total_time == approx(2500 + plan.pit_time)
+
+
+def test_simulate_layout_tyre_change():
+    setup = create_setup(
+        laps=25, tyre_change_time=25.0, tyre_concurrent=True,
+        tyre_tread=50.0, tyre_wear=5.0, tyre_degradation=0.1)
+    plans = {plan.tyre_change: plan for plan in simulate_layout(setup, (10, 10, 5))}
+    # 50% tread lasts 10 laps, new tyre lasts 20 laps
+    assert set(plans) == {(True, False), (True, True)}
+    one_change = plans[(True, False)]
+    assert one_change.pit_time == approx(40 + 25 + 9.5)
+    # Tyre age 10 laps at start, then new tyre for 15 laps
+    tyre_time = 0.1 * (10 * 10 + 10 * 9 * 0.5) + 0.1 * (15 * 14 * 0.5)
+    assert one_change.total_time == approx(2500 + one_change.pit_time + tyre_time)
+
+
+def test_simulate_strategy_ranked_by_total_time():
+    plans, evaluated = simulate_strategy(create_setup(laps=25), max_plans=3)
+    assert evaluated >= len(plans) > 0
+    times = [plan.total_time for plan in plans]
+    assert times == sorted(times)
+    assert plans[0].stops == 2
+
+
+def test_laps_lost():
+    setup = create_setup(race_seconds=2950.0)
+    assert laps_lost(setup, 0) == 0
+    assert laps_lost(setup, 40) == 0
+    assert laps_lost(setup, 60) == 1
+    assert laps_lost(setup, 160) == 2
+
+
+def test_simulate_strategy_time_type_race():
+    # 30 full laps if no time is lost, 2 stops lose 1 lap
+    setup = create_setup(race_seconds=2950.0)
+    plans, _ = simulate_strategy(setup, max_plans=5)
+    assert plans
+    best = plans[0]
+    assert sum(best.stint_laps) == approx(29)
+    for plan in plans:
+        laps = sum(plan.stint_laps)
+        assert laps_lost(setup, plan.total_time - laps * setup.laptime) == 30 - laps
+    # Plans with more completed laps are ranked first
+    completed = [round(sum(plan.stint_laps), 6) for plan in plans]
+    assert completed == sorted(completed, reverse=True)
@@ -0,0 +1,97 @@
+from pytest import approx
+
+from validadorers import calculation as calc
+from validadorers.timing_loop import TimingLoop
+
+
+def drive(timing_loop, index, slot_id, speed, start_time, end_time, start_distance=0.0, step=0.1):
+    """Drive vehicle at constant speed, update every step seconds"""
+    samples = round((end_time - start_time) / step)
+    for sample in range(samples + 1):
+        elapsed_time = start_time + sample * step
+        distance = start_distance + (elapsed_time - start_time) * speed
+        timing_loop.update(index, slot_id, distance, elapsed_time)
+
+
+def test_resize_markers():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1025.0)
+    assert timing_loop.markers == 21
+    timing_loop.resize(0.0)
+    assert timing_loop.markers == 2
+
+
+def test_gap_between_vehicles():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    # Same speed, vehicle 1 starts 2 seconds later
+    drive(timing_loop, 0, 10, 50.0, 0.0, 30.0)
+    drive(timing_loop, 1, 11, 50.0, 2.0, 30.0)
+    assert timing_loop.gap(0, 1) == approx(2.0)
+    assert timing_loop.relative_gap(0, 1) == approx(2.0)
+    assert timing_loop.relative_gap(1, 0) == approx(-2.0)
+
+
+def test_gap_unavailable():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    drive(timing_loop, 0, 10, 50.0, 0.0, 5.0)
+    assert timing_loop.gap(0, 1) == -1
+    assert timing_loop.relative_gap(0, 1) is None
+
+
+def test_gap_after_lapped():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    # Ahead vehicle passed same marker over a lap ago, ring slot is overwritten
+    drive(timing_loop, 0, 10, 100.0, 0.0, 30.0)
+    drive(timing_loop, 1, 11, 10.0, 0.0, 30.0)
+    assert timing_loop.gap(0, 1) == -1
+
+
+def test_small_backward_movement_keeps_records():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    drive(timing_loop, 0, 10, 50.0, 0.0, 20.0)
+    drive(timing_loop, 1, 11, 50.0, 1.0, 20.0)
+    # Distance briefly runs backwards at finish line
+    timing_loop.update(1, 11, 945.0, 20.1)
+    assert timing_loop.gap(0, 1) == approx(1.0)
+    drive(timing_loop, 1, 11, 50.0, 20.2, 21.0, start_distance=955.0)
+    assert timing_loop.gap(0, 1) == approx(1.0)
+
+
+def test_large_backward_movement_resets():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    drive(timing_loop, 0, 10, 50.0, 0.0, 20.0)
+    drive(timing_loop, 1, 11, 50.0, 1.0, 20.0)
+    # Reset to pit
+    timing_loop.update(1, 11, 500.0, 20.1)
+    assert timing_loop.gap(0, 1) == -1
+
+
+def test_slot_change_resets():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    drive(timing_loop, 0, 10, 50.0, 0.0, 20.0)
+    drive(timing_loop, 1, 11, 50.0, 1.0, 20.0)
+    timing_loop.update(1, 12, 960.0, 20.1)
+    assert timing_loop.gap(0, 1) == -1
+
+
+def test_finish_line_desync_corrected():
+    timing_loop = TimingLoop(spacing=50.0, max_vehicles=2)
+    timing_loop.resize(1000.0)
+    drive(timing_loop, 0, 10, 50.0, 0.0, 21.0)
+    drive(timing_loop, 1, 11, 50.0, 1.0, 20.9)
+    # Completed laps increased, lap distance not yet reset
+    lap_distance = calc.lap_distance_correction(995.0, 1000.0, 0.05)
+    assert lap_distance == 0
+    timing_loop.update(1, 11, 1 * 1000.0 + lap_distance, 21.0)
+    assert timing_loop.gap(0, 1) == approx(1.0)
+    drive(timing_loop, 1, 11, 50.0, 21.1, 22.0, start_distance=1005.0)
+    assert timing_loop.gap(0, 1) == approx(1.0)
+    # Distance kept if lap time not near start
+    assert calc.lap_distance_correction(995.0, 1000.0, 20.0) == 995.0
+    assert calc.lap_distance_correction(5.0, 1000.0, 0.05) == 5.0
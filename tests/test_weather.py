@@ -0,0 +1,121 @@
+from pytest import approx
+
+from validadorers.adapter.rf2_restapi import COMMON_WEATHERFORECAST, RestAPIData
+from validadorers.const_common import ABS_ZERO_CELSIUS
+from validadorers.process.weather import (
+    FORECAST_DEFAULT,
+    FORECAST_NODES_RF2,
+    MAX_TIMELINE_SAMPLES,
+    TIMELINE_STEP,
+    ForecastParser,
+    WeatherNode,
+    WeatherTimeline,
+)
+
+SESSION_LENGTH = 3600.0
+
+
+def create_nodes(*values):
+    """Create forecast nodes from (sky_type, temperature, rain_chance) values"""
+    return tuple(
+        WeatherNode(round(index * 0.2, 1), sky_type, temperature, rain_chance)
+        for index, (sky_type, temperature, rain_chance) in enumerate(values)
+    )
+
+
+def create_rest_forecast(*values):
+    """Create REST forecast data from (sky_type, temperature, rain_chance) values"""
+    return {
+        node: {
+            "WNV_SKY": {"currentValue": sky_type},
+            "WNV_TEMPERATURE": {"currentValue": temperature},
+            "WNV_RAIN_CHANCE": {"currentValue": rain_chance},
+        }
+        for node, (sky_type, temperature, rain_chance) in zip(FORECAST_NODES_RF2, values)
+    }
+
+
+NODES = create_nodes((0, 20, 0), (1, 22, 0), (2, 24, 20), (4, 20, 40), (4, 18, 0))
+
+
+def test_interpolation():
+    timeline = WeatherTimeline(NODES)
+    # Start of node
+    forecast = timeline.at_time(0, SESSION_LENGTH)
+    assert forecast.temperature == approx(20)
+    assert forecast.sky_type == 0
+    # Halfway between node 2 (40%) & node 3 (60%)
+    forecast = timeline.at_time(0.5 * SESSION_LENGTH, SESSION_LENGTH)
+    assert forecast.start_percent == approx(0.5)
+    assert forecast.temperature == approx(22)
+    assert forecast.rain_chance == approx(30)
+    # Sky type corrected by interpolated rain chance
+    assert forecast.sky_type == 8
+    # Last node is held until end of session
+    forecast = timeline.at_time(SESSION_LENGTH, SESSION_LENGTH)
+    assert forecast.temperature == approx(18)
+    assert forecast.rain_chance == 0
+
+
+def test_time_clamped():
+    timeline = WeatherTimeline(NODES)
+    assert timeline.at_time(-100, SESSION_LENGTH) == timeline.at_time(0, SESSION_LENGTH)
+    assert timeline.at_time(SESSION_LENGTH * 2, SESSION_LENGTH).temperature == approx(18)
+
+
+def test_node_at():
+    timeline = WeatherTimeline(NODES)
+    assert timeline.node_at(0, SESSION_LENGTH) == 0
+    assert timeline.node_at(0.2 * SESSION_LENGTH - 60, SESSION_LENGTH) == 0
+    assert timeline.node_at(0.2 * SESSION_LENGTH, SESSION_LENGTH) == 1
+    assert timeline.node_at(0.9 * SESSION_LENGTH, SESSION_LENGTH) == 4
+
+
+def test_node_minutes():
+    timeline = WeatherTimeline(NODES)
+    assert timeline.node_minutes(600, SESSION_LENGTH) == (-10, 2, 14, 26, 38)
+
+
+def test_samples_sized_to_session_length():
+    timeline = WeatherTimeline(NODES)
+    timeline.at_time(0, SESSION_LENGTH)
+    assert timeline.step == approx(TIMELINE_STEP)
+    assert len(timeline.temperature) == SESSION_LENGTH / TIMELINE_STEP + 1
+    # Recompile on session length change, step increases for very long session
+    timeline.at_time(0, 48 * 3600)
+    assert len(timeline.temperature) == MAX_TIMELINE_SAMPLES + 1
+    assert timeline.step == approx(48 * 3600 / MAX_TIMELINE_SAMPLES)
+    assert timeline.at_time(24 * 3600, 48 * 3600).rain_chance == approx(30)
+
+
+def test_forecast_not_available():
+    timeline = WeatherTimeline(FORECAST_DEFAULT)
+    forecast = timeline.at_time(600, SESSION_LENGTH)
+    assert forecast.sky_type == -1
+    assert forecast.temperature == ABS_ZERO_CELSIUS
+    assert forecast.rain_chance == -1
+    assert timeline.node_at(600, SESSION_LENGTH) == -1
+
+
+def test_parser_recompiles_only_on_change():
+    parser = ForecastParser()
+    values = ((0, 20, 0), (1, 22, 0), (2, 24, 20), (4, 20, 40), (4, 18, 0))
+    timeline = parser(create_rest_forecast(*values))
+    assert timeline.nodes == NODES
+    # Same data, same compiled timeline
+    assert parser(create_rest_forecast(*values)) is timeline
+    # Changed data, recompiled
+    changed = parser(create_rest_forecast(*values[:4], (4, 16, 0)))
+    assert changed is not timeline
+    assert changed.at_time(SESSION_LENGTH, SESSION_LENGTH).temperature == approx(16)
+    # Invalid data
+    assert parser({}).nodes == FORECAST_DEFAULT
+
+
+def test_rest_output_update():
+    dataset = RestAPIData()
+    data = {"RACE": create_rest_forecast((0, 20, 0), (1, 22, 0), (2, 24, 20), (4, 20, 40), (4, 18, 0))}
+    for res in COMMON_WEATHERFORECAST:
+        res.update(dataset, data)
+    assert dataset.forecastRace.nodes == NODES
+    assert dataset.forecastPractice.nodes == FORECAST_DEFAULT
@@ -6,15 +6,24 @@ import json
 import logging
 import threading
 from itertools import chain
-from typing import Any
+from time import monotonic
+from typing import Any, Callable
 
-from ..async_request import http_get, set_header_get
+from ..async_loop import async_loop
+from ..async_request import set_header_get
 from ..const_common import TYPE_JSON
+from ..shared_request import shared_request
 from .rf2_restapi import HttpSetup, ResRawOutput, RestAPIData, select_taskset
 
 logger = logging.getLogger(__name__)
 json_decoder = json.JSONDecoder()
 
+TRIGGER_CHECK_INTERVAL = 0.1  # seconds
+PIT_APPROACH_DISTANCE = 500.0  # meters before pit entry position
+MAX_UPDATE_INTERVAL = 5.0  # seconds, max update interval without polling trigger
+RESPONSE_TTL = 1.0  # seconds, reuse response for one time update after tasks restarted
+TASK_GROUP = "restapi"  # task group name on persistent event loop
+
 
 class RestAPIInfo:
     """Rest API data output"""
@@ -24,10 +33,11 @@ class RestAPIInfo:
         "_cfg",
         "_task_cancel",
         "_updating",
-        "_update_thread",
+        "_update_task",
         "_active_interval",
         "_event",
         "_dataset",
+        "_pit_entry",
     )
 
     def __init__(self, parent_api):
@@ -36,11 +46,12 @@ class RestAPIInfo:
 
         self._task_cancel = False
         self._updating = False
-        self._update_thread = None
+        self._update_task = None
         self._active_interval = 0.2
         self._event = threading.Event()
 
         self._dataset = RestAPIData()
+        self._pit_entry = 0.0
 
     @property
     def telemetry(self) -> RestAPIData:
@@ -55,51 +66,61 @@ class RestAPIInfo:
         self._cfg = config
         self._active_interval = max(self._cfg["restapi_update_interval"], 100) / 1000
 
+    def setPitEntry(self, position: float):
+        """Set pit entry position (meters) for pit polling trigger"""
+        self._pit_entry = position
+
+    def pitEntry(self) -> float:
+        """Pit entry position (meters)"""
+        return self._pit_entry
+
     def start(self):
-        """Start update thread"""
+        """Start update task on persistent event loop"""
         if not self._updating and self._cfg["enable_restapi_access"]:
             self._updating = True
             self._event.clear()
-            self._update_thread = threading.Thread(target=self.__update, daemon=True)
-            self._update_thread.start()
-            logger.info("RestAPI: UPDATING: thread started")
+            self._update_task = async_loop.submit(self.__update(), TASK_GROUP)
+            logger.info("RestAPI: UPDATING: task started")
 
     def stop(self):
-        """Stop update thread"""
+        """Stop update task, blocks until all tasks cancelled"""
         if self._updating:
             self._event.set()
-            if self._update_thread is not None:
-                self._update_thread.join()
+            if self._update_task is not None:
+                async_loop.cancel(TASK_GROUP)
+                self._update_task = None
             self._updating = False
-            logger.info("RestAPI: UPDATING: thread stopped")
+            logger.info("RestAPI: UPDATING: task stopped")
 
-    def __update(self):
+    async def __update(self):
         """Update Rest API data"""
-        _event_wait = self._event.wait
+        _event_is_set = self._event.is_set
         reset = False
         update_interval = 0.5
 
         active_task_sim = {}
 
-        while not _event_wait(update_interval):
-            if self._parent_api.isActive:
-
-                # Also check task cancel state in case delay
-                if not reset or self._task_cancel:
-                    reset = True
-                    update_interval = self._active_interval
-                    self._task_cancel = False
-                    self.run_tasks(self._parent_api.identifier, active_task_sim)
-
-            else:
-                if reset:
-                    reset = False
-                    update_interval = 0.5
-
-        # Reset to default on close
-        reset_to_default(self._dataset, active_task_sim)
-
-    def run_tasks(self, sim_name: str, active_task_sim: dict):
+        try:
+            while not _event_is_set():
+                await asyncio.sleep(update_interval)
+                if self._parent_api.isActive:
+
+                    # Also check task cancel state in case delay
+                    if not reset or self._task_cancel:
+                        reset = True
+                        update_interval = self._active_interval
+                        self._task_cancel = False
+                        await self.run_tasks(self._parent_api.identifier, active_task_sim)
+
+                else:
+                    if reset:
+                        reset = False
+                        update_interval = 0.5
+        finally:
+            # Reset to default on close
+            reset_to_default(self._dataset, active_task_sim)
+
+    async def run_tasks(self, sim_name: str, active_task_sim: dict):
         """Run tasks"""
         if not sim_name:
             logger.info("RestAPI: game session not found")
@@ -113,12 +134,10 @@ class RestAPIInfo:
             retry=min(max(int(self._cfg["connection_retry"]), 0), 10),
             retry_delay=min(max(self._cfg["connection_retry_delay"], 0), 60),
         )
-        # Run all tasks while on track, this blocks until tasks cancelled
+        # Run all tasks while on track, until tasks cancelled
         logger.info("RestAPI: all tasks started")
-        asyncio.run(
-            self.task_init(
-                self.sort_taskset(sim_http, active_task_sim, select_taskset(sim_name)),
-            )
+        await self.task_init(
+            self.sort_taskset(sim_http, active_task_sim, select_taskset(sim_name)),
         )
         logger.info("RestAPI: all tasks stopped")
         # Reset when finished
@@ -126,25 +145,44 @@ class RestAPIInfo:
 
     def sort_taskset(self, http: HttpSetup, active_task: dict, taskset: tuple):
         """Sort task set into dictionary, key - uri_path, value - output_set"""
-        for uri_path, output_set, condition, is_repeat, min_interval in taskset:
+        event_polling = self._cfg.get("enable_restapi_event_polling", True)
+        for uri_path, output_set, condition, is_repeat, min_interval, trigger, max_interval in taskset:
             if self._cfg.get(condition, True):
                 active_task[uri_path] = output_set
                 update_interval = max(min_interval, self._active_interval)
+                if event_polling:
+                    poll_trigger = self.create_trigger(trigger)
+                else:
+                    poll_trigger = None
+                # Extended backoff only while polling trigger is active
+                if poll_trigger is None:
+                    max_interval = MAX_UPDATE_INTERVAL
                 yield asyncio.create_task(
-                    self.fetch(http, uri_path, output_set, is_repeat, update_interval)
+                    self.fetch(
+                        http, uri_path, output_set, is_repeat, update_interval,
+                        max(max_interval, update_interval), poll_trigger,
+                    )
                 )
 
+    def create_trigger(self, name: str) -> Callable[[], bool] | None:
+        """Create polling trigger"""
+        if name == "pit":
+            return PitTrigger(self._parent_api, self.pitEntry)
+        if name == "lap":
+            return LapTrigger(self._parent_api)
+        return None
+
     async def task_init(self, *task_generator):
         """Run repeatedly updating task"""
         task_group = tuple(chain(*task_generator))
-        # Task control
-        await asyncio.create_task(self.task_control(task_group))
-        # Start task
-        for task in task_group:
-            try:
-                await task
-            except (asyncio.CancelledError, BaseException):
-                pass
+        try:
+            # Task control
+            await self.task_control(task_group)
+        finally:
+            # Cancel & wait all tasks, also if update task cancelled on stop
+            for task in task_group:
+                task.cancel()
+            await asyncio.gather(*task_group, return_exceptions=True)
 
     async def task_control(self, task_group: tuple[asyncio.Task, ...]):
         """Control task running state"""
@@ -159,7 +197,8 @@ class RestAPIInfo:
 
     async def fetch(
         self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...],
-        repeat: bool = False, min_interval: float = 0.01):
+        repeat: bool = False, min_interval: float = 0.01, max_interval: float = MAX_UPDATE_INTERVAL,
+        trigger: Callable[[], bool] | None = None):
         """Fetch data and verify"""
         data_available = await self.update_once(http, uri_path, output_set)
         if not data_available:
@@ -168,7 +207,7 @@ class RestAPIInfo:
             logger.info("RestAPI: ACTIVE: %s (one time)", uri_path)
         else:
             logger.info("RestAPI: ACTIVE: %s (%sms)", uri_path, int(min_interval * 1000))
-            await self.update_repeat(http, uri_path, output_set, min_interval)
+            await self.update_repeat(http, uri_path, output_set, min_interval, max_interval, trigger)
 
     async def update_once(
         self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...]) -> bool:
@@ -177,7 +216,7 @@ class RestAPIInfo:
         data_available = False
         total_retry = retry = http.retry
         while not self._task_cancel and retry >= 0:
-            resource_output = await get_resource(request_header, http)
+            resource_output = await get_resource(request_header, http, RESPONSE_TTL)
             # Verify & retry
             if not isinstance(resource_output, TYPE_JSON):
                 logger.info("RestAPI: %s: %s (%s/%s retries left)",
@@ -196,8 +235,13 @@ class RestAPIInfo:
         return data_available
 
     async def update_repeat(
-        self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...], min_interval: float):
-        """Update repeat"""
+        self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...],
+        min_interval: float, max_interval: float = MAX_UPDATE_INTERVAL, trigger: Callable[[], bool] | None = None):
+        """Update repeat
+
+        Update interval increases up to max interval while no new data,
+        or stays at min interval while polling trigger is active.
+        """
         request_header = set_header_get(uri_path, http.host)
         interval = min_interval
         last_hash = new_hash = -1
@@ -206,11 +250,71 @@ class RestAPIInfo:
             if last_hash != new_hash:
                 last_hash = new_hash
                 interval = min_interval
-            elif interval < 5:  # increase update interval while no new data
+            elif interval < max_interval:  # increase update interval while no new data
                 interval += interval / 2
-                if interval > 5:
-                    interval = 5
-            await asyncio.sleep(interval)
+                if interval > max_interval:
+                    interval = max_interval
+            if trigger is None:
+                await asyncio.sleep(interval)
+            else:
+                await self.wait_trigger(trigger, min_interval, interval)
+
+    async def wait_trigger(self, trigger: Callable[[], bool], min_interval: float, interval: float):
+        """Wait for next update, cut short to min interval once polling trigger is active"""
+        check_interval = min(min_interval, TRIGGER_CHECK_INTERVAL)
+        start_time = monotonic()
+        while not self._task_cancel:
+            elapsed = monotonic() - start_time
+            if elapsed >= interval or (elapsed >= min_interval and trigger()):
+                return
+            await asyncio.sleep(check_interval)
+
+
+class PitTrigger:
+    """Polling trigger, active while pit requested, in pit lane, or approaching pit entry"""
+
+    __slots__ = (
+        "_shmm",
+        "_pit_entry",
+    )
+
+    def __init__(self, shmm, pit_entry: Callable[[], float]):
+        self._shmm = shmm
+        self._pit_entry = pit_entry
+
+    def __call__(self) -> bool:
+        veh_scor = self._shmm.rf2ScorVeh()
+        if veh_scor.mPitState or veh_scor.mInPits:
+            return True
+        pit_entry = self._pit_entry()
+        track_length = self._shmm.rf2ScorInfo.mLapDist
+        if pit_entry <= 0 or not track_length > 0:
+            return False
+        return (pit_entry - veh_scor.mLapDist) % track_length < PIT_APPROACH_DISTANCE
+
+
+class LapTrigger:
+    """Polling trigger, active once (rising edge) after any vehicle completed a lap"""
+
+    __slots__ = (
+        "_shmm",
+        "_last_laps",
+    )
+
+    def __init__(self, shmm):
+        self._shmm = shmm
+        self._last_laps = -1
+
+    def __call__(self) -> bool:
+        rf2_scor_veh = self._shmm.rf2ScorVeh
+        laps = sum(
+            rf2_scor_veh(index).mTotalLaps
+            for index in range(self._shmm.rf2ScorInfo.mNumVehicles)
+        )
+        if self._last_laps != laps:
+            self._last_laps = laps
+            return True
+        return False
 
 
 def reset_to_default(dataset: RestAPIData, active_task: dict[str, tuple[ResRawOutput, ...]]):
@@ -223,27 +327,27 @@ def reset_to_default(dataset: RestAPIData, active_task: dict[str, tuple[ResRawOu
         active_task.clear()
 
 
-async def get_resource(request: bytes, http: HttpSetup) -> Any | str:
+async def get_resource(request: bytes, http: HttpSetup, ttl: float = 0.0) -> Any | str:
     """Get resource from REST API"""
+    raw_bytes = await shared_request.get(request, http.host, http.port, http.timeout, ttl=ttl)
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            return json_decoder.decode(raw_bytes.decode())
-    except (AttributeError, TypeError, IndexError, KeyError, ValueError,
-            OSError, TimeoutError, BaseException):
+        return json_decoder.decode(raw_bytes.decode())
+    except (AttributeError, TypeError, IndexError, KeyError, ValueError):
         return "INVALID"
 
 
 async def output_resource(
     dataset: RestAPIData, request: bytes, http: HttpSetup, output_set: tuple[ResRawOutput, ...], last_hash: int) -> int:
     """Get resource from REST API and output data, skip unnecessary checking"""
+    raw_bytes = await shared_request.get(request, http.host, http.port, http.timeout)
+    if not raw_bytes:
+        return last_hash
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            new_hash = hash(raw_bytes)
-            if last_hash != new_hash:
-                resource_output = json_decoder.decode(raw_bytes.decode())
-                for res in output_set:
-                    res.update(dataset, resource_output)
-            return new_hash
-    except (AttributeError, TypeError, IndexError, KeyError, ValueError,
-            OSError, TimeoutError, BaseException):
+        new_hash = hash(raw_bytes)
+        if last_hash != new_hash:
+            resource_output = json_decoder.decode(raw_bytes.decode())
+            for res in output_set:
+                res.update(dataset, resource_output)
+        return new_hash
+    except (AttributeError, TypeError, IndexError, KeyError, ValueError):
         return last_hash
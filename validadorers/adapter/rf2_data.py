@@ -10,9 +10,10 @@ from ..calculation import (
     slip_angle,
     vel2speed,
 )
-from ..const_common import MAX_SECONDS, STINT_USAGE_DEFAULT
+from ..const_common import MAX_SECONDS, STINT_USAGE_DEFAULT, WHEELS_NA
 from ..formatter import strip_invalid_char
-from ..process.weather import WeatherNode
+from ..process.pitstop import PitServiceTime
+from ..process.weather import WeatherNode, WeatherTimeline
 from ..validator import bytes_to_str as tostr
 from ..validator import infnan_to_zero as rmnan
 from . import restapi_connector, rf2_connector
@@ -90,8 +91,11 @@ class Brake(DataAdapter):
         )
 
     def wear(self, index: int | None = None) -> tuple[float, ...]:
-        """Brake remaining thickness (meters)"""
-        return self.rest.telemetry.brakeWear
+        """Brake remaining thickness (meters), -1 if not available"""
+        # Only available for player via REST API
+        if self.shmm.rf2ScorVeh(index).mIsPlayer:
+            return self.rest.telemetry.brakeWear
+        return WHEELS_NA
 
 
 class ElectricMotor(DataAdapter):
@@ -412,6 +416,10 @@ class Session(DataAdapter):
 
     def weather_forecast(self) -> tuple[WeatherNode, ...]:
         """Weather forecast nodes"""
+        return self.weather_timeline().nodes
+
+    def weather_timeline(self) -> WeatherTimeline:
+        """Weather forecast timeline, compiled once per forecast change"""
         session_type = self.shmm.rf2ScorInfo.mSession
         if session_type <= 1:  # practice session
             return self.rest.telemetry.forecastPractice
@@ -768,6 +776,10 @@ class Vehicle(DataAdapter):
         """Pit stop estimate data, 0 min_pitstop_time, 1 max_pitstop_time, 2 refill_fuel, 3 refill_energy, 4 state_stopgo"""
         return self.rest.telemetry.pitStopEstimate
 
+    def pit_service_time(self, index: int | None = None) -> PitServiceTime:
+        """Pit service reference time, 0 fuel_base, 1 fuel_fill_rate, 2 fuel_concurrent, 3 energy_base, 4 energy_fill_rate, 5 energy_concurrent, 6 tyre_change, 7 tyre_concurrent"""
+        return self.rest.telemetry.pitServiceTime
+
     def stint_usage(self, driver_name: str) -> tuple[float, float, float, float, int]:
         """Stint usage data"""
         return self.rest.telemetry.stintUsage.get(driver_name, STINT_USAGE_DEFAULT)
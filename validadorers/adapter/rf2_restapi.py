@@ -5,14 +5,19 @@ from __future__ import annotations
 from typing import Any, Callable, Mapping, NamedTuple
 
 from ..const_common import EMPTY_DICT, PITEST_DEFAULT, WHEELS_NA
-from ..process.pitstop import EstimatePitTime
+from ..process.pitstop import (
+    SERVICE_TIME_DEFAULT,
+    EstimatePitTime,
+    PitServiceTime,
+    parse_service_time,
+)
 from ..process.vehicle import (
     expected_usage,
     export_wheels,
     steerlock_to_number,
     stint_ve_usage,
 )
-from ..process.weather import FORECAST_DEFAULT, WeatherNode, forecast_rf2
+from ..process.weather import TIMELINE_DEFAULT, ForecastParser, WeatherTimeline
 
 
 class RestAPIData:
@@ -36,6 +41,7 @@ class RestAPIData:
         "suspensionDamage",
         "stintUsage",
         "pitStopEstimate",
+        "pitServiceTime",
     )
 
     def __init__(self):
@@ -49,13 +55,14 @@ class RestAPIData:
         self.expectedVirtualEnergyConsumption: float = 0.0
         self.aeroDamage: float = -1.0
         self.penaltyTime: float = 0.0
-        self.forecastPractice: tuple[WeatherNode, ...] = FORECAST_DEFAULT
-        self.forecastQualify: tuple[WeatherNode, ...] = FORECAST_DEFAULT
-        self.forecastRace: tuple[WeatherNode, ...] = FORECAST_DEFAULT
+        self.forecastPractice: WeatherTimeline = TIMELINE_DEFAULT
+        self.forecastQualify: WeatherTimeline = TIMELINE_DEFAULT
+        self.forecastRace: WeatherTimeline = TIMELINE_DEFAULT
         self.brakeWear: tuple[float, float, float, float] = WHEELS_NA
         self.suspensionDamage: tuple[float, float, float, float] = WHEELS_NA
         self.stintUsage: Mapping[str, tuple[float, float, float, float, int]] = EMPTY_DICT
         self.pitStopEstimate: tuple[float, float, float, float, int] = PITEST_DEFAULT
+        self.pitServiceTime: PitServiceTime = SERVICE_TIME_DEFAULT
 
 
 class HttpSetup(NamedTuple):
@@ -129,9 +136,9 @@ EMPTY_KEYS: tuple[str, ...] = tuple()
 
 # Common
 COMMON_WEATHERFORECAST = (
-    ResParOutput("forecastPractice", FORECAST_DEFAULT, forecast_rf2, ("PRACTICE",)),
-    ResParOutput("forecastQualify", FORECAST_DEFAULT, forecast_rf2, ("QUALIFY",)),
-    ResParOutput("forecastRace", FORECAST_DEFAULT, forecast_rf2, ("RACE",)),
+    ResParOutput("forecastPractice", TIMELINE_DEFAULT, ForecastParser(), ("PRACTICE",)),
+    ResParOutput("forecastQualify", TIMELINE_DEFAULT, ForecastParser(), ("QUALIFY",)),
+    ResParOutput("forecastRace", TIMELINE_DEFAULT, ForecastParser(), ("RACE",)),
 )
 # RF2
 RF2_TIMESCALE = (
@@ -152,6 +159,7 @@ LMU_CURRENTSTINT = (
     ResParOutput("suspensionDamage", WHEELS_NA, export_wheels, ("wearables", "suspension")),
     ResRawOutput("trackClockTime", -1.0, ("sessionTime", "timeOfDay")),
     ResParOutput("pitStopEstimate", PITEST_DEFAULT, EstimatePitTime(), EMPTY_KEYS),
+    ResParOutput("pitServiceTime", SERVICE_TIME_DEFAULT, parse_service_time, ("pitStopTimes", "times")),
 )
 LMU_GARAGESETUP = (
     ResParOutput("steeringWheelRange", 0.0, steerlock_to_number, ("VM_STEER_LOCK", "stringValue")),
@@ -170,20 +178,21 @@ LMU_STINTUSAGE = (
 )
 
 # Define task set
-# 0 - uri path, 1 - output set, 2 - enabling condition, 3 is repeating task, 4 minimum update interval
+# 0 - uri path, 1 - output set, 2 - enabling condition, 3 is repeating task, 4 minimum update interval,
+# 5 - polling trigger (telemetry event for rapid polling), 6 - max update interval while no new data
 TASKSET_RF2 = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1),
-    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, "enable_session_info", False, 0.1),
-    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, "enable_session_info", False, 0.1),
-    ("/rest/garage/fuel", RF2_GARAGESETUP, "enable_garage_setup_info", False, 0.1),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1, "", 5.0),
+    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, "enable_session_info", False, 0.1, "", 5.0),
+    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, "enable_session_info", False, 0.1, "", 5.0),
+    ("/rest/garage/fuel", RF2_GARAGESETUP, "enable_garage_setup_info", False, 0.1, "", 5.0),
 )
 TASKSET_LMU = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1),
-    ("/rest/sessions", LMU_SESSIONSINFO, "enable_session_info", False, 0.1),
-    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, "enable_garage_setup_info", False, 0.1),
-    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, "enable_vehicle_info", True, 0.2),
-    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, "enable_vehicle_info", True, 1.0),
-    ("/rest/strategy/usage", LMU_STINTUSAGE, "enable_energy_remaining", True, 1.0),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1, "", 5.0),
+    ("/rest/sessions", LMU_SESSIONSINFO, "enable_session_info", False, 0.1, "", 5.0),
+    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, "enable_garage_setup_info", False, 0.1, "", 5.0),
+    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, "enable_vehicle_info", True, 0.2, "pit", 5.0),
+    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, "enable_vehicle_info", True, 0.5, "pit", 10.0),
+    ("/rest/strategy/usage", LMU_STINTUSAGE, "enable_energy_remaining", True, 1.0, "lap", 30.0),
 )
 
 
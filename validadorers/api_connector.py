@@ -70,6 +70,10 @@ class Connector(ABC):
     def setup(self, config: dict):
         """Setup API parameters"""
 
+    @abstractmethod
+    def set_pit_entry(self, position: float):
+        """Set pit entry position"""
+
 
 class SimRF2(Connector):
     """rFactor 2 - Racing Simulator
@@ -109,6 +113,9 @@ class SimRF2(Connector):
         self.restapi.setConnection(config.copy())
         rf2_data.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
 
+    def set_pit_entry(self, position: float):
+        self.restapi.setPitEntry(position)
+
 
 class SimLMU(Connector):
     """Le Mans Ultimate - Official WEC Simulator
@@ -151,6 +158,9 @@ class SimLMU(Connector):
         self.restapi.setConnection(config.copy())
         rf2_data.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
 
+    def set_pit_entry(self, position: float):
+        self.restapi.setPitEntry(position)
+
 
 # API Pack - Order matters: LMU takes priority as primary simulator
 API_PACK = (
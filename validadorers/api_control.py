@@ -91,6 +91,10 @@ class APIControl:
         """Setup & apply API changes"""
         self._api.setup(cfg.telemetry_api)
 
+    def set_pit_entry(self, position: float):
+        """Set pit entry position (meters), used by REST API pit polling trigger"""
+        self._api.set_pit_entry(position)
+
     @property
     def name(self) -> str:
         """API name output"""
@@ -0,0 +1,145 @@
+
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from contextvars import ContextVar
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine
+
+logger = logging.getLogger(__name__)
+
+# Group name of running task, inherited by tasks created from it
+_task_group: ContextVar[str | None] = ContextVar("task_group", default=None)
+
+
+class AsyncLoop:
+    """Persistent asyncio event loop
+
+    Event loop runs in a daemon thread for whole APP lifetime, network tasks
+    (REST API, update checker, data server) are scheduled onto same loop,
+    instead of creating & closing a new loop per session.
+
+    Tasks can be submitted under group name, all tasks of a group can be
+    cancelled together, such as on session change or API restart. Tasks created
+    inside a group task can be added to same group with add_task().
+    """
+
+    __slots__ = (
+        "_loop",
+        "_thread",
+        "_lock",
+        "_groups",
+    )
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._groups: dict[str, set[asyncio.Task]] = {}
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start event loop thread if not running"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self.__run, args=(self._loop,), name="AsyncLoop", daemon=True)
+                self._thread.start()
+                logger.info("AsyncLoop: event loop started")
+            return self._loop
+
+    def stop(self, timeout: float = 5):
+        """Cancel all tasks & stop event loop thread"""
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+        thread.join(timeout)
+        logger.info("AsyncLoop: event loop stopped")
+
+    def submit(self, coro: Coroutine, group: str = "") -> Future:
+        """Schedule coroutine onto event loop, thread-safe
+
+        Args:
+            coro: coroutine to run.
+            group: task group name, for group cancellation.
+
+        Returns:
+            Concurrent future of coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(self._track(coro, group), self.start())
+
+    def run(self, coro: Coroutine, timeout: float | None = None) -> Any:
+        """Run coroutine on event loop & block until finished
+
+        Should not be called from event loop thread.
+        """
+        return self.submit(coro).result(timeout)
+
+    def cancel(self, group: str, timeout: float = 5):
+        """Cancel all tasks of group & block until tasks finished cleanup
+
+        Should not be called from event loop thread.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_group(group), loop).result(timeout)
+        except FutureTimeoutError:
+            logger.warning("AsyncLoop: timeout while cancelling tasks (%s)", group)
+
+    def add_task(self, task: asyncio.Task):
+        """Add task to group of current running task, for group cancellation
+
+        Should be called from event loop thread, ignored if not in group task.
+        """
+        group = _task_group.get()
+        if group is None:
+            return
+        tasks = self._groups.setdefault(group, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    def __run(self, loop: asyncio.AbstractEventLoop):
+        """Run event loop until stopped"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _track(self, coro: Coroutine, group: str) -> Any:
+        """Run coroutine as task of group"""
+        task = asyncio.current_task()
+        tasks = self._groups.setdefault(group, set())
+        tasks.add(task)
+        _task_group.set(group)
+        try:
+            return await coro
+        finally:
+            tasks.discard(task)
+
+    async def _cancel_group(self, group: str):
+        """Cancel tasks of group & wait until finished"""
+        tasks = tuple(self._groups.get(group, ()))
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _shutdown(self):
+        """Cancel tasks of all groups & stop loop"""
+        for group in tuple(self._groups):
+            await self._cancel_group(group)
+        asyncio.get_running_loop().stop()
+
+
+async_loop = AsyncLoop()
@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 from asyncio import StreamReader, open_connection, wait_for
+from base64 import b64encode
 from contextlib import asynccontextmanager
+from hashlib import sha1
 from time import perf_counter
 from typing import Awaitable
 
 # Default limit from asyncio.open_connection is 2 ** 16
 # Lower limit to avoid getting incomplete data
 BUFFER_LIMIT = 32768  # 2 ** 15
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WEBSOCKET_TEXT = 0x1
+WEBSOCKET_CLOSE = 0x8
+WEBSOCKET_PING = 0x9
+WEBSOCKET_PONG = 0xA
 
 
 def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> bytes:
@@ -18,6 +25,70 @@ def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> by
     return f"GET {uri} HTTP/1.1\r\nHost: {host}{extra_headers}\r\n\r\n".encode()
 
 
+def set_response_header(
+    status: str = "200 OK", content_type: str = "application/json", length: int = 0, *headers: str) -> bytes:
+    """Set response header"""
+    extra_headers = "\r\n".join(headers) + "\r\n" if headers else ""
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {length}\r\n{extra_headers}Connection: close\r\n\r\n"
+    ).encode()
+
+
+async def parse_request(reader: StreamReader) -> tuple[str, dict[str, str]]:
+    """Parse request, returns request path & headers (lower case name)"""
+    header_bytes = await reader.readuntil(b"\r\n\r\n")
+    lines = header_bytes.decode("latin-1").split("\r\n")
+    request = lines[0].split(" ")
+    if len(request) < 3 or request[0] != "GET":
+        return "", {}
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return request[1], headers
+
+
+def set_websocket_accept(key: str) -> bytes:
+    """Set websocket handshake response header"""
+    accept = b64encode(sha1(key.encode() + WEBSOCKET_GUID).digest()).decode()
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+        f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode()
+
+
+def websocket_frame(payload: bytes, opcode: int = WEBSOCKET_TEXT) -> bytes:
+    """Encode server websocket frame (final, unmasked)"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, length))
+    elif length < 65536:
+        header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+    return header + payload
+
+
+async def read_websocket_frame(reader: StreamReader) -> tuple[int, bytes]:
+    """Read client websocket frame, returns opcode & unmasked payload"""
+    head = await reader.readexactly(2)
+    opcode = head[0] & 0x0F
+    length = head[1] & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), "big")
+    if length > BUFFER_LIMIT:  # client only sends small control frames
+        raise ConnectionError("websocket frame too large")
+    mask = await reader.readexactly(4) if head[1] & 0x80 else b""
+    payload = await reader.readexactly(length) if length else b""
+    if mask:
+        payload = bytes(byte ^ mask[pos % 4] for pos, byte in enumerate(payload))
+    return opcode, payload
+
+
 async def parse_response(reader: StreamReader) -> bytes:
     """Parse response"""
     # Get headers
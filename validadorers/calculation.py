@@ -159,6 +159,13 @@ def lap_progress_correction(percent: float, laptime: float) -> float:
     return percent
 
 
+def lap_distance_correction(dist_into: float, length: float, laptime: float) -> float:
+    """Lap distance desync correction, distance not yet reset after crossing finish line"""
+    if 0 < laptime < 1 and dist_into > length * 0.5:
+        return 0
+    return dist_into
+
+
 def lap_progress_offset(laptime: float, lap_into: float, seconds_delay: float) -> float:
     """Lap progress offset (fraction) by seconds delay, such as pit stop"""
     if laptime:
@@ -310,6 +317,33 @@ def turning_direction(yaw_rad: float, x1: float, y1: float, x2: float, y2: float
     return 0
 
 
+def section_length(
+    map_length: float, total_nodes: int, section_nodes: int,
+    seek_index: int, raw_dists: Sequence[CoordXY]) -> float:
+    """Calculate section length from selected nodes"""
+    max_nodes = int(min(section_nodes, total_nodes - 2))
+    end_index = seek_index + max_nodes
+    if end_index >= total_nodes:
+        length = (
+            map_length - raw_dists[seek_index][0]
+            + raw_dists[end_index - total_nodes][0])
+    else:
+        length = raw_dists[end_index][0] - raw_dists[seek_index][0]
+    return length
+
+
+def curve_description(arc_radius: float, turn_direct: int, curve_grade: Sequence[Sequence]) -> str:
+    """Curve description"""
+    if arc_radius >= curve_grade[-1][0]:
+        return curve_grade[-1][1]
+    if turn_direct > 0:
+        direct_desc = "Right"
+    else:
+        direct_desc = "Left"
+    curve_desc = select_grade(curve_grade, arc_radius)
+    return f"{direct_desc} {curve_desc}"
+
+
 # Timing
 def clock_time(seconds: float, start: float = 0, scale: float = 1) -> float:
     """Clock time (seconds) looped in full 24 hours, 0 to 86400"""
@@ -548,15 +582,6 @@ def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     return f"{x1:.4f} {y1:.4f} {x2:.4f} {y2:.4f}"
 
 
-def skip_map_nodes(total: int, limit: int, detail_level: int) -> int:
-    """Skip map nodes"""
-    if detail_level <= 0:
-        skip_node = 0
-    else:
-        skip_node = total // limit + (detail_level - 1)
-    return skip_node
-
-
 def line_intersect_coords(
     coord_a: CoordXY, coord_b: CoordXY, rad: float, length: float):
     """Create intersect line coordinates from 2 coordinates
@@ -50,6 +50,8 @@ class FileExt:
     TPPN = ".tppn"
     TPTN = ".tptn"
     STATS = ".stats"
+    TELEMETRY = ".telemetry"
+    DB = ".db"
     LOCK = ".lock"
 
 
@@ -87,6 +89,7 @@ class StatsFile:
     """Stats file name constants"""
 
     DRIVER = "driver"
+    COMBO_SUMMARY = "combo_summary"
 
 
 class LogFile:
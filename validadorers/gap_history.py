@@ -0,0 +1,175 @@
+
+
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Iterable, Iterator
+
+from .const_common import MAX_VEHICLES
+
+NAN = float("nan")
+LAP_SAMPLES = 128  # laps kept per vehicle
+TREND_SAMPLES = 240  # intra-lap samples kept per vehicle
+
+
+class GapHistory:
+    """Gap history of all vehicles
+
+    Gap is stored as time gap to a common reference, so gap between any two vehicles
+    is difference of their samples. Each vehicle has two fixed size rings
+    (flat arrays, vehicle index * ring size + slot):
+        lap ring: gap at finish line on each completed lap, exact from lap start time,
+            reference is first recorded vehicle on each lap (usually the leader).
+        trend ring: intra-lap gap decimated to one sample per trend interval,
+            all vehicles are sampled at same time, reference is class leader,
+            gap is chained through vehicle ahead in same class, so it stays
+            available for vehicles lapped by leader. Only vehicles in same class
+            share same reference.
+
+    Attributes:
+        trend_interval: intra-lap sample interval (seconds).
+        trend_count: total intra-lap samples taken.
+        version: increased on every new sample.
+    """
+
+    __slots__ = (
+        "trend_interval",
+        "trend_count",
+        "trend_due",
+        "version",
+        "_lap_gap",
+        "_lap_number",
+        "_last_laps",
+        "_trend_gap",
+        "_slot_id",
+        "_leader_cross",
+        "_leader_lap",
+        "_next_trend_time",
+    )
+
+    def __init__(self, trend_interval: float = 5.0, max_vehicles: int = MAX_VEHICLES):
+        self.trend_interval = max(trend_interval, 0.1)
+        self._lap_gap = array("f", [NAN] * (max_vehicles * LAP_SAMPLES))
+        self._lap_number = array("l", [-1] * (max_vehicles * LAP_SAMPLES))
+        self._trend_gap = array("f", [NAN] * (max_vehicles * TREND_SAMPLES))
+        self._last_laps = array("l", [-1] * max_vehicles)
+        self._slot_id = array("q", [-1] * max_vehicles)
+        self._leader_cross = array("d", bytes(8 * LAP_SAMPLES))
+        self._leader_lap = array("l", [-1] * LAP_SAMPLES)
+        self.reset()
+
+    def reset(self):
+        """Clear all records"""
+        self.trend_count = 0
+        self.trend_due = False
+        self.version = 0
+        self._next_trend_time = 0.0
+        self._leader_lap[:] = array("l", [-1] * LAP_SAMPLES)
+        for index in range(len(self._slot_id)):
+            self.reset_vehicle(index)
+
+    def reset_vehicle(self, index: int, slot_id: int = -1):
+        """Clear vehicle records"""
+        self._slot_id[index] = slot_id
+        self._last_laps[index] = -1
+        start = index * LAP_SAMPLES
+        self._lap_number[start:start + LAP_SAMPLES] = array("l", [-1] * LAP_SAMPLES)
+        start = index * TREND_SAMPLES
+        self._trend_gap[start:start + TREND_SAMPLES] = array("f", [NAN] * TREND_SAMPLES)
+
+    def begin_update(self, elapsed_time: float):
+        """Check whether intra-lap sample is due in current update"""
+        if elapsed_time < self._next_trend_time - self.trend_interval:  # session time went back
+            self._next_trend_time = elapsed_time
+        self.trend_due = elapsed_time >= self._next_trend_time
+        if self.trend_due:
+            self._next_trend_time = elapsed_time + self.trend_interval
+
+    def end_update(self):
+        """Finish intra-lap sample"""
+        if self.trend_due:
+            self.trend_count += 1
+            self.version += 1
+
+    def update(self, index: int, slot_id: int, laps_completed: int, lap_start_time: float):
+        """Update vehicle lap samples
+
+        Args:
+            index: vehicle index.
+            slot_id: vehicle slot id, records are cleared if changed.
+            laps_completed: completed laps.
+            lap_start_time: current lap start time (finish line crossing time).
+        """
+        if self._slot_id[index] != slot_id or laps_completed < self._last_laps[index]:
+            self.reset_vehicle(index, slot_id)
+        if laps_completed > self._last_laps[index]:
+            self._last_laps[index] = laps_completed
+            if laps_completed > 0 and lap_start_time > 0:
+                self.record_lap(index, laps_completed, lap_start_time)
+
+    def update_trend(
+        self,
+        vehicles: Iterable[tuple[int, int]],
+        interval: Callable[[int, int], float],
+    ):
+        """Record intra-lap samples if due, call after vehicle lap samples updated
+
+        Args:
+            vehicles: (vehicle index, index of vehicle ahead in same class or -1 for class leader),
+                ordered by position in class, so vehicle ahead is always sampled first.
+            interval: function to get time interval (seconds) from ahead to behind vehicle index,
+                NaN if not available.
+        """
+        if not self.trend_due:
+            return
+        trend_gap = self._trend_gap
+        slot = self.trend_count % TREND_SAMPLES
+        for pos in range(slot, len(trend_gap), TREND_SAMPLES):  # clear unsampled vehicles
+            trend_gap[pos] = NAN
+        for index, ahead_index in vehicles:
+            if ahead_index < 0:
+                trend_gap[index * TREND_SAMPLES + slot] = 0.0
+            else:
+                trend_gap[index * TREND_SAMPLES + slot] = (
+                    trend_gap[ahead_index * TREND_SAMPLES + slot] + interval(ahead_index, index))
+
+    def record_lap(self, index: int, lap_number: int, cross_time: float):
+        """Record gap at finish line, first recorded vehicle on lap sets reference"""
+        slot = lap_number % LAP_SAMPLES
+        if self._leader_lap[slot] != lap_number:
+            self._leader_lap[slot] = lap_number
+            self._leader_cross[slot] = cross_time
+        pos = index * LAP_SAMPLES + slot
+        self._lap_gap[pos] = cross_time - self._leader_cross[slot]
+        self._lap_number[pos] = lap_number
+        self.version += 1
+
+    def last_lap(self, index: int) -> int:
+        """Last recorded lap number of vehicle, -1 if none"""
+        return self._last_laps[index]
+
+    def lap_gaps(self, index: int, target: int, laps: int) -> Iterator[tuple[int, float]]:
+        """Gap to target vehicle over last laps of vehicle, positive if target is ahead
+
+        Yields:
+            Lap number, gap (seconds). Laps without sample of both vehicles are skipped.
+        """
+        last_lap = self._last_laps[index]
+        lap_gap = self._lap_gap
+        lap_number = self._lap_number
+        base = index * LAP_SAMPLES
+        target_base = target * LAP_SAMPLES
+        for lap in range(max(last_lap - min(laps, LAP_SAMPLES) + 1, 1), last_lap + 1):
+            slot = lap % LAP_SAMPLES
+            if lap_number[base + slot] == lap == lap_number[target_base + slot]:
+                yield lap, lap_gap[base + slot] - lap_gap[target_base + slot]
+
+    def trend_gaps(self, index: int, target: int, samples: int) -> Iterator[float]:
+        """Intra-lap gap to target vehicle over last samples, oldest first, NaN if not available"""
+        trend_gap = self._trend_gap
+        base = index * TREND_SAMPLES
+        target_base = target * TREND_SAMPLES
+        end = self.trend_count
+        for count in range(max(end - min(samples, TREND_SAMPLES), 0), end):
+            slot = count % TREND_SAMPLES
+            yield trend_gap[base + slot] - trend_gap[target_base + slot]
@@ -0,0 +1,279 @@
+
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import sub
+from typing import Iterable, NamedTuple, Sequence
+
+from . import calculation as calc
+
+CoordXY = calc.CoordXY
+
+
+class LapTrace(NamedTuple):
+    """Recorded lap trace, distance must be ascending"""
+
+    distance: array
+    laptime: array
+    channels: dict[str, array]
+
+
+class LapDelta(NamedTuple):
+    """Lap comparison result on reference distance grid"""
+
+    grid: array
+    delta: array
+    channels: dict[str, array]
+    laptime_diff: float
+
+
+class SectorSplit(NamedTuple):
+    """Sector split comparison"""
+
+    reference: float
+    target: float
+    difference: float
+
+
+class TrackCorner(NamedTuple):
+    """Track corner section"""
+
+    name: str
+    start: float
+    end: float
+    radius: float
+
+
+class CornerDelta(NamedTuple):
+    """Corner time loss comparison"""
+
+    corner: TrackCorner
+    time_lost: float
+
+
+def create_curve_grades(ecfg: dict) -> list[tuple[float, str]]:
+    """Create sorted curve grade list from track map viewer config"""
+    curve_grades = [
+        (ecfg["curve_grade_hairpin"], "Hairpin"),
+        *[(ecfg[f"curve_grade_{idx}"], str(idx))
+        for idx in range(1, 9) if ecfg[f"curve_grade_{idx}"] >= 0],
+        (ecfg["curve_grade_straight"], "Straight"),
+    ]
+    curve_grades.sort()
+    return curve_grades
+
+
+def monotonic_trace(
+    distance: Sequence[float], laptime: Sequence[float], channels: dict[str, Sequence] | None = None
+) -> LapTrace:
+    """Create lap trace, drop samples with non-increasing distance"""
+    keep = []
+    last_dist = -1.0
+    for index, dist in enumerate(distance):
+        if dist > last_dist:
+            keep.append(index)
+            last_dist = dist
+    if channels is None:
+        channels = {}
+    return LapTrace(
+        array("d", map(distance.__getitem__, keep)),
+        array("d", map(laptime.__getitem__, keep)),
+        {name: array("d", map(data.__getitem__, keep)) for name, data in channels.items()},
+    )
+
+
+def trace_from_delta(dataset: Sequence[CoordXY]) -> LapTrace:
+    """Create lap trace from delta best data set (distance, laptime)"""
+    distance, laptime = zip(*dataset)
+    return monotonic_trace(distance, laptime)
+
+
+def trace_from_telemetry(dataset: dict[str, Sequence]) -> LapTrace:
+    """Create lap trace from telemetry log channel data"""
+    channels = {
+        name: data for name, data in dataset.items()
+        if name not in ("distance", "laptime")
+    }
+    return monotonic_trace(dataset["distance"], dataset["laptime"], channels)
+
+
+def distance_grid(length: float, step: float) -> array:
+    """Create distance grid from 0 to length"""
+    step = max(step, 0.1)
+    return array("d", (index * step for index in range(int(length / step) + 1)))
+
+
+def resample(source_x: Sequence[float], source_y: Sequence[float], grid: Sequence[float]) -> array:
+    """Resample source data onto ascending grid with linear interpolation
+
+    Both source and grid are ascending, source index only moves forward,
+    values outside source range are clamped to first or last value.
+    """
+    output = array("d", bytes(8 * len(grid)))
+    last_index = len(source_x) - 1
+    if last_index < 0:
+        return output
+    if last_index == 0:
+        return array("d", (source_y[0] for _ in grid))
+    index = 0
+    x1, x2 = source_x[0], source_x[1]
+    y1, y2 = source_y[0], source_y[1]
+    for grid_index, pos in enumerate(grid):
+        while pos > x2 and index < last_index - 1:
+            index += 1
+            x1, y1 = x2, y2
+            x2, y2 = source_x[index + 1], source_y[index + 1]
+        if pos <= x1:
+            output[grid_index] = y1
+        elif pos >= x2:
+            output[grid_index] = y2
+        else:
+            output[grid_index] = y1 + (y2 - y1) * (pos - x1) / (x2 - x1)
+    return output
+
+
+def value_at(grid: Sequence[float], values: Sequence[float], pos: float) -> float:
+    """Interpolate value at position from grid data"""
+    index = bisect_left(grid, pos)
+    if index <= 0:
+        return values[0]
+    if index >= len(grid):
+        return values[-1]
+    return calc.linear_interp(pos, grid[index - 1], values[index - 1], grid[index], values[index])
+
+
+class ReferenceLap:
+    """Reference lap resampled on distance grid
+
+    Resample reference lap once, then compare any number of laps against it.
+
+    Attributes:
+        grid: distance grid.
+        laptime: resampled reference laptime.
+        channels: resampled reference channel data.
+        length: reference lap distance.
+    """
+
+    __slots__ = (
+        "grid",
+        "laptime",
+        "channels",
+        "length",
+    )
+
+    def __init__(self, trace: LapTrace, step: float = 5.0):
+        self.length = trace.distance[-1]
+        self.grid = distance_grid(self.length, step)
+        self.laptime = resample(trace.distance, trace.laptime, self.grid)
+        self.channels = {
+            name: resample(trace.distance, data, self.grid)
+            for name, data in trace.channels.items()
+        }
+
+    def compare(self, trace: LapTrace) -> LapDelta:
+        """Compare lap against reference, positive delta = slower than reference"""
+        grid = self.grid
+        target_time = resample(trace.distance, trace.laptime, grid)
+        delta = array("d", map(sub, target_time, self.laptime))
+        channels = {
+            name: array("d", map(sub, resample(trace.distance, data, grid), self.channels[name]))
+            for name, data in trace.channels.items()
+            if name in self.channels
+        }
+        return LapDelta(grid, delta, channels, trace.laptime[-1] - self.laptime[-1])
+
+    def sector_splits(self, lap_delta: LapDelta, sector_dists: Sequence[float]) -> tuple[SectorSplit, ...]:
+        """Sector splits from sector boundary distances (excluding start & finish)"""
+        grid = self.grid
+        boundaries = (0.0, *sector_dists, self.length)
+        output = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            ref_time = value_at(grid, self.laptime, end) - value_at(grid, self.laptime, start)
+            delta = value_at(grid, lap_delta.delta, end) - value_at(grid, lap_delta.delta, start)
+            output.append(SectorSplit(ref_time, ref_time + delta, delta))
+        return tuple(output)
+
+
+def section_average(grid: Sequence[float], values: Sequence[float], start: float, end: float) -> float:
+    """Average value of grid data between start & end position"""
+    index_start = bisect_left(grid, start)
+    index_end = bisect_right(grid, end)
+    if index_end <= index_start:
+        return value_at(grid, values, (start + end) * 0.5)
+    return sum(values[index_start:index_end]) / (index_end - index_start)
+
+
+def corner_time_loss(lap_delta: LapDelta, corners: Iterable[TrackCorner]) -> tuple[CornerDelta, ...]:
+    """Time lost (positive) or gained (negative) in each corner"""
+    grid = lap_delta.grid
+    delta = lap_delta.delta
+    return tuple(
+        CornerDelta(corner, value_at(grid, delta, corner.end) - value_at(grid, delta, corner.start))
+        for corner in corners
+    )
+
+
+def detect_corners(
+    raw_coords: Sequence[CoordXY], raw_dists: Sequence[CoordXY],
+    curve_grades: Sequence[Sequence], section_nodes: int = 10,
+) -> tuple[TrackCorner, ...]:
+    """Detect corners from track map
+
+    Curvature is measured the same way as track map viewer curve section,
+    consecutive non-straight sections are merged into one corner,
+    and corner is named after its tightest section.
+
+    Args:
+        raw_coords: map coordinates (x, y).
+        raw_dists: map distance & elevation (distance, z).
+        curve_grades: sorted curve grade list, last grade is straight.
+        section_nodes: number of nodes per curve section.
+
+    Returns:
+        Corners ordered by distance.
+    """
+    total_nodes = len(raw_coords)
+    if total_nodes < 10 or len(raw_dists) != total_nodes:
+        return ()
+    max_nodes = int(min(section_nodes, total_nodes - 2))
+    mid_offset = max_nodes // 2
+    straight_radius = curve_grades[-1][0]
+    corners = []
+    corner_start = -1.0
+    corner_end = 0.0
+    corner_radius = straight_radius
+    corner_turn = 0
+    for index in range(total_nodes - mid_offset):
+        point_one = raw_coords[index]
+        point_sec = raw_coords[(index + 1) % total_nodes]
+        point_mid = raw_coords[(index + mid_offset) % total_nodes]
+        point_end = raw_coords[(index + max_nodes - 1) % total_nodes]
+        arc_center_pos = calc.tri_coords_circle_center(*point_one, *point_mid, *point_end)
+        arc_radius = calc.distance(point_one, arc_center_pos)
+        # Use middle node distance as section position
+        section_dist = raw_dists[index + mid_offset][0]
+        if arc_radius < straight_radius:
+            if corner_start < 0:
+                corner_start = section_dist
+                corner_radius = straight_radius
+            corner_end = section_dist
+            if arc_radius < corner_radius:
+                corner_radius = arc_radius
+                yaw_radians = calc.oriyaw2rad(
+                    point_sec[1] - point_one[1], point_sec[0] - point_one[0])
+                corner_turn = calc.turning_direction(yaw_radians, *point_one, *point_end)
+        elif corner_start >= 0:
+            corners.append((corner_start, corner_end, corner_radius, corner_turn))
+            corner_start = -1.0
+    if corner_start >= 0:
+        corners.append((corner_start, corner_end, corner_radius, corner_turn))
+    return tuple(
+        TrackCorner(
+            f"T{number} {calc.curve_description(radius, turn, curve_grades)}",
+            start, end, radius,
+        )
+        for number, (start, end, radius, turn) in enumerate(
+            (corner for corner in corners if corner[1] > corner[0]), 1)
+    )
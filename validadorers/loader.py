@@ -27,6 +27,7 @@ import signal
 import sys
 
 from .api_control import api
+from .async_loop import async_loop
 from .const_file import FileExt
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
@@ -81,6 +82,8 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 stop event loop
+    async_loop.stop()
 
 
 def restart():
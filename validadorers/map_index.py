@@ -0,0 +1,267 @@
+
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from math import floor, log2
+from typing import Sequence
+
+from .const_common import FLOAT_INF
+
+CoordXY = Sequence[float]
+LOD_FULL_DETAIL = -64
+
+
+def rdp_significance(coords: Sequence[CoordXY], vertical: bool = False) -> array:
+    """Ramer-Douglas-Peucker node significance
+
+    Significance is the largest tolerance at which node is still kept by RDP
+    simplification, so any tolerance level can be selected later without
+    running simplification again. First & last nodes are always kept.
+
+    Args:
+        coords: node coordinates (x, y).
+        vertical: use vertical distance (for profile such as elevation)
+            instead of perpendicular distance.
+
+    Returns:
+        Significance value of each node.
+    """
+    total = len(coords)
+    significance = array("d", bytes(8 * total))
+    if total == 0:
+        return significance
+    significance[0] = significance[-1] = FLOAT_INF
+    stack = [(0, total - 1, FLOAT_INF)]
+    while stack:
+        start, end, parent = stack.pop()
+        if end - start < 2:
+            continue
+        x1, y1 = coords[start]
+        x2, y2 = coords[end]
+        dx = x2 - x1
+        dy = y2 - y1
+        if vertical:
+            slope = dy / dx if dx else 0.0
+        else:
+            length = (dx * dx + dy * dy) ** 0.5
+        max_dist = -1.0
+        max_index = start + 1
+        for index in range(start + 1, end):
+            px, py = coords[index]
+            if vertical:
+                dist = abs(py - y1 - (px - x1) * slope)
+            elif length:
+                dist = abs(dx * (y1 - py) - (x1 - px) * dy) / length
+            else:
+                dist = ((px - x1) ** 2 + (py - y1) ** 2) ** 0.5
+            if dist > max_dist:
+                max_dist = dist
+                max_index = index
+        # Child node can not be more significant than parent node
+        value = min(max_dist, parent)
+        significance[max_index] = value
+        stack.append((start, max_index, value))
+        stack.append((max_index, end, value))
+    return significance
+
+
+class MapLOD:
+    """Map level-of-detail pyramid
+
+    Levels are power of 2 tolerance steps (in map unit), built on demand from
+    precomputed RDP significance and cached.
+
+    Attributes:
+        coords: source coordinates.
+        significance: RDP significance of each node.
+    """
+
+    __slots__ = (
+        "coords",
+        "significance",
+        "_levels",
+    )
+
+    def __init__(self, coords: Sequence[CoordXY], vertical: bool = False):
+        self.coords = coords
+        self.significance = rdp_significance(coords, vertical)
+        self._levels: dict[int, tuple[int, ...]] = {}
+
+    @staticmethod
+    def level(max_error: float) -> int:
+        """Level number of cheapest level whose error stays under max_error"""
+        if max_error <= 0:
+            return LOD_FULL_DETAIL
+        return max(floor(log2(max_error)), LOD_FULL_DETAIL + 1)
+
+    def level_index(self, max_error: float) -> tuple[int, ...]:
+        """Node index list of cheapest level whose error stays under max_error
+
+        Args:
+            max_error: max allowed error (in map unit), 0 for all nodes.
+        """
+        level = self.level(max_error)
+        nodes = self._levels.get(level)
+        if nodes is None:
+            if level == LOD_FULL_DETAIL:
+                nodes = tuple(range(len(self.significance)))
+            else:
+                tolerance = 2.0 ** level
+                nodes = tuple(
+                    index for index, value in enumerate(self.significance)
+                    if value > tolerance
+                )
+            self._levels[level] = nodes
+        return nodes
+
+    def level_coords(self, max_error: float) -> tuple[CoordXY, ...]:
+        """Coordinates of cheapest level whose error stays under max_error"""
+        coords = self.coords
+        return tuple(coords[index] for index in self.level_index(max_error))
+
+
+def max_pixel_error(detail_level: int) -> float:
+    """Max allowed pixel error from display detail level, 0 for full detail"""
+    if detail_level <= 0:
+        return 0.0
+    return 0.5 * detail_level
+
+
+class MapIndex:
+    """Map spatial & distance index
+
+    Distance lookup uses binary search on cumulative distance array.
+    Spatial lookup uses uniform grid over (x, y), cell size is chosen
+    so that each cell holds about one node on average.
+
+    Attributes:
+        coords: source coordinates.
+        distances: cumulative distance of each node.
+        length: total distance.
+    """
+
+    __slots__ = (
+        "coords",
+        "distances",
+        "length",
+        "_end",
+        "_cell_size",
+        "_origin_x",
+        "_origin_y",
+        "_columns",
+        "_rows",
+        "_grid",
+    )
+
+    def __init__(self, coords: Sequence[CoordXY], dists: Sequence[CoordXY]):
+        total = min(len(coords), len(dists))
+        self.coords = coords
+        self.distances = array("d", (dists[index][0] for index in range(total)))
+        self.length = self.distances[-1] if total else 0.0
+        self._end = total - 1
+        self._grid: dict[tuple[int, int], list[int]] = {}
+
+        if total:
+            min_x = min(coords[index][0] for index in range(total))
+            max_x = max(coords[index][0] for index in range(total))
+            min_y = min(coords[index][1] for index in range(total))
+            max_y = max(coords[index][1] for index in range(total))
+            cell_size = max(max_x - min_x, max_y - min_y) / total ** 0.5
+        else:
+            min_x = max_x = min_y = max_y = 0.0
+            cell_size = 0.0
+        self._cell_size = max(cell_size, 1.0)
+        self._origin_x = min_x
+        self._origin_y = min_y
+        self._columns = int((max_x - min_x) / self._cell_size) + 1
+        self._rows = int((max_y - min_y) / self._cell_size) + 1
+
+        grid = self._grid
+        for index in range(total):
+            cell = self.cell(*coords[index])
+            nodes = grid.get(cell)
+            if nodes is None:
+                grid[cell] = [index]
+            else:
+                nodes.append(index)
+
+    def cell(self, x: float, y: float) -> tuple[int, int]:
+        """Grid cell of coordinate"""
+        size = self._cell_size
+        return floor((x - self._origin_x) / size), floor((y - self._origin_y) / size)
+
+    def node_at_distance(self, dist: float) -> int:
+        """Index of first node whose distance is not lower than dist, clamped to last node"""
+        if self._end < 0:
+            return -1
+        return min(bisect_left(self.distances, dist), self._end)
+
+    def coords_at_distance(self, dist: float) -> CoordXY:
+        """Coordinates at distance, interpolated between nodes"""
+        index = self.node_at_distance(dist)
+        if index < 1:
+            return self.coords[max(index, 0)]
+        distances = self.distances
+        dist_lower = distances[index - 1]
+        dist_range = distances[index] - dist_lower
+        if dist_range <= 0 or dist >= distances[index]:
+            return self.coords[index]
+        x1, y1 = self.coords[index - 1]
+        x2, y2 = self.coords[index]
+        ratio = max(dist - dist_lower, 0.0) / dist_range
+        return x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio
+
+    def nearest_node(self, x: float, y: float) -> int:
+        """Index of nearest node to coordinate, -1 if no node"""
+        if self._end < 0:
+            return -1
+        grid = self._grid
+        coords = self.coords
+        cell_x, cell_y = self.cell(x, y)
+        # Search outward ring by ring until no closer node possible
+        max_ring = max(
+            abs(cell_x), abs(self._columns - cell_x),
+            abs(cell_y), abs(self._rows - cell_y),
+        )
+        nearest = -1
+        nearest_dist = FLOAT_INF
+        for ring in range(max_ring + 1):
+            for col in range(cell_x - ring, cell_x + ring + 1):
+                edge = col in (cell_x - ring, cell_x + ring)
+                for row in range(cell_y - ring, cell_y + ring + 1, 1 if edge else 2 * ring):
+                    for index in grid.get((col, row), ()):
+                        px, py = coords[index]
+                        dist = (px - x) * (px - x) + (py - y) * (py - y)
+                        if dist < nearest_dist:
+                            nearest_dist = dist
+                            nearest = index
+            # Nodes in next rings are at least (ring * cell size) away
+            if nearest >= 0 and nearest_dist <= (ring * self._cell_size) ** 2:
+                break
+        return nearest
+
+    def nodes_in_rect(self, x1: float, y1: float, x2: float, y2: float) -> list[int]:
+        """Sorted index list of nodes inside rectangle"""
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        grid = self._grid
+        coords = self.coords
+        col_start, row_start = self.cell(x1, y1)
+        col_end, row_end = self.cell(x2, y2)
+        col_start = max(col_start, 0)
+        row_start = max(row_start, 0)
+        col_end = min(col_end, self._columns - 1)
+        row_end = min(row_end, self._rows - 1)
+        nodes = [
+            index
+            for col in range(col_start, col_end + 1)
+            for row in range(row_start, row_end + 1)
+            for index in grid.get((col, row), ())
+            if x1 <= coords[index][0] <= x2 and y1 <= coords[index][1] <= y2
+        ]
+        nodes.sort()
+        return nodes
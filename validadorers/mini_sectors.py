@@ -0,0 +1,238 @@
+
+
+from __future__ import annotations
+
+from array import array
+from math import floor
+
+from .const_common import MAX_VEHICLES
+
+MIN_MINI_SECTORS = 25
+MAX_MINI_SECTORS = 100
+
+# Mini sector state
+STATE_NONE = 0  # no valid time
+STATE_SLOWER = 1  # slower than personal best (yellow)
+STATE_PERSONAL_BEST = 2  # personal best (green)
+STATE_CLASS_BEST = 3  # session best in class (purple)
+
+
+class MiniSectorTiming:
+    """Mini sector timing for all vehicles
+
+    Lap is split into equal length mini sectors. Latest time, personal best time
+    of each mini sector are stored in flat arrays (vehicle index * sectors + sector),
+    session best is stored per vehicle class. Crossing time is interpolated
+    between samples and rounded to milliseconds, mini sector state is resolved
+    on read, so purple state always follows current class best.
+
+    Lap time summed from mini sectors of each completed lap is compared
+    the same way, for lap state.
+
+    Attributes:
+        sectors: number of mini sectors per lap.
+        track_length: track length (meters).
+        sector_length: mini sector length (meters).
+        times: latest mini sector time, 0 if not available.
+        personal_best: personal best mini sector time, 0 if not available.
+        class_best: session best mini sector times, key = class name.
+        last_sector: last completed mini sector index of each vehicle, -1 if none.
+        last_lap: last lap time summed from mini sectors, 0 if not available.
+        best_lap: personal best lap time summed from mini sectors, 0 if not available.
+        class_best_lap: session best lap time summed from mini sectors, key = class name.
+    """
+
+    __slots__ = (
+        "sectors",
+        "track_length",
+        "sector_length",
+        "times",
+        "personal_best",
+        "class_best",
+        "last_sector",
+        "last_lap",
+        "best_lap",
+        "class_best_lap",
+        "_class_name",
+        "_slot_id",
+        "_sector_id",
+        "_start_time",
+        "_last_distance",
+        "_last_time",
+    )
+
+    def __init__(self, sectors: int = 50, max_vehicles: int = MAX_VEHICLES):
+        self._class_name = [""] * max_vehicles
+        self._slot_id = array("q", [-1] * max_vehicles)
+        self._sector_id = array("q", [-1] * max_vehicles)
+        self._start_time = array("d", [-1.0] * max_vehicles)
+        self._last_distance = array("d", bytes(8 * max_vehicles))
+        self._last_time = array("d", bytes(8 * max_vehicles))
+        self.last_sector = array("l", [-1] * max_vehicles)
+        self.last_lap = array("d", bytes(8 * max_vehicles))
+        self.best_lap = array("d", bytes(8 * max_vehicles))
+        self.class_best: dict[str, array] = {}
+        self.class_best_lap: dict[str, float] = {}
+        self.sectors = 0
+        self.track_length = 0.0
+        self.sector_length = 0.0
+        self.resize(0.0, sectors)
+
+    def resize(self, track_length: float, sectors: int):
+        """Reallocate arrays for track length & number of mini sectors, clear all records"""
+        self.sectors = min(max(int(sectors), MIN_MINI_SECTORS), MAX_MINI_SECTORS)
+        self.track_length = max(track_length, 0.0)
+        self.sector_length = self.track_length / self.sectors
+        total = len(self._slot_id) * self.sectors
+        self.times = array("d", bytes(8 * total))
+        self.personal_best = array("d", bytes(8 * total))
+        self.class_best.clear()
+        self.class_best_lap.clear()
+        for index in range(len(self._slot_id)):
+            self._slot_id[index] = -1
+            self._sector_id[index] = -1
+            self.last_sector[index] = -1
+            self.last_lap[index] = 0.0
+            self.best_lap[index] = 0.0
+
+    def reset_vehicle(self, index: int, slot_id: int, class_name: str):
+        """Clear vehicle records"""
+        self._slot_id[index] = slot_id
+        self._class_name[index] = class_name
+        self.restart_vehicle(index)
+        self.best_lap[index] = 0.0
+        start = index * self.sectors
+        self.personal_best[start:start + self.sectors] = array("d", bytes(8 * self.sectors))
+
+    def restart_vehicle(self, index: int):
+        """Clear current lap records, keep personal best"""
+        self._sector_id[index] = -1
+        self._start_time[index] = -1.0
+        self.last_sector[index] = -1
+        self.last_lap[index] = 0.0
+        start = index * self.sectors
+        self.times[start:start + self.sectors] = array("d", bytes(8 * self.sectors))
+
+    def update(
+        self,
+        index: int,
+        slot_id: int,
+        class_name: str,
+        total_distance: float,
+        elapsed_time: float,
+        valid: bool,
+    ):
+        """Record completed mini sectors of vehicle since last update
+
+        Backward movement less than mini sector length (such as distance jitter
+        at finish line) is ignored, larger backward movement clears current lap
+        records. Personal best is cleared only if slot id or class changed.
+
+        Args:
+            index: vehicle index.
+            slot_id: vehicle slot id, records are cleared if changed.
+            class_name: vehicle class name.
+            total_distance: total traveled distance (completed laps * track length + lap distance).
+            elapsed_time: session elapsed time (seconds).
+            valid: whether mini sector time is valid for best time (not in pit).
+        """
+        if self.sector_length <= 0:
+            return
+        sector_id = floor(total_distance / self.sector_length)
+        last_id = self._sector_id[index]
+        if (
+            last_id >= 0
+            and self._slot_id[index] == slot_id
+            and 0 < self._last_distance[index] - total_distance < self.sector_length
+            and elapsed_time >= self._last_time[index]
+        ):
+            return  # keep last sample until moved past it
+        if self._slot_id[index] != slot_id or self._class_name[index] != class_name:
+            self.reset_vehicle(index, slot_id, class_name)
+            last_id = -1
+        elif (
+            sector_id < last_id  # went backwards, such as reset to pit
+            or sector_id - last_id > self.sectors  # teleported over a lap
+            or elapsed_time < self._last_time[index]
+        ):
+            self.restart_vehicle(index)
+            last_id = -1
+        elif last_id >= 0 and sector_id > last_id:
+            last_distance = self._last_distance[index]
+            last_time = self._last_time[index]
+            distance_diff = total_distance - last_distance
+            time_diff = elapsed_time - last_time
+            for crossed in range(last_id + 1, sector_id + 1):
+                if distance_diff > 0:
+                    ratio = (crossed * self.sector_length - last_distance) / distance_diff
+                else:
+                    ratio = 1.0
+                cross_time = last_time + time_diff * ratio
+                start_time = self._start_time[index]
+                if start_time >= 0:
+                    self.record(index, class_name, (crossed - 1) % self.sectors,
+                                cross_time - start_time, valid)
+                self._start_time[index] = cross_time
+        self._sector_id[index] = sector_id
+        self._last_distance[index] = total_distance
+        self._last_time[index] = elapsed_time
+
+    def record(self, index: int, class_name: str, sector: int, sector_time: float, valid: bool):
+        """Record mini sector time, rounded to milliseconds"""
+        self.last_sector[index] = sector
+        pos = index * self.sectors + sector
+        sector_time = round(sector_time, 3)
+        if not valid or sector_time <= 0:
+            self.times[pos] = 0.0
+        else:
+            self.times[pos] = sector_time
+            if not 0 < self.personal_best[pos] <= sector_time:
+                self.personal_best[pos] = sector_time
+            class_best = self.class_best.get(class_name)
+            if class_best is None:
+                class_best = self.class_best[class_name] = array("d", bytes(8 * self.sectors))
+            if not 0 < class_best[sector] <= sector_time:
+                class_best[sector] = sector_time
+        if sector == self.sectors - 1:
+            self.record_lap(index, class_name)
+
+    def record_lap(self, index: int, class_name: str):
+        """Record lap time summed from mini sectors of completed lap"""
+        start = index * self.sectors
+        lap_times = self.times[start:start + self.sectors]
+        if min(lap_times) <= 0:  # incomplete or invalid lap
+            self.last_lap[index] = 0.0
+            return
+        lap_time = self.last_lap[index] = round(sum(lap_times), 3)
+        if not 0 < self.best_lap[index] <= lap_time:
+            self.best_lap[index] = lap_time
+        if not 0 < self.class_best_lap.get(class_name, 0.0) <= lap_time:
+            self.class_best_lap[class_name] = lap_time
+
+    def state(self, index: int, sector: int) -> int:
+        """Mini sector state of vehicle"""
+        pos = index * self.sectors + sector
+        sector_time = self.times[pos]
+        if sector_time <= 0:
+            return STATE_NONE
+        class_best = self.class_best.get(self._class_name[index])
+        if class_best is not None and sector_time <= class_best[sector]:
+            return STATE_CLASS_BEST
+        if sector_time <= self.personal_best[pos]:
+            return STATE_PERSONAL_BEST
+        return STATE_SLOWER
+
+    def states(self, index: int) -> tuple[int, ...]:
+        """Mini sector state grid row of vehicle"""
+        return tuple(self.state(index, sector) for sector in range(self.sectors))
+
+    def lap_state(self, index: int) -> int:
+        """State of last completed lap of vehicle"""
+        lap_time = self.last_lap[index]
+        if lap_time <= 0:
+            return STATE_NONE
+        if lap_time <= self.class_best_lap.get(self._class_name[index], 0.0):
+            return STATE_CLASS_BEST
+        if lap_time <= self.best_lap[index]:
+            return STATE_PERSONAL_BEST
+        return STATE_SLOWER
@@ -10,7 +10,10 @@ __all__ = [
     "module_notes",
     "module_relative",
     "module_sectors",
+    "module_server",
     "module_stats",
+    "module_strategy",
+    "module_telemetry",
     "module_vehicles",
     "module_wheels",
 ]
@@ -25,6 +28,9 @@ from . import module_mapping
 from . import module_notes
 from . import module_relative
 from . import module_sectors
+from . import module_server
 from . import module_stats
+from . import module_strategy
+from . import module_telemetry
 from . import module_vehicles
 from . import module_wheels
@@ -2,6 +2,7 @@
 import logging
 import threading
 from functools import partial
+from typing import Any, Callable
 
 from ..setting import Setting
 
@@ -11,6 +12,22 @@ round4 = partial(round, ndigits=4)
 round6 = partial(round, ndigits=6)
 
 
+def sync_tracked_cars(cars: tuple, last_cars: tuple, calcs: tuple, create: Callable) -> tuple[Any, ...]:
+    """Per car calculators parallel to tracked cars (multi-car mode)
+
+    Args:
+        cars: current tracked cars.
+        last_cars: tracked cars of calcs.
+        calcs: calculators of last tracked cars.
+        create: function to create calculator for tracked car.
+
+    Returns:
+        Calculators of current tracked cars, existing calculators of same car are kept.
+    """
+    existing = dict(zip(last_cars, calcs))
+    return tuple(existing[car] if car in existing else create(car) for car in cars)
+
+
 class DataModule:
     """Data module base"""
 
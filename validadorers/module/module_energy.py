@@ -1,12 +1,14 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_file import FileExt
-from ..module_info import minfo
-from ._base import DataModule
+from ..module_info import TrackedCar, minfo
+from ._base import DataModule, sync_tracked_cars
 from .module_fuel import calc_consumption
 
 
@@ -25,6 +27,9 @@ class Realtime(DataModule):
         update_interval = self.idle_interval
 
         userpath_energy_delta = self.cfg.path.energy_delta
+        multicar = minfo.multicar
+        last_cars = ()
+        gen_calc_energy = ()
 
         while not _event_wait(update_interval):
             if realtime_state.active:
@@ -34,41 +39,66 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
 
                     combo_name = api.read.session.combo_name()
-                    gen_calc_energy = calc_consumption(
-                        output=minfo.energy,
-                        telemetry_func=telemetry_energy,
+                    create_calc_energy = partial(
+                        self.create_calc_energy,
                         filepath=userpath_energy_delta,
                         filename=combo_name,
-                        extension=FileExt.ENERGY,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
-                    # Reset module output
-                    minfo.energy.reset()
-
-                # Run calculation if virtual energy available
+                    last_cars = gen_calc_energy = ()  # reset all cars
+
+                # Keep per car calculation of tracked cars
+                cars = multicar.cars
+                if last_cars is not cars:
+                    gen_calc_energy = sync_tracked_cars(
+                        cars, last_cars, gen_calc_energy, create_calc_energy)
+                    last_cars = cars
+
+                # Run calculation if virtual energy available,
+                # only available for local player via REST API
+                for car, gen_energy in zip(cars, gen_calc_energy):
+                    if car.index is None and api.read.vehicle.max_virtual_energy():
+                        gen_energy.send(True)
+
+                # Update hybrid info of local player
+                player = multicar.player
                 if api.read.vehicle.max_virtual_energy():
-                    gen_calc_energy.send(True)
-
-                    # Update hybrid info
                     minfo.hybrid.fuelEnergyRatio = calc.fuel_to_energy_ratio(
-                        minfo.fuel.estimatedConsumption,
-                        minfo.energy.estimatedConsumption,
+                        player.fuel.estimatedConsumption,
+                        player.energy.estimatedConsumption,
                     )
                     minfo.hybrid.fuelEnergyBias = (
-                        minfo.fuel.estimatedLaps - minfo.energy.estimatedLaps
+                        player.fuel.estimatedLaps - player.energy.estimatedLaps
                     )
 
+                # Notify data changes
+                minfo.publish_changes("energy")
+                minfo.publish_changes("hybrid")
+
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
                     # Trigger save check
-                    gen_calc_energy.send(False)
-
-
-def telemetry_energy() -> tuple[float, float]:
+                    for gen_energy in gen_calc_energy:
+                        gen_energy.send(False)
+
+    @staticmethod
+    def create_calc_energy(car: TrackedCar, **kwargs):
+        """Create energy calculation of tracked car"""
+        car.energy.reset()
+        return calc_consumption(
+            output=car.energy,
+            car=car,
+            telemetry_func=telemetry_energy,
+            extension=FileExt.ENERGY,
+            **kwargs,
+        )
+
+
+def telemetry_energy(index: int | None = None) -> tuple[float, float]:
     """Telemetry energy, output in percentage"""
-    max_energy = api.read.vehicle.max_virtual_energy()
+    max_energy = api.read.vehicle.max_virtual_energy(index)
     if max_energy:
-        return 100.0, api.read.vehicle.virtual_energy() / max_energy * 100
+        return 100.0, api.read.vehicle.virtual_energy(index) / max_energy * 100
     return 100.0, 0.0
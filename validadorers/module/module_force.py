@@ -104,6 +104,9 @@ class Realtime(DataModule):
                 output.maxBrakingRate = max_braking_rate
                 output.deltaBrakingRate = delta_braking_rate
 
+                # Notify data changes
+                minfo.publish_changes("force")
+
             else:
                 if reset:
                     reset = False
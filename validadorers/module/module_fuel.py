@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from math import ceil
 from typing import Callable
 
@@ -10,7 +11,7 @@ from .. import realtime_state
 from ..api_control import api
 from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
 from ..const_file import FileExt
-from ..module_info import ConsumptionDataSet, FuelInfo, minfo
+from ..module_info import ConsumptionDataSet, FuelInfo, TrackedCar, minfo
 from ..userfile.consumption_history import (
     load_consumption_history_file,
     save_consumption_history_file,
@@ -20,7 +21,7 @@ from ..userfile.fuel_delta import (
     save_fuel_delta_file,
 )
 from ..validator import generator_init, valid_delta_raw
-from ._base import DataModule, round6
+from ._base import DataModule, round6, sync_tracked_cars
 
 
 class Realtime(DataModule):
@@ -38,6 +39,9 @@ class Realtime(DataModule):
         update_interval = self.idle_interval
 
         userpath_fuel_delta = self.cfg.path.fuel_delta
+        multicar = minfo.multicar
+        last_cars = ()
+        gen_calc_fuel = ()
 
         while not _event_wait(update_interval):
             if realtime_state.active:
@@ -47,57 +51,80 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
 
                     combo_name = api.read.session.combo_name()
-                    gen_calc_fuel = calc_consumption(
-                        output=minfo.fuel,
-                        telemetry_func=detect_consumption_type(),
+                    create_calc_fuel = partial(
+                        self.create_calc_fuel,
                         filepath=userpath_fuel_delta,
                         filename=combo_name,
-                        extension=FileExt.FUEL,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
-                    # Reset module output
-                    minfo.fuel.reset()
+                    last_cars = gen_calc_fuel = ()  # reset all cars
                     load_consumption_history(userpath_fuel_delta, combo_name)
 
+                # Keep per car calculation of tracked cars
+                cars = multicar.cars
+                if last_cars is not cars:
+                    gen_calc_fuel = sync_tracked_cars(
+                        cars, last_cars, gen_calc_fuel, create_calc_fuel)
+                    last_cars = cars
+
                 # Run calculation
-                gen_calc_fuel.send(True)
+                for car, gen_fuel in zip(cars, gen_calc_fuel):
+                    if car.index != -1:
+                        gen_fuel.send(True)
 
                 # Update consumption history
-                update_consumption_history()
+                update_consumption_history(multicar.player)
+
+                # Notify data changes
+                minfo.publish_changes("fuel")
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
                     # Trigger save check
-                    gen_calc_fuel.send(False)
+                    for gen_fuel in gen_calc_fuel:
+                        gen_fuel.send(False)
                     save_consumption_history(userpath_fuel_delta, combo_name)
 
+    @staticmethod
+    def create_calc_fuel(car: TrackedCar, **kwargs):
+        """Create fuel calculation of tracked car"""
+        car.fuel.reset()
+        return calc_consumption(
+            output=car.fuel,
+            car=car,
+            telemetry_func=None,
+            extension=FileExt.FUEL,
+            **kwargs,
+        )
+
 
-def update_consumption_history():
-    """Update consumption history"""
-    if not (10 > minfo.delta.lapTimeCurrent > 2) or minfo.delta.lapTimeLast < 1:
+def update_consumption_history(player: TrackedCar):
+    """Update local player consumption history"""
+    delta = player.delta
+    if not (10 > delta.lapTimeCurrent > 2) or delta.lapTimeLast < 1:
         return
 
     lap_number = api.read.lap.completed_laps() - 1
     if (
-        minfo.history.consumptionDataSet[0].lapTimeLast != minfo.delta.lapTimeLast
+        minfo.history.consumptionDataSet[0].lapTimeLast != delta.lapTimeLast
         or minfo.history.consumptionDataSet[0].lapNumber != lap_number
     ):
-        minfo.history.consumptionDataSet.appendleft(
+        minfo.history.add_consumption(
             ConsumptionDataSet(
                 lapNumber=lap_number,
-                isValidLap=int(minfo.delta.isValidLap),
-                lapTimeLast=minfo.delta.lapTimeLast,
-                lastLapUsedFuel=minfo.fuel.lastLapConsumption,
-                lastLapUsedEnergy=minfo.energy.lastLapConsumption,
+                isValidLap=int(delta.isValidLap),
+                lapTimeLast=delta.lapTimeLast,
+                lastLapUsedFuel=player.fuel.lastLapConsumption,
+                lastLapUsedEnergy=player.energy.lastLapConsumption,
                 batteryDrainLast=minfo.hybrid.batteryDrainLast,
                 batteryRegenLast=minfo.hybrid.batteryRegenLast,
-                tyreAvgWearLast=calc.mean(minfo.wheels.lastLapTreadWear),
-                capacityFuel=minfo.fuel.capacity,
+                tyreAvgWearLast=calc.mean(player.wheels.lastLapTreadWear),
+                capacityFuel=player.fuel.capacity,
             )
         )
-        minfo.history.consumptionDataVersion += 1
+        minfo.publish("history")
 
 
 def load_consumption_history(filepath: str, combo_name: str):
@@ -107,11 +134,11 @@ def load_consumption_history(filepath: str, combo_name: str):
             filepath=filepath,
             filename=combo_name,
         )
-        minfo.history.consumptionDataSet.clear()
-        minfo.history.consumptionDataSet.extend(dataset)
+        minfo.history.load_consumption(dataset)
         # Update combo info
         minfo.history.consumptionDataName = combo_name
         minfo.history.consumptionDataVersion = hash(combo_name)  # unique start id
+        minfo.publish("history")
 
 
 def save_consumption_history(filepath: str, combo_name: str):
@@ -125,45 +152,53 @@ def save_consumption_history(filepath: str, combo_name: str):
         minfo.history.consumptionDataVersion = hash(combo_name)  # reset
 
 
-def detect_consumption_type() -> Callable:
+def detect_consumption_type(index: int | None = None) -> Callable:
     """Detect consumption type, return telemetry function"""
     # Pure electric based vehicle
     if (
         api.read.state.identifier() == "RF2"
-        and api.read.vehicle.tank_capacity() == 1
-        and api.read.emotor.battery_charge() > 0
+        and api.read.vehicle.tank_capacity(index) == 1
+        and api.read.emotor.battery_charge(index) > 0
     ):
         return telemetry_battery
     # Fuel based vehicle
     return telemetry_fuel
 
 
-def telemetry_fuel() -> tuple[float, float]:
+def telemetry_fuel(index: int | None = None) -> tuple[float, float]:
     """Telemetry fuel"""
-    return max(api.read.vehicle.tank_capacity(), 0.01), api.read.vehicle.fuel()
+    return max(api.read.vehicle.tank_capacity(index), 0.01), api.read.vehicle.fuel(index)
 
 
-def telemetry_battery() -> tuple[float, float]:
+def telemetry_battery(index: int | None = None) -> tuple[float, float]:
     """Telemetry battery, capacity is always 100%"""
-    return 100, api.read.emotor.battery_charge() * 100
+    return 100, api.read.emotor.battery_charge(index) * 100
 
 
 @generator_init
 def calc_consumption(
-    output: FuelInfo, telemetry_func: Callable, filepath: str, filename: str, extension: str,
-    min_delta_distance: float):
-    """Calculate consumption data"""
+    output: FuelInfo, car: TrackedCar, telemetry_func: Callable | None, filepath: str, filename: str,
+    extension: str, min_delta_distance: float):
+    """Calculate consumption data of tracked car
+
+    Consumption type is detected on first update if telemetry function not set.
+    Consumption delta is loaded from & saved to file only for local player.
+    """
+    is_player = car.index is None
     recording = False
     delayed_save = False
     validating = 0
     is_pit_lap = 0  # whether pit in or pit out lap
 
-    delta_array_last, used_last_valid, laptime_last = load_fuel_delta_file(
-        filepath=filepath,
-        filename=filename,
-        extension=extension,
-        defaults=(DELTA_DEFAULT, 0.0, 0.0)
-    )
+    if is_player:
+        delta_array_last, used_last_valid, laptime_last = load_fuel_delta_file(
+            filepath=filepath,
+            filename=filename,
+            extension=extension,
+            defaults=(DELTA_DEFAULT, 0.0, 0.0)
+        )
+    else:
+        delta_array_last, used_last_valid, laptime_last = DELTA_DEFAULT, 0.0, 0.0
     delta_array_raw = [DELTA_ZERO]  # distance, fuel used, laptime
     delta_array_temp = DELTA_DEFAULT  # last lap temp
     delta_fuel = 0.0  # delta fuel consumption compare to last lap
@@ -197,7 +232,7 @@ def calc_consumption(
 
         # Save check
         if not updating:
-            if delayed_save:
+            if delayed_save and is_player:
                 save_fuel_delta_file(
                     filepath=filepath,
                     filename=filename,
@@ -207,24 +242,27 @@ def calc_consumption(
             continue
 
         # Read telemetry
-        capacity, amount_curr = telemetry_func()
-        lap_stime = api.read.timing.start()
-        laptime_curr = api.read.timing.current_laptime()
+        index = car.index
+        if telemetry_func is None:
+            telemetry_func = detect_consumption_type(index)
+        capacity, amount_curr = telemetry_func(index)
+        lap_stime = api.read.timing.start(index)
+        laptime_curr = api.read.timing.current_laptime(index)
         time_left = api.read.session.remaining()
-        in_garage = api.read.vehicle.in_garage()
-        pos_curr = api.read.lap.distance()
-        gps_curr = api.read.vehicle.position_xyz()
-        laps_done = api.read.lap.completed_laps()
-        lap_into = api.read.lap.progress()
-        is_pit_lap |= api.read.vehicle.in_pits()
-        laptime_last = minfo.delta.lapTimePace
+        in_garage = api.read.vehicle.in_garage(index)
+        pos_curr = api.read.lap.distance(index)
+        gps_curr = api.read.vehicle.position_xyz(index)
+        laps_done = api.read.lap.completed_laps(index)
+        lap_into = api.read.lap.progress(index)
+        is_pit_lap |= api.read.vehicle.in_pits(index)
+        laptime_last = car.delta.lapTimePace
 
         # Realtime fuel consumption
         if amount_start < amount_curr:
             amount_start = amount_last = amount_curr
 
         if amount_last < amount_curr:
-            if api.read.vehicle.speed() > 1:  # regen check
+            if api.read.vehicle.speed(index) > 1:  # regen check
                 used_curr += amount_last - amount_curr
             else:  # pitstop refilling check
                 amount_start = amount_curr
@@ -242,7 +280,7 @@ def calc_consumption(
                     round6(lap_stime - last_lap_stime)
                 ))
                 delta_array_temp = tuple(delta_array_raw)
-                validating = api.read.timing.elapsed()
+                validating = api.read.timing.elapsed(index)
             delta_array_raw[:] = DELTA_DEFAULT
             pos_last = pos_recorded = pos_curr
             used_last_raw = used_curr
@@ -265,11 +303,11 @@ def calc_consumption(
 
         # Validating 1s after passing finish line
         if validating:
-            timer = api.read.timing.elapsed() - validating
+            timer = api.read.timing.elapsed(index) - validating
             if timer > 3:  # switch off after 3s
                 validating = 0
             elif (timer > 0.3 and  # compare current time
-                api.read.timing.last_laptime() > 0):  # is valid laptime
+                api.read.timing.last_laptime(index) > 0):  # is valid laptime
                 used_last_valid = used_last_raw
                 delta_array_last = delta_array_temp
                 delta_array_temp = DELTA_DEFAULT
@@ -302,6 +340,8 @@ def calc_consumption(
                 api.read.lap.maximum(), laps_done)
             laps_left = calc.lap_type_laps_remain(
                 full_laps_left, lap_into)
+        elif is_player and minfo.vehicles.playerFinishLaps > 0:  # time-type race, projected finish
+            laps_left = max(minfo.vehicles.playerFinishLaps - laps_done - lap_into, 0)
         elif laptime_last > 0:  # time-type race
             end_timer_laps_left = calc.end_timer_laps_remain(
                 lap_into, laptime_last, time_left)
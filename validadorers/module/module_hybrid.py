@@ -163,6 +163,9 @@ class Realtime(DataModule):
                 output.motorInactiveTimer = motor_inactive_timer
                 output.motorState = motor_state
 
+                # Notify data changes
+                minfo.publish_changes("hybrid")
+
             else:
                 if reset:
                     reset = False
@@ -4,6 +4,8 @@ from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_file import FileExt
+from ..lap_comparison import create_curve_grades, detect_corners
+from ..map_index import MapIndex, MapLOD
 from ..module_info import MappingInfo, minfo
 from ..userfile.track_info import load_track_info, save_track_info
 from ..userfile.track_map import load_track_map_file, save_track_map_file
@@ -29,6 +31,7 @@ class Realtime(DataModule):
         output = minfo.mapping
 
         recorder = MapRecorder(userpath_track_map)
+        curve_grades = create_curve_grades(self.cfg.user.config["track_map_viewer"])
 
         while not _event_wait(update_interval):
             if realtime_state.active:
@@ -41,7 +44,12 @@ class Realtime(DataModule):
                     if recorder.map_exist:
                         output.coordinates = recorder.output.coords
                         output.elevations = recorder.output.dists
+                        output.coordinatesLOD = MapLOD(output.coordinates)
+                        output.elevationsLOD = MapLOD(output.elevations, vertical=True)
+                        output.mapIndex = MapIndex(output.coordinates, output.elevations)
                         output.sectors = recorder.output.sectors
+                        output.corners = detect_corners(
+                            output.coordinates, output.elevations, curve_grades)
                         output.lastModified = recorder.last_modified
                     else:
                         recorder.reset()
@@ -59,6 +67,9 @@ class Realtime(DataModule):
                 # Update track info
                 gen_track_info.send(True)
 
+                # Notify data changes
+                minfo.publish_changes("mapping")
+
             else:
                 if reset:
                     reset = False
@@ -73,6 +84,7 @@ def update_track_info(output: MappingInfo, track_name: str):
     pit_entry = load_track_info(track_name).get("pit_entry", 0.0)
     pit_exit = load_track_info(track_name).get("pit_exit", 0.0)
     pit_speed = load_track_info(track_name).get("pit_speed", 0.0)
+    api.set_pit_entry(pit_entry)
     # Set default
     pos_last = 0.0
     last_speed = 0.0
@@ -111,6 +123,7 @@ def update_track_info(output: MappingInfo, track_name: str):
             if last_in_pits != -1 and api.read.vehicle.speed() > 1:  # avoid ESC desync
                 if in_pits > 0:  # entering pit
                     pit_entry = max(api.read.lap.distance(), 0.0)
+                    api.set_pit_entry(pit_entry)
                 else:  # exiting pit
                     pit_exit = max(api.read.lap.distance(), 0.0)
             last_in_pits = in_pits
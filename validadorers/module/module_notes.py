@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from typing import Callable, Mapping
 
-from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_file import FileExt
-from ..module_info import NotesInfo, minfo
+from ..module_info import DistanceCursor, NotesInfo, minfo
 from ..userfile.track_notes import (
     COLUMN_DISTANCE,
     HEADER_PACE_NOTES,
@@ -80,7 +79,7 @@ class Realtime(DataModule):
                         )
 
                 # Update position
-                pos_synced = minfo.delta.lapDistance
+                pos_synced = minfo.multicar.player.delta.lapDistance
 
                 # Update pace notes
                 if pace_notes:
@@ -90,6 +89,10 @@ class Realtime(DataModule):
                 if track_notes:
                     gen_tracknotes.send(pos_synced)
 
+                # Notify data changes
+                minfo.publish_changes("pacenotes")
+                minfo.publish_changes("tracknotes")
+
             else:
                 if reset:
                     reset = False
@@ -125,14 +128,14 @@ def notes_selector(output: NotesInfo, dataset: list[Mapping]):
     """
     last_index = -99999  # make sure initial index is different
     next_index = 0  # next note line index
-    end_index = len(dataset) - 1  # end note line index
     pos_reference = reference_position(dataset)
     pos_final = pos_reference[-1]  # final reference position
+    cursor = DistanceCursor(pos_reference)
     output.reset()  # initial reset before updating
 
     while True:
         pos_curr = yield
-        curr_index = calc.binary_search_lower(pos_reference, pos_curr, 0, end_index)
+        curr_index = cursor.seek(pos_curr)
 
         if last_index == curr_index:
             continue
@@ -99,6 +99,9 @@ class Realtime(DataModule):
                 output.classes = class_pos_list
                 output.drawOrder = draw_order_list
 
+                # Notify data changes
+                minfo.publish_changes("relative")
+
             else:
                 if reset:
                     reset = False
@@ -77,6 +77,9 @@ class Realtime(DataModule):
                 gen_calc_sectors_session.send(tele_sectors)
                 gen_calc_sectors_alltime.send(tele_sectors)
 
+                # Notify data changes
+                minfo.publish_changes("sectors")
+
             else:
                 if reset:
                     reset = False
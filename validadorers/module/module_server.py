@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from math import isfinite
+from time import monotonic
+
+from .. import realtime_state
+from ..async_loop import async_loop
+from ..async_request import (
+    WEBSOCKET_CLOSE,
+    WEBSOCKET_PING,
+    WEBSOCKET_PONG,
+    parse_request,
+    read_websocket_frame,
+    set_response_header,
+    set_websocket_accept,
+    websocket_frame,
+)
+from ..module_info import ModuleInfo, minfo
+from ._base import DataModule
+
+logger = logging.getLogger(__name__)
+json_encoder = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+
+PUBLISHED_BLOCKS = ("relative", "vehicles", "delta", "fuel", "energy", "sectors", "wheels")
+DATA_MODULE = ModuleInfo.__module__  # only serialize data classes from module info
+MAX_CLIENTS = 16
+CLIENT_BUFFER_LIMIT = 1048576  # drop client if unsent data exceeds limit (bytes)
+REQUEST_TIMEOUT = 5
+SKIP = object()
+
+
+class Realtime(DataModule):
+    """Overlay data server"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        publishers = tuple(
+            BlockPublisher(name, self.mcfg[f"update_interval_{name}"] / 1000)
+            for name in PUBLISHED_BLOCKS
+            if self.mcfg.get(f"update_interval_{name}", 0) > 0
+        )
+        server = OverlayServer(publishers)
+        try:
+            async_loop.run(self.serve(server))
+        except OSError as error:
+            logger.error("OverlayServer: %s", error)
+
+    async def serve(self, server: OverlayServer):
+        """Serve clients & broadcast new frames until module stopped"""
+        host = self.mcfg["url_host"]
+        port = int(self.mcfg["url_port"])
+        listener = await asyncio.start_server(server.handle_client, host, port)
+        logger.info("OverlayServer: listening on %s:%s", host, port)
+        _event_is_set = self._event.is_set
+        async with listener:
+            while not _event_is_set():
+                server.broadcast(monotonic())
+                if realtime_state.active:
+                    await asyncio.sleep(self.active_interval)
+                else:
+                    await asyncio.sleep(self.idle_interval)
+            server.close()
+        logger.info("OverlayServer: stopped")
+
+
+class OverlayServer:
+    """Overlay data server
+
+    HTTP GET:
+        /: full snapshot of all published blocks (JSON).
+        /<block name>: full snapshot of single block (JSON).
+    WebSocket (upgrade request on any path):
+        Full frame of each block is sent on connect, then delta frames.
+
+    Frame (compact JSON text):
+        {"block": block name, "version": block version, "full": full frame, "data": fields}
+
+    Delta frame only contains changed fields. For list field of objects
+    (such as vehicles dataSet), changed items are sent as object of
+    {"item index": changed fields}, which applies to list by index.
+    """
+
+    __slots__ = (
+        "publishers",
+        "clients",
+        "_snapshot",
+        "_snapshot_versions",
+    )
+
+    def __init__(self, publishers: tuple[BlockPublisher, ...]):
+        self.publishers = publishers
+        self.clients: dict[asyncio.StreamWriter, None] = {}
+        self._snapshot = b""
+        self._snapshot_versions: tuple[int, ...] = ()
+
+    def broadcast(self, now: float):
+        """Encode new versions of info blocks once & fan out to all clients"""
+        for publisher in self.publishers:
+            frame = publisher.update(now)
+            if not frame:
+                continue
+            for writer in tuple(self.clients):
+                if writer.transport.get_write_buffer_size() > CLIENT_BUFFER_LIMIT:
+                    logger.info("OverlayServer: dropped slow client")
+                    self.clients.pop(writer, None)
+                    writer.close()
+                else:
+                    writer.write(frame)
+
+    def close(self):
+        """Close all clients"""
+        for writer in tuple(self.clients):
+            writer.close()
+        self.clients.clear()
+
+    def snapshot(self) -> bytes:
+        """Full snapshot of all blocks, serialized once per versions"""
+        versions = tuple(publisher.version for publisher in self.publishers)
+        if self._snapshot_versions != versions:
+            self._snapshot_versions = versions
+            self._snapshot = json_encoder.encode({
+                publisher.name: publisher.state for publisher in self.publishers
+            }).encode()
+        return self._snapshot
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle client connection"""
+        try:
+            path, headers = await asyncio.wait_for(parse_request(reader), REQUEST_TIMEOUT)
+            if not path:
+                writer.write(set_response_header("405 Method Not Allowed", "text/plain"))
+            elif headers.get("upgrade", "").lower() == "websocket" and "sec-websocket-key" in headers:
+                if len(self.clients) >= MAX_CLIENTS:
+                    writer.write(set_response_header("503 Service Unavailable", "text/plain"))
+                else:
+                    writer.write(set_websocket_accept(headers["sec-websocket-key"]))
+                    for publisher in self.publishers:
+                        writer.write(publisher.full_frame())
+                    self.clients[writer] = None
+                    await self.receive(reader, writer)
+            else:
+                body = self.get_body(path.strip("/"))
+                if body:
+                    writer.write(set_response_header(
+                        "200 OK", "application/json", len(body),
+                        "Access-Control-Allow-Origin: *", "Cache-Control: no-store") + body)
+                else:
+                    writer.write(set_response_header("404 Not Found", "text/plain"))
+            await writer.drain()
+        except (ConnectionError, EOFError, OSError, TimeoutError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    def get_body(self, name: str) -> bytes:
+        """Get HTTP response body of all blocks or single block"""
+        if not name:
+            return self.snapshot()
+        for publisher in self.publishers:
+            if publisher.name == name:
+                return json_encoder.encode(publisher.state).encode()
+        return b""
+
+    async def receive(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle websocket control frames until client closed"""
+        while True:
+            opcode, payload = await read_websocket_frame(reader)
+            if opcode == WEBSOCKET_CLOSE:
+                writer.write(websocket_frame(payload[:2], WEBSOCKET_CLOSE))
+                return
+            if opcode == WEBSOCKET_PING:
+                writer.write(websocket_frame(payload, WEBSOCKET_PONG))
+
+
+class BlockPublisher:
+    """Info block frame publisher
+
+    Keeps last sent state of info block. New version of info block is converted
+    & compared once, changed fields are encoded as single delta frame shared by
+    all clients. Full frame for new clients is rebuilt on demand once per version.
+
+    Attributes:
+        name: info block name.
+        interval: minimum publish interval (seconds).
+        version: last published info block version.
+        state: last published fields (JSON compatible).
+    """
+
+    __slots__ = (
+        "name",
+        "interval",
+        "version",
+        "state",
+        "_raw",
+        "_next_time",
+        "_full_frame",
+        "_full_version",
+    )
+
+    def __init__(self, name: str, interval: float):
+        self.name = name
+        self.interval = interval
+        self.version = -1
+        self.state: dict = {}
+        self._raw: dict = {}
+        self._next_time = 0.0
+        self._full_frame = b""
+        self._full_version = -1
+
+    def update(self, now: float) -> bytes:
+        """Encode delta frame of new version, empty if not due or not changed"""
+        if now < self._next_time:
+            return b""
+        version = minfo.versions[self.name]
+        if self.version == version:
+            return b""
+        self.version = version
+        self._next_time = now + self.interval
+        changed = self.refresh(getattr(minfo, self.name))
+        if not changed:
+            return b""
+        return encode_frame(self.name, version, False, changed)
+
+    def refresh(self, info: object) -> dict:
+        """Update state from info block, returns changed fields
+
+        Vehicle data set is converted in full on each version, costs
+        O(vehicles * fields) per publish interval. Vehicle items are modified
+        in place without per item version, and position fields of vehicles
+        on track change on every update, so items are not skipped.
+        """
+        state = self.state
+        last_raw = self._raw
+        changed = {}
+        for name in info.__slots__:
+            value = getattr(info, name)
+            if name == "dataSet":  # preallocated, only active vehicles
+                value = value[:info.totalVehicles]
+            # Replaced (not modified) on change, such as delta best data
+            elif type(value) is tuple and last_raw.get(name) is value:
+                continue
+            last_raw[name] = value
+            new_value = jsonable(value)
+            if new_value is SKIP:
+                continue
+            last_value = state.get(name, SKIP)
+            if last_value != new_value:
+                changed[name] = delta_value(last_value, new_value)
+                state[name] = new_value
+        return changed
+
+    def full_frame(self) -> bytes:
+        """Full frame of last published version"""
+        if self._full_version != self.version or not self._full_frame:
+            self._full_version = self.version
+            self._full_frame = encode_frame(self.name, self.version, True, self.state)
+        return self._full_frame
+
+
+def encode_frame(name: str, version: int, full: bool, data: dict) -> bytes:
+    """Encode websocket text frame"""
+    return websocket_frame(json_encoder.encode({
+        "block": name,
+        "version": version,
+        "full": full,
+        "data": data,
+    }).encode())
+
+
+def jsonable(value):
+    """Convert info value to JSON compatible value, SKIP if not data value"""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, 4) if isfinite(value) else None
+    if isinstance(value, (list, tuple, array, deque)):
+        return [None if item is SKIP else item for item in map(jsonable, value)]
+    if isinstance(value, Mapping):
+        return {
+            str(key): item for key, item in zip(value.keys(), map(jsonable, value.values()))
+            if item is not SKIP
+        }
+    if type(value).__module__ == DATA_MODULE and hasattr(value, "__slots__"):
+        names = value.__slots__
+        return {
+            name: item for name, item in zip(names, map(jsonable, map(value.__getattribute__, names)))
+            if item is not SKIP and name[0] != "_"
+        }
+    return SKIP  # internal object, such as timing loop
+
+
+def delta_value(last_value, new_value):
+    """Changed items by index for list of objects, otherwise new value"""
+    if (
+        type(last_value) is list
+        and type(new_value) is list
+        and len(last_value) == len(new_value)
+        and new_value
+        and type(last_value[0]) is dict
+        and type(new_value[0]) is dict
+    ):
+        return {
+            str(index): delta_fields(last_item, new_item)
+            for index, (last_item, new_item) in enumerate(zip(last_value, new_value))
+            if last_item != new_item
+        }
+    return new_value
+
+
+def delta_fields(last_fields: dict, new_fields: dict) -> dict:
+    """Changed fields of object"""
+    return {
+        name: delta_value(last_fields.get(name, SKIP), value)
+        for name, value in new_fields.items()
+        if last_fields.get(name, SKIP) != value
+    }
@@ -137,6 +137,9 @@ class Realtime(DataModule):
                 # Output stats data
                 output.metersDriven = driver_stats.meters + loaded_stats.meters
 
+                # Notify data changes
+                minfo.publish_changes("stats")
+
             else:
                 if reset:
                     reset = False
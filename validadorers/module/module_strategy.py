@@ -0,0 +1,92 @@
+
+
+from .. import realtime_state
+from ..api_control import api
+from ..module_info import minfo
+from ..strategy import StrategySetup, simulate_strategy
+from ._base import DataModule
+
+
+class Realtime(DataModule):
+    """Pit stop & fuel strategy simulation"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.idle_interval
+
+        output = minfo.strategy
+        max_plans = max(int(self.mcfg["maximum_ranked_plans"]), 1)
+        extra_stops = max(int(self.mcfg["maximum_extra_pit_stops"]), 0)
+        tyre_degradation = max(self.mcfg["tyre_degradation_per_lap"], 0)
+        last_setup = None
+
+        while not _event_wait(update_interval):
+            if realtime_state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    output.reset()
+                    last_setup = None
+
+                setup = live_strategy_setup(extra_stops, tyre_degradation)
+                if setup != last_setup:
+                    last_setup = setup
+                    output.plans, output.evaluatedPlans = simulate_strategy(setup, max_plans)
+                    output.isEnergy = api.read.vehicle.max_virtual_energy() > 0
+
+                # Notify data changes
+                minfo.publish_changes("strategy")
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+
+def live_strategy_setup(extra_stops: int, tyre_degradation: float) -> StrategySetup:
+    """Create strategy setup from live data"""
+    service = api.read.vehicle.pit_service_time()
+    player = minfo.multicar.player
+    if api.read.vehicle.max_virtual_energy():
+        usage = player.energy
+        refill_base = service.energy_base
+        refill_rate = service.energy_fill_rate
+        refill_concurrent = service.energy_concurrent
+    else:
+        usage = player.fuel
+        refill_base = service.fuel_base
+        refill_rate = service.fuel_fill_rate
+        refill_concurrent = service.fuel_concurrent
+
+    consumption = usage.estimatedValidConsumption
+    laps = usage.neededAbsolute / consumption if consumption > 0 else 0.0
+    if api.read.session.lap_type():
+        race_seconds = 0.0
+    else:  # round to reduce re-simulation while timer counts down
+        race_seconds = round(max(api.read.session.remaining(), 0.0), -1)
+    return StrategySetup(
+        laps=round(laps, 1),
+        laptime=round(player.delta.lapTimePace, 1),
+        consumption=round(consumption, 3),
+        capacity=usage.capacity,
+        amount_start=round(usage.amountCurrent, 1),
+        pit_pass_time=minfo.mapping.pitPassTime,
+        refill_base=refill_base,
+        refill_rate=refill_rate,
+        refill_concurrent=refill_concurrent,
+        tyre_change_time=service.tyre_change,
+        tyre_concurrent=service.tyre_concurrent,
+        tyre_tread=round(min(player.wheels.currentTreadDepth), 1),
+        tyre_wear=round(max(player.wheels.estimatedValidTreadWear), 3),
+        tyre_degradation=tyre_degradation,
+        extra_stops=extra_stops,
+        race_seconds=race_seconds,
+    )
@@ -0,0 +1,107 @@
+
+
+import threading
+from time import strftime
+
+from .. import realtime_state
+from ..api_control import api
+from ..const_common import FLOAT_INF
+from ..userfile.telemetry_log import TelemetryBuffer, save_telemetry_lap
+from ._base import DataModule
+
+
+class Realtime(DataModule):
+    """Lap telemetry logger"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.idle_interval
+
+        userpath_telemetry = self.cfg.path.delta_best
+        max_samples = max(self.mcfg["maximum_samples_per_lap"], 100)
+        # Double buffer, record into one buffer while saving the other
+        buffers = (TelemetryBuffer(max_samples), TelemetryBuffer(max_samples))
+        buffer_index = 0
+        saver = None
+
+        while not _event_wait(update_interval):
+            if realtime_state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+
+                    combo_name = api.read.session.combo_name()
+                    track_name = api.read.session.track_name()
+                    buffer = buffers[buffer_index]
+                    buffer.reset()
+                    recording = False  # start recording from next lap start
+                    is_pit_lap = 0
+                    last_lap_stime = FLOAT_INF
+
+                # Lap start & finish detection
+                lap_stime = api.read.timing.start()
+                if lap_stime != last_lap_stime:
+                    if recording and lap_stime > last_lap_stime:
+                        if saver is not None:
+                            saver.join()
+                        lap_number = api.read.lap.number() - 1
+                        lap_info = {
+                            "track_name": track_name,
+                            "lap_number": lap_number,
+                            "laptime": lap_stime - last_lap_stime,
+                            "pit_lap": bool(is_pit_lap),
+                            "truncated": buffer.is_full(),
+                        }
+                        saver = threading.Thread(
+                            target=save_telemetry_lap,
+                            args=(
+                                userpath_telemetry,
+                                combo_name,
+                                f"{strftime('%Y%m%d-%H%M%S')}-{lap_number:03d}",
+                                lap_info,
+                                buffer,
+                            ),
+                            daemon=True,
+                        )
+                        saver.start()
+                        buffer_index ^= 1
+                        buffer = buffers[buffer_index]
+                    # Discard partial lap (first lap or session restart)
+                    recording = last_lap_stime != FLOAT_INF
+                    is_pit_lap = 0
+                    last_lap_stime = lap_stime
+                    buffer.reset()
+
+                is_pit_lap |= api.read.vehicle.in_pits()
+
+                if recording:
+                    buffer.record(
+                        api.read.lap.distance(),
+                        api.read.timing.current_laptime(),
+                        api.read.vehicle.speed(),
+                        api.read.inputs.throttle(),
+                        api.read.inputs.brake(),
+                        api.read.inputs.steering(),
+                        api.read.engine.gear(),
+                        api.read.engine.rpm(),
+                        api.read.tyre.surface_temperature_avg(),
+                        api.read.tyre.pressure(),
+                        api.read.vehicle.position_xyz(),
+                    )
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+        # Wait last lap saved before exit
+        if saver is not None:
+            saver.join()
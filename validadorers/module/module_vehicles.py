@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+from functools import partial
+from operator import itemgetter
+
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import MAX_METERS, MAX_SECONDS
-from ..module_info import VehicleDataSet, VehiclesInfo, minfo
+from ..gap_history import NAN
+from ..module_info import (
+    TRACKED_CARS_SEPARATOR,
+    TrackedCar,
+    VehicleDataSet,
+    VehiclesInfo,
+    minfo,
+)
+from ..proximity import ClosingPrediction
+from ..race_projection import RaceProjection
+from ..timing_loop import TimingLoop
 from ..validator import state_timer
 from ._base import DataModule
 
@@ -28,8 +41,22 @@ class Realtime(DataModule):
         output = minfo.vehicles
         max_lap_diff_ahead = self.mcfg["lap_difference_ahead_threshold"]
         max_lap_diff_behind = self.mcfg["lap_difference_behind_threshold"]
+        mini_sectors = self.mcfg["number_of_mini_sectors"]
+        output.proximity.max_range = max(self.mcfg["proximity_range"], 0)
+        prediction = ClosingPrediction()
+        prediction_range = max(self.mcfg["closing_prediction_range"], 0)
+        approaching_speed = max(self.mcfg["approaching_speed_threshold"], 0.1)
+        approaching_time = max(self.mcfg["approaching_time_threshold"], 0)
 
         gen_low_priority_timer = state_timer(0.2)
+        projection = RaceProjection()
+
+        # Multi-car mode
+        telemetry_api = self.cfg.telemetry_api
+        if telemetry_api["enable_multi_car_mode"]:
+            minfo.track_cars(telemetry_api["multi_car_vehicle_names"].split(TRACKED_CARS_SEPARATOR))
+        else:
+            minfo.track_cars(())
 
         while not _event_wait(update_interval):
             if not realtime_state.paused:
@@ -39,34 +66,65 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
                     output.dataSetVersion = -1
                     last_veh_total = 0
+                    projection.reset()
+                    output.timingLoop.resize(api.read.lap.track_length())
+                    output.miniSectors.resize(api.read.lap.track_length(), mini_sectors)
+                    output.gapHistory.reset()
+                    prediction.reset()
 
                 veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
                 if veh_total > 0:
+                    update_low_priority = next(gen_low_priority_timer)
                     update_vehicle_data(
                         output,
                         minfo.relative.classes,
                         max_lap_diff_ahead,
                         max_lap_diff_behind,
-                        next(gen_low_priority_timer),
+                        update_low_priority,
+                        prediction,
                     )
+                    update_closing_prediction(
+                        output, prediction, prediction_range, approaching_speed, approaching_time)
+                    if update_low_priority:
+                        update_race_projection(output, projection)
+                    update_tracked_cars(minfo.multicar.cars, veh_total, update_low_priority)
 
                 if last_veh_total != veh_total:
                     last_veh_total = veh_total
                     if veh_total > 0:
                         update_qualify_position(output)
 
+                # Notify data changes
+                minfo.publish_changes("vehicles")
+
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
 
 
+def update_tracked_cars(cars: tuple[TrackedCar, ...], veh_total: int, rescan_missing: bool):
+    """Update scoring index of tracked cars (multi-car mode), rescan if vehicle index changed"""
+    for car in cars[1:]:  # skip local player
+        index = car.index
+        if 0 <= index < veh_total:
+            if api.read.vehicle.vehicle_name(index) == car.name:
+                continue
+        elif not rescan_missing:
+            continue
+        car.index = next(
+            (index for index in range(veh_total) if api.read.vehicle.vehicle_name(index) == car.name),
+            -1,
+        )
+
+
 def update_vehicle_data(
     output: VehiclesInfo,
     class_pos_list: list,
     max_lap_diff_ahead: float,
     max_lap_diff_behind: float,
     update_low_priority: bool,
+    prediction: ClosingPrediction,
 ) -> None:
     """Update vehicle data"""
     # General data
@@ -74,11 +132,21 @@ def update_vehicle_data(
     in_race = api.read.session.in_race()
     elapsed_time = api.read.timing.elapsed()
 
-    nearest_line = MAX_METERS
+    proximity = output.proximity
     nearest_time_behind = -MAX_SECONDS
     nearest_yellow_ahead = MAX_METERS
     nearest_yellow_behind = -MAX_METERS
 
+    timing_loop = output.timingLoop
+    if timing_loop.track_length != track_length:
+        timing_loop.resize(track_length)
+    mini_sectors = output.miniSectors
+    if mini_sectors.track_length != track_length:
+        mini_sectors.resize(track_length, mini_sectors.sectors)
+    update_timing_loop = track_length > 0
+    gap_history = output.gapHistory
+    gap_history.begin_update(elapsed_time)
+
     # Local player data
     plr_lap_distance = api.read.lap.distance()
     plr_lap_progress_total = api.read.lap.completed_laps() + calc.lap_progress_distance(plr_lap_distance, track_length)
@@ -89,8 +157,10 @@ def update_vehicle_data(
     for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, class_pos_list):
         # Temp var only
         laps_completed = api.read.lap.completed_laps(index)
-        lap_distance = api.read.lap.distance(index)
+        lap_distance = calc.lap_distance_correction(
+            api.read.lap.distance(index), track_length, api.read.timing.current_laptime(index))
         speed = api.read.vehicle.speed(index)
+        slot_id = api.read.vehicle.slot_id(index)
 
         # Update high priority info
         data.isPlayer = api.read.vehicle.is_player(index)
@@ -98,9 +168,20 @@ def update_vehicle_data(
         data.totalLapProgress = laps_completed + data.currentLapProgress
         data.isYellow = speed < 8
         data.inPit = api.read.vehicle.in_paddock(index)
-        data.pitTimer.update(api.read.vehicle.slot_id(index), data.inPit, elapsed_time, laps_completed, speed)
+        data.pitTimer.update(slot_id, data.inPit, elapsed_time, laps_completed, speed)
         data.worldPositionX = api.read.vehicle.position_longitudinal(index)
         data.worldPositionY = api.read.vehicle.position_lateral(index)
+        prediction.record(index, slot_id, data.worldPositionX, data.worldPositionY, elapsed_time)
+
+        if update_timing_loop:
+            total_distance = laps_completed * track_length + lap_distance
+            timing_loop.update(index, slot_id, total_distance, elapsed_time)
+            mini_sectors.update(
+                index, slot_id, api.read.vehicle.class_name(index),
+                total_distance, elapsed_time, not data.inPit)
+
+        # Gap history
+        gap_history.update(index, slot_id, laps_completed, api.read.timing.start(index))
 
         if data.isPlayer:
             output.playerIndex = index
@@ -131,9 +212,8 @@ def update_vehicle_data(
                 max_lap_diff_ahead, max_lap_diff_behind
             ) if in_race else 0
 
-            # Nearest straight line distance (non local players)
-            if nearest_line > data.relativeStraightDistance:
-                nearest_line = data.relativeStraightDistance
+            # Nearby vehicles by straight line distance (non local players)
+            proximity.add(data.relativeStraightDistance, index)
             # Nearest traffic time gap (opponents behind local players)
             if not data.inPit:
                 opt_time_behind = calc.circular_relative_distance(
@@ -173,8 +253,10 @@ def update_vehicle_data(
 
             data.gapBehindNext = calc_gap_behind_next(index)
             data.gapBehindLeader = calc_gap_behind_leader(index)
-            data.gapBehindNextInClass = calc_time_gap_behind(opt_index_ahead, index, track_length, data.totalLapProgress)
-            data.gapBehindLeaderInClass = calc_time_gap_behind(opt_index_leader, index, track_length, data.totalLapProgress)
+            data.gapBehindNextInClass = calc_time_gap_behind(
+                opt_index_ahead, index, track_length, data.totalLapProgress, timing_loop)
+            data.gapBehindLeaderInClass = calc_time_gap_behind(
+                opt_index_leader, index, track_length, data.totalLapProgress, timing_loop)
 
             data.vehicleIntegrity = api.read.vehicle.integrity(index)
             data.lapTimeHistory.update(api.read.timing.start(index), elapsed_time, data.lastLapTime)
@@ -186,14 +268,67 @@ def update_vehicle_data(
                 output.leaderIndex = index
                 output.leaderBestLapTime = data.bestLapTime
 
+    if gap_history.trend_due:
+        gap_history.update_trend(
+            class_order(class_pos_list, output.totalVehicles),
+            partial(calc_trend_interval, output=output, timing_loop=timing_loop),
+        )
+    gap_history.end_update()
+    proximity.commit()
+
     # Output extra info
-    output.nearestLine = nearest_line
+    output.nearestLine = proximity.nearest()
     output.nearestTraffic = -nearest_time_behind
     output.nearestYellowAhead = nearest_yellow_ahead
     output.nearestYellowBehind = nearest_yellow_behind
     output.dataSetVersion += 1
 
 
+def update_closing_prediction(
+    output: VehiclesInfo,
+    prediction: ClosingPrediction,
+    prediction_range: float,
+    approaching_speed: float,
+    approaching_time: float,
+) -> None:
+    """Update closing speed prediction of nearby vehicles & fastest approaching vehicle behind"""
+    plr_index = output.playerIndex
+    candidates = output.proximity.within(prediction_range)
+    prediction.predict(output.dataSet, plr_index, candidates)
+    approaching_index = -1
+    nearest_time = MAX_SECONDS
+    for index in candidates:
+        data = output.dataSet[index]
+        # Behind player (+y) & closing fast
+        if data.relativeRotatedPositionY > 0 and data.closingSpeed >= approaching_speed:
+            time_reach = data.relativeStraightDistance / data.closingSpeed
+            if time_reach <= approaching_time and time_reach < nearest_time:
+                nearest_time = time_reach
+                approaching_index = index
+    output.approachingIndex = approaching_index
+    output.approachingTime = nearest_time
+
+
+def update_race_projection(output: VehiclesInfo, projection: RaceProjection) -> None:
+    """Update timed race end projection from all vehicles pace"""
+    if api.read.session.in_race() and not api.read.session.lap_type():
+        leader_index = output.leaderIndex
+        projection.update(
+            output.dataSet,
+            output.totalVehicles,
+            leader_index,
+            output.playerIndex,
+            api.read.session.remaining(),
+            api.read.vehicle.finish_state(leader_index) == 1,
+        )
+    else:
+        projection.reset()
+    output.leaderFinishTime = projection.leader_finish_time
+    output.leaderFinishLaps = projection.leader_finish_laps
+    output.playerFinishLaps = projection.player_finish_laps
+    output.classFinishLaps = projection.class_finish_laps
+
+
 def update_qualify_position(output: VehiclesInfo) -> None:
     """Update qualify position"""
     temp_class = sorted((
@@ -219,6 +354,7 @@ def calc_time_gap_behind(
     behind_index: int,
     track_length: float,
     lap_progress_total: float,
+    timing_loop: TimingLoop,
 ) -> float:
     """Calculate interval behind next in class"""
     if ahead_index < 0:
@@ -228,7 +364,11 @@ def calc_time_gap_behind(
     lap_diff = opt_lap_progress_total - lap_progress_total
     if lap_diff >= 1 or lap_diff <= -1:  # laps
         return int(abs(lap_diff))
-    # Time gap between driver ahead and behind
+    # Time gap at last shared timing marker
+    time_gap = timing_loop.gap(ahead_index, behind_index)
+    if time_gap >= 0:
+        return time_gap
+    # Fallback to estimated time gap between driver ahead and behind
     time_gap = api.read.timing.estimated_time_into(ahead_index) - api.read.timing.estimated_time_into(behind_index)
     # Check lap diff (positive) for position correction
     # in case the ahead driver is momentarily behind (such as during double-file formation lap)
@@ -237,6 +377,29 @@ def calc_time_gap_behind(
     return abs(time_gap)
 
 
+def class_order(class_pos_list: list, veh_total: int) -> list[tuple[int, int]]:
+    """Vehicle index & index of vehicle ahead in same class, ordered by position in class"""
+    return [
+        (class_pos[0], class_pos[4])
+        for class_pos in sorted(class_pos_list, key=itemgetter(1))
+        if class_pos[0] < veh_total and class_pos[4] < veh_total
+    ]
+
+
+def calc_trend_interval(
+    ahead_index: int, behind_index: int, output: VehiclesInfo, timing_loop: TimingLoop) -> float:
+    """Calculate time interval between vehicle ahead & behind in class for gap trend"""
+    time_gap = timing_loop.gap(ahead_index, behind_index)
+    if time_gap >= 0:
+        return time_gap
+    # Fallback to estimated time from lap progress difference, such as over a lap apart
+    laptime = api.read.timing.estimated_laptime(behind_index)
+    if laptime <= 0:
+        return NAN
+    data_set = output.dataSet
+    return (data_set[ahead_index].totalLapProgress - data_set[behind_index].totalLapProgress) * laptime
+
+
 def calc_gap_behind_next(index: int) -> float:
     """Calculate interval behind next"""
     laps_behind_next = api.read.lap.behind_next(index)
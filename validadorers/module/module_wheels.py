@@ -2,19 +2,20 @@
 
 import logging
 from collections import deque
+from functools import partial
 
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import POS_XY_ZERO, WHEELS_DELTA_DEFAULT, WHEELS_ZERO
-from ..module_info import WheelsInfo, minfo
+from ..module_info import TrackedCar, WheelsInfo, minfo
 from ..userfile.heatmap import (
     brake_failure_thickness,
     save_brake_failure_thickness,
     set_predefined_brake_name,
 )
 from ..validator import generator_init
-from ._base import DataModule
+from ._base import DataModule, sync_tracked_cars
 
 logger = logging.getLogger(__name__)
 
@@ -33,22 +34,15 @@ class Realtime(DataModule):
         reset = False
         update_interval = self.idle_interval
 
-        gen_wheel_rotation = calc_wheel_rotation(
-            output=minfo.wheels,
+        multicar = minfo.multicar
+        last_cars = ()
+        gen_calc_wheels = ()
+        create_calc_wheels = partial(
+            self.create_calc_wheels,
             max_rot_bias_f=max(self.mcfg["maximum_rotation_difference_front"], 0.00001),
             max_rot_bias_r=max(self.mcfg["maximum_rotation_difference_rear"], 0.00001),
             min_rot_axle=max(self.mcfg["minimum_axle_rotation"], 0.0),
-        )
-        gen_tyre_wear = calc_tyre_wear(
-            output=minfo.wheels,
-            min_delta_distance=self.mcfg["minimum_delta_distance"],
-        )
-        gen_brake_wear = calc_brake_wear(
-            output=minfo.wheels,
             min_delta_distance=self.mcfg["minimum_delta_distance"],
-        )
-        gen_cornering_radius = calc_cornering_radius(
-            output=minfo.wheels,
             sampling_interval=self.mcfg["cornering_radius_sampling_interval"],
         )
 
@@ -59,22 +53,67 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
 
-                # Run calculate
-                is_reset = api.read.vehicle.in_garage()
+                # Keep per car calculation of tracked cars
+                cars = multicar.cars
+                if last_cars is not cars:
+                    gen_calc_wheels = sync_tracked_cars(
+                        cars, last_cars, gen_calc_wheels, create_calc_wheels)
+                    last_cars = cars
 
-                gen_wheel_rotation.send(is_reset)
-                gen_tyre_wear.send(is_reset)
-                gen_brake_wear.send(is_reset)
-                gen_cornering_radius.send(True)
+                # Run calculate
+                for car, gen_wheels in zip(cars, gen_calc_wheels):
+                    if car.index == -1:
+                        continue
+                    is_reset = api.read.vehicle.in_garage(car.index)
+                    gen_wheel_rotation, gen_tyre_wear, gen_brake_wear, gen_cornering_radius = gen_wheels
+                    gen_wheel_rotation.send(is_reset)
+                    gen_tyre_wear.send(is_reset)
+                    gen_brake_wear.send(is_reset)
+                    gen_cornering_radius.send(True)
+
+                # Notify data changes
+                minfo.publish_changes("wheels")
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
 
+    @staticmethod
+    def create_calc_wheels(
+        car: TrackedCar, max_rot_bias_f: float, max_rot_bias_r: float, min_rot_axle: float,
+        min_delta_distance: float, sampling_interval: int):
+        """Create wheels calculation of tracked car"""
+        return (
+            calc_wheel_rotation(
+                output=car.wheels,
+                car=car,
+                max_rot_bias_f=max_rot_bias_f,
+                max_rot_bias_r=max_rot_bias_r,
+                min_rot_axle=min_rot_axle,
+            ),
+            calc_tyre_wear(
+                output=car.wheels,
+                car=car,
+                min_delta_distance=min_delta_distance,
+            ),
+            calc_brake_wear(
+                output=car.wheels,
+                car=car,
+                min_delta_distance=min_delta_distance,
+            ),
+            calc_cornering_radius(
+                output=car.wheels,
+                car=car,
+                sampling_interval=sampling_interval,
+            ),
+        )
+
 
 @generator_init
-def calc_wheel_rotation(output: WheelsInfo, max_rot_bias_f: float, max_rot_bias_r: float, min_rot_axle: float):
+def calc_wheel_rotation(
+    output: WheelsInfo, car: TrackedCar, max_rot_bias_f: float, max_rot_bias_r: float,
+    min_rot_axle: float):
     """Calculate wheel rotation, radius, locking percent, slip ratio"""
     last_reset = None  # reset check
 
@@ -87,6 +126,7 @@ def calc_wheel_rotation(output: WheelsInfo, max_rot_bias_f: float, max_rot_bias_
 
     while True:
         reset = yield None
+        index = car.index
 
         # Reset
         if last_reset != reset:
@@ -94,16 +134,16 @@ def calc_wheel_rotation(output: WheelsInfo, max_rot_bias_f: float, max_rot_bias_
             last_accel_max = 0.0
             locking_f = 1.0
             locking_r = 1.0
-            if vehicle_name != api.read.vehicle.vehicle_name():
-                vehicle_name = api.read.vehicle.vehicle_name()
+            if vehicle_name != api.read.vehicle.vehicle_name(index):
+                vehicle_name = api.read.vehicle.vehicle_name(index)
                 radius_front_ema = 0.0
                 radius_rear_ema = 0.0
 
-        wheel_rot = api.read.wheel.rotation()
-        speed = api.read.vehicle.speed()
+        wheel_rot = api.read.wheel.rotation(index)
+        speed = api.read.vehicle.speed(index)
         accel_max = max(
-            abs(api.read.vehicle.accel_lateral()),
-            abs(api.read.vehicle.accel_longitudinal()),
+            abs(api.read.vehicle.accel_lateral(index)),
+            abs(api.read.vehicle.accel_longitudinal(index)),
         )
 
         # Get wheel axle rotation and difference
@@ -138,7 +178,7 @@ def calc_wheel_rotation(output: WheelsInfo, max_rot_bias_f: float, max_rot_bias_
 
 
 @generator_init
-def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
+def calc_tyre_wear(output: WheelsInfo, car: TrackedCar, min_delta_distance: float):
     """Calculate tyre wear & delta wear"""
     last_reset = None  # reset check
 
@@ -156,6 +196,7 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
 
     while True:
         reset = yield None
+        index = car.index
 
         # Reset
         if last_reset != reset:
@@ -169,11 +210,11 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
             last_lap_stime = 0.0
             output.lastLapTreadWear[:] = WHEELS_ZERO
 
-        tread_curr_set = api.read.tyre.wear()
-        lap_stime = api.read.timing.start()
-        laptime_curr = api.read.timing.current_laptime()
-        pos_curr = api.read.lap.distance()
-        in_pits = api.read.vehicle.in_pits()
+        tread_curr_set = api.read.tyre.wear(index)
+        lap_stime = api.read.timing.start(index)
+        laptime_curr = api.read.timing.current_laptime(index)
+        pos_curr = api.read.lap.distance(index)
+        in_pits = api.read.vehicle.in_pits(index)
         is_pit_lap |= in_pits
 
         if lap_stime != last_lap_stime:
@@ -243,7 +284,7 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
                 est_wear = calc.wear_weighted(
                     tread_wear_curr[idx],
                     tread_wear_valid[idx],
-                    api.read.lap.progress(),
+                    api.read.lap.progress(index),
                 )
                 est_valid_wear = est_wear
 
@@ -254,8 +295,9 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
 
 
 @generator_init
-def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
-    """Calculate brake wear"""
+def calc_brake_wear(output: WheelsInfo, car: TrackedCar, min_delta_distance: float):
+    """Calculate brake wear, brake failure is only recorded for local player"""
+    is_player = car.index is None
     last_reset = None  # reset check
 
     last_lap_stime = 0.0  # last lap start time
@@ -274,6 +316,7 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
 
     while True:
         reset = yield None
+        index = car.index
 
         # Reset
         if last_reset != reset:
@@ -287,16 +330,17 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
             is_valid_delta = False
             last_lap_stime = 0.0
             output.lastLapBrakeWear[:] = WHEELS_ZERO
-            output.failureBrakeThickness[:] = brake_failure_thickness(api.read.vehicle.class_name(), api.read.vehicle.vehicle_name())
+            output.failureBrakeThickness[:] = brake_failure_thickness(
+                api.read.vehicle.class_name(index), api.read.vehicle.vehicle_name(index))
 
-        brake_curr_set = api.read.brake.wear()
-        if -1.0 in brake_curr_set:
+        brake_curr_set = api.read.brake.wear(index)
+        if -1.0 in brake_curr_set:  # not available, or not local player
             continue
 
-        lap_stime = api.read.timing.start()
-        laptime_curr = api.read.timing.current_laptime()
-        pos_curr = api.read.lap.distance()
-        in_pits = api.read.vehicle.in_pits()
+        lap_stime = api.read.timing.start(index)
+        laptime_curr = api.read.timing.current_laptime(index)
+        pos_curr = api.read.lap.distance(index)
+        in_pits = api.read.vehicle.in_pits(index)
         is_pit_lap |= in_pits
 
         if lap_stime != last_lap_stime:
@@ -340,7 +384,7 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
             # Log brake failure
             if brake_curr > 0:
                 failure_record[idx] = brake_curr
-            elif failure_record[idx] > 0:
+            elif failure_record[idx] > 0 and is_player:
                 logger.info(
                     "%s brake failed at %s(mm)",
                     ("Front left", "Front right", "Rear left", "Rear right")[idx],
@@ -398,7 +442,7 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
 
 
 @generator_init
-def calc_cornering_radius(output: WheelsInfo, sampling_interval: int):
+def calc_cornering_radius(output: WheelsInfo, car: TrackedCar, sampling_interval: int):
     """Calculate cornering radius"""
     gps_last = POS_XY_ZERO
     min_coords = min(max(sampling_interval, 5), 100)
@@ -407,7 +451,8 @@ def calc_cornering_radius(output: WheelsInfo, sampling_interval: int):
     while True:
         yield None
 
-        gps_curr = (api.read.vehicle.position_longitudinal(), api.read.vehicle.position_lateral())
+        index = car.index
+        gps_curr = (api.read.vehicle.position_longitudinal(index), api.read.vehicle.position_lateral(index))
 
         # Calculate cornering radius based on tri-coordinates position
         if gps_last != gps_curr:
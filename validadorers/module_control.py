@@ -77,7 +77,7 @@ class ModuleControl:
         else:
             cfg.user.setting[name]["enable"] = True
             self.__start_selected(name)
-        cfg.save()
+        cfg.save(section=name)
 
     def enable_all(self):
         """Enable all modules"""
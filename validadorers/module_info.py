@@ -3,17 +3,29 @@ from __future__ import annotations
 
 from array import array
 from collections import deque
-from typing import Mapping, NamedTuple
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence
 
+from .calculation import binary_search_lower
 from .const_common import (
     DELTA_DEFAULT,
     EMPTY_DICT,
+    FLOAT_INF,
     MAX_METERS,
     MAX_SECONDS,
     MAX_VEHICLES,
     REL_TIME_DEFAULT,
     WHEELS_ZERO,
 )
+from .gap_history import GapHistory
+from .map_index import MapIndex, MapLOD
+from .mini_sectors import MiniSectorTiming
+from .proximity import VehicleProximity
+from .strategy import StrategyPlan
+from .timing_loop import TimingLoop
+
+MAX_TRACKED_CARS = 4  # tracked cars besides local player in multi-car mode
+TRACKED_CARS_SEPARATOR = "|"  # tracked vehicle names separator in config
+MULTI_CAR_BLOCKS = ("delta", "fuel", "energy", "wheels")  # module outputs kept per car
 
 
 class ConsumptionDataSet(NamedTuple):
@@ -30,6 +42,215 @@ class ConsumptionDataSet(NamedTuple):
     capacityFuel: float = 0.0
 
 
+class ChannelStats(NamedTuple):
+    """Consumption channel aggregate stats (valid laps only)"""
+
+    count: int = 0
+    mean: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+
+class ConsumptionColumns:
+    """Consumption history columnar data with windowed aggregates
+
+    Each channel is stored as typed column in chronological order (oldest first),
+    bounded to same max laps as consumption history data set.
+
+    Aggregates (mean, min, max) of valid laps within stored laps are updated on append,
+    and corrected on eviction of oldest lap. Min & max are kept with monotonic queues,
+    so reading or updating stats costs O(1) amortized.
+    """
+
+    __slots__ = (
+        "lapNumber",
+        "isValidLap",
+        "lapTimeLast",
+        "lastLapUsedFuel",
+        "lastLapUsedEnergy",
+        "tyreAvgWearLast",
+        "lastValidIndex",
+        "version",
+        "maxLaps",
+        "_first",
+        "_count",
+        "_total",
+        "_minimum",
+        "_maximum",
+    )
+    CHANNELS = ("lapTimeLast", "lastLapUsedFuel", "lastLapUsedEnergy", "tyreAvgWearLast")
+
+    def __init__(self, max_laps: int = 100):
+        self.lapNumber: array = array("i")
+        self.isValidLap: array = array("b")
+        self.lapTimeLast: array = array("d")
+        self.lastLapUsedFuel: array = array("d")
+        self.lastLapUsedEnergy: array = array("d")
+        self.tyreAvgWearLast: array = array("d")
+        self.lastValidIndex: int = -1
+        self.version: int = 0
+        self.maxLaps: int = max(max_laps, 1)
+        # Aggregates, queue item - (lap sequence, value)
+        self._first: int = 0  # lap sequence of oldest stored lap
+        self._count: int = 0
+        self._total: dict[str, float] = {}
+        self._minimum: dict[str, deque[tuple[int, float]]] = {}
+        self._maximum: dict[str, deque[tuple[int, float]]] = {}
+        for channel in self.CHANNELS:
+            self._total[channel] = 0.0
+            self._minimum[channel] = deque()
+            self._maximum[channel] = deque()
+
+    def __len__(self) -> int:
+        return len(self.lapNumber)
+
+    def columns(self) -> tuple[array, ...]:
+        """All columns"""
+        return (
+            self.lapNumber,
+            self.isValidLap,
+            self.lapTimeLast,
+            self.lastLapUsedFuel,
+            self.lastLapUsedEnergy,
+            self.tyreAvgWearLast,
+        )
+
+    def reset(self):
+        """Reset"""
+        for column in self.columns():
+            del column[:]
+        self.lastValidIndex = -1
+        self.version += 1
+        self._first = 0
+        self._count = 0
+        for channel in self.CHANNELS:
+            self._total[channel] = 0.0
+            self._minimum[channel].clear()
+            self._maximum[channel].clear()
+
+    def append(self, data: ConsumptionDataSet):
+        """Append lap data, skip empty placeholder data, drop oldest lap if exceeded max laps"""
+        if data.lapTimeLast <= 0:
+            return
+        if len(self.lapNumber) >= self.maxLaps:
+            self.__evict_oldest()
+        sequence = self._first + len(self.lapNumber)
+        self.lapNumber.append(data.lapNumber)
+        self.isValidLap.append(data.isValidLap)
+        for channel in self.CHANNELS:
+            getattr(self, channel).append(getattr(data, channel))
+        if data.isValidLap:
+            self.lastValidIndex = len(self.lapNumber) - 1
+            self._count += 1
+            for channel in self.CHANNELS:
+                value = getattr(data, channel)
+                self._total[channel] += value
+                minimum = self._minimum[channel]
+                while minimum and minimum[-1][1] >= value:
+                    minimum.pop()
+                minimum.append((sequence, value))
+                maximum = self._maximum[channel]
+                while maximum and maximum[-1][1] <= value:
+                    maximum.pop()
+                maximum.append((sequence, value))
+        self.version += 1
+
+    def __evict_oldest(self):
+        """Drop oldest lap & correct aggregates"""
+        if self.isValidLap[0]:
+            self._count -= 1
+            for channel in self.CHANNELS:
+                if self._count:
+                    self._total[channel] -= getattr(self, channel)[0]
+                else:  # clear accumulated rounding error
+                    self._total[channel] = 0.0
+                minimum = self._minimum[channel]
+                if minimum and minimum[0][0] == self._first:
+                    minimum.popleft()
+                maximum = self._maximum[channel]
+                if maximum and maximum[0][0] == self._first:
+                    maximum.popleft()
+        for column in self.columns():
+            del column[0]
+        self._first += 1
+        if self.lastValidIndex >= 0:
+            self.lastValidIndex -= 1
+
+    def extend(self, dataset: Iterable[ConsumptionDataSet]):
+        """Extend from history data set (newest first order)"""
+        for data in reversed(tuple(dataset)):
+            self.append(data)
+
+    def last_valid(self, channel: str) -> float:
+        """Channel value from last valid lap, 0 if no valid lap"""
+        if self.lastValidIndex < 0:
+            return 0.0
+        return getattr(self, channel)[self.lastValidIndex]
+
+    def stats(self, channel: str) -> ChannelStats:
+        """Channel aggregate stats of valid laps within stored laps"""
+        count = self._count
+        if not count:
+            return ChannelStats()
+        return ChannelStats(
+            count,
+            self._total[channel] / count,
+            self._minimum[channel][0][1],
+            self._maximum[channel][0][1],
+        )
+
+
+class DistanceCursor:
+    """Monotonic track distance cursor
+
+    Seek nearest lower index from ordered reference distance list.
+    Pointer only moves forward while position increases, and resets with binary search
+    if position moves backward (new lap) or jumps far ahead, costs O(1) amortized per tick.
+    """
+
+    __slots__ = (
+        "_reference",
+        "_end",
+        "_index",
+        "_position",
+    )
+    MAX_STEPS = 16  # max forward steps before fall back to binary search
+
+    def __init__(self, reference: Sequence[float] = ()):
+        self._reference: Sequence[float] = reference
+        self._end: int = len(reference) - 1
+        self._index: int = -1
+        self._position: float = FLOAT_INF
+        self.reset(reference)
+
+    def reset(self, reference: Sequence[float] | None = None):
+        """Reset cursor, optionally set new reference distance list"""
+        if reference is not None:
+            self._reference = reference
+            self._end = len(reference) - 1
+        self._index = -1
+        self._position = FLOAT_INF  # search on next seek
+
+    def seek(self, position: float) -> int:
+        """Seek nearest lower reference index, -1 if position before first reference"""
+        reference = self._reference
+        end = self._end
+        if position < self._position:  # moved backward or new lap
+            index = binary_search_lower(reference, position, 0, end)
+        else:
+            index = self._index
+            steps = self.MAX_STEPS
+            while index < end and reference[index + 1] <= position:
+                index += 1
+                steps -= 1
+                if not steps:
+                    index = binary_search_lower(reference, position, index, end)
+                    break
+        self._index = index
+        self._position = position
+        return index
+
+
 class DeltaLapTime(array):
     """Delta lap time history data"""
 
@@ -171,6 +392,9 @@ class VehicleDataSet:
         "worldPositionY",
         "relativeRotatedPositionX",
         "relativeRotatedPositionY",
+        "closingSpeed",
+        "timeToClosestApproach",
+        "closestApproachDistance",
         "vehicleIntegrity",
         "energyRemaining",
         "estimatedStintLaps",
@@ -211,6 +435,9 @@ class VehicleDataSet:
         self.worldPositionY: float = 0.0
         self.relativeRotatedPositionX: float = 0.0
         self.relativeRotatedPositionY: float = 0.0
+        self.closingSpeed: float = 0.0
+        self.timeToClosestApproach: float = -1.0
+        self.closestApproachDistance: float = MAX_METERS
         self.vehicleIntegrity: float = 0.0
         self.energyRemaining: float = 0.0
         self.estimatedStintLaps: float = 0.0
@@ -341,12 +568,14 @@ class HistoryInfo:
         "consumptionDataName",
         "consumptionDataVersion",
         "consumptionDataSet",
+        "consumptionSummary",
     )
 
     def __init__(self):
         self.consumptionDataName: str = ""
         self.consumptionDataVersion: int = 0
         self.consumptionDataSet: deque[ConsumptionDataSet] = deque([ConsumptionDataSet()], 100)
+        self.consumptionSummary: ConsumptionColumns = ConsumptionColumns(self.consumptionDataSet.maxlen)
 
     def reset_consumption(self):
         """Reset consumption data"""
@@ -354,6 +583,20 @@ class HistoryInfo:
         self.consumptionDataVersion = 0
         self.consumptionDataSet.clear()
         self.consumptionDataSet.appendleft(ConsumptionDataSet())
+        self.consumptionSummary.reset()
+
+    def add_consumption(self, data: ConsumptionDataSet):
+        """Add new lap consumption data"""
+        self.consumptionDataSet.appendleft(data)
+        self.consumptionSummary.append(data)
+        self.consumptionDataVersion += 1
+
+    def load_consumption(self, dataset: Iterable[ConsumptionDataSet]):
+        """Load consumption data set (newest first order)"""
+        self.consumptionDataSet.clear()
+        self.consumptionDataSet.extend(dataset)
+        self.consumptionSummary.reset()
+        self.consumptionSummary.extend(self.consumptionDataSet)
 
 
 class HybridInfo:
@@ -393,7 +636,11 @@ class MappingInfo:
     __slots__ = (
         "coordinates",
         "elevations",
+        "coordinatesLOD",
+        "elevationsLOD",
+        "mapIndex",
         "sectors",
+        "corners",
         "lastModified",
         "pitEntryPosition",
         "pitExitPosition",
@@ -409,7 +656,11 @@ class MappingInfo:
         """Reset"""
         self.coordinates: tuple[tuple[float, float], ...] | None = None
         self.elevations: tuple[tuple[float, float], ...] | None = None
+        self.coordinatesLOD: MapLOD | None = None
+        self.elevationsLOD: MapLOD | None = None
+        self.mapIndex: MapIndex | None = None
         self.sectors: tuple[int, int] | None = None
+        self.corners: tuple = ()
         self.lastModified: float = 0.0
         self.pitEntryPosition: float = 0.0
         self.pitExitPosition: float = 0.0
@@ -418,6 +669,68 @@ class MappingInfo:
         self.pitPassTime: float = 0.0
 
 
+class TrackedCar:
+    """Tracked car of multi-car mode
+
+    Attributes:
+        name: vehicle name, empty for local player.
+        index: vehicle scoring index, None for local player, -1 if not found.
+        delta: delta module output of car.
+        fuel: fuel module output of car.
+        energy: energy module output of car.
+        wheels: wheels module output of car.
+    """
+
+    __slots__ = (
+        "name",
+        "index",
+        "delta",
+        "fuel",
+        "energy",
+        "wheels",
+    )
+
+    def __init__(
+        self,
+        name: str = "",
+        index: int | None = -1,
+        delta: DeltaInfo | None = None,
+        fuel: FuelInfo | None = None,
+        energy: FuelInfo | None = None,
+        wheels: WheelsInfo | None = None,
+    ):
+        self.name = name
+        self.index = index
+        self.delta = DeltaInfo() if delta is None else delta
+        self.fuel = FuelInfo() if fuel is None else fuel
+        self.energy = FuelInfo() if energy is None else energy
+        self.wheels = WheelsInfo() if wheels is None else wheels
+
+
+class MultiCarInfo:
+    """Multi-car mode data
+
+    Tracked cars are kept in one tuple, first car is always local player.
+    Each car keeps its own module outputs, focused car outputs are bound
+    to module output blocks (such as delta, fuel), so switching focus
+    is instant & keeps accumulated state.
+    """
+
+    __slots__ = (
+        "cars",
+        "focus",
+    )
+
+    def __init__(self, player: TrackedCar):
+        self.cars: tuple[TrackedCar, ...] = (player,)
+        self.focus: int = 0
+
+    @property
+    def player(self) -> TrackedCar:
+        """Local player car"""
+        return self.cars[0]
+
+
 class NotesInfo:
     """Notes module output data"""
 
@@ -490,6 +803,25 @@ class StatsInfo:
         self.metersDriven: float = 0.0
 
 
+class StrategyInfo:
+    """Strategy module output data"""
+
+    __slots__ = (
+        "plans",
+        "evaluatedPlans",
+        "isEnergy",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset"""
+        self.plans: tuple[StrategyPlan, ...] = ()
+        self.evaluatedPlans: int = 0
+        self.isEnergy: bool = False
+
+
 class VehiclesInfo:
     """Vehicles module output data"""
 
@@ -501,9 +833,19 @@ class VehiclesInfo:
         "dataSetVersion",
         "nearestLine",
         "nearestTraffic",
+        "approachingIndex",
+        "approachingTime",
         "nearestYellowAhead",
         "nearestYellowBehind",
         "leaderBestLapTime",
+        "leaderFinishTime",
+        "leaderFinishLaps",
+        "playerFinishLaps",
+        "classFinishLaps",
+        "timingLoop",
+        "miniSectors",
+        "gapHistory",
+        "proximity",
     )
 
     def __init__(self):
@@ -516,9 +858,19 @@ class VehiclesInfo:
         self.dataSetVersion: int = -1
         self.nearestLine: float = MAX_METERS
         self.nearestTraffic: float = MAX_SECONDS
+        self.approachingIndex: int = -1
+        self.approachingTime: float = MAX_SECONDS
         self.nearestYellowAhead: float = MAX_METERS
         self.nearestYellowBehind: float = -MAX_METERS
         self.leaderBestLapTime: float = MAX_SECONDS
+        self.leaderFinishTime: float = -1.0
+        self.leaderFinishLaps: int = 0
+        self.playerFinishLaps: int = 0
+        self.classFinishLaps: Mapping[str, int] = EMPTY_DICT
+        self.timingLoop: TimingLoop = TimingLoop()
+        self.miniSectors: MiniSectorTiming = MiniSectorTiming()
+        self.gapHistory: GapHistory = GapHistory()
+        self.proximity: VehicleProximity = VehicleProximity()
 
 
 class WheelsInfo:
@@ -558,6 +910,63 @@ class WheelsInfo:
         self.estimatedValidBrakeWear: list[float] = list(WHEELS_ZERO)
 
 
+class InfoSubscriber:
+    """Info block change subscriber
+
+    Marked dirty by publisher whenever any subscribed info block changed.
+    """
+
+    __slots__ = (
+        "names",
+        "_dirty",
+    )
+
+    def __init__(self, names: tuple[str, ...]):
+        self.names = names
+        self._dirty = True  # always update once after subscribed
+
+    def mark(self):
+        """Mark dirty"""
+        self._dirty = True
+
+    def changed(self) -> bool:
+        """Check & clear dirty state"""
+        if self._dirty:
+            self._dirty = False
+            return True
+        return False
+
+
+def info_snapshot(info: object) -> tuple:
+    """Info block value snapshot for comparison"""
+    return tuple(map(snapshot_value, map(info.__getattribute__, info.__slots__)))
+
+
+def snapshot_value(value: Any) -> Any:
+    """Snapshot value that can be modified in place
+
+    Immutable value (including tuple) is compared as is.
+    Array, list, deque, mapping, and slotted data object of module info
+    are copied by value. Other object is compared by its version counter
+    if available, otherwise by identity (should be replaced on change,
+    or change is covered by version field of info block).
+    """
+    if value is None or isinstance(value, (bool, int, float, str, tuple)):
+        return value
+    if isinstance(value, array):
+        return value.tobytes()
+    if isinstance(value, (list, deque)):
+        return tuple(map(snapshot_value, value))
+    if isinstance(value, Mapping):
+        return tuple(zip(value.keys(), map(snapshot_value, value.values())))
+    version = getattr(value, "version", None)
+    if type(version) is int:
+        return id(value), version
+    if type(value).__module__ == __name__ and hasattr(value, "__slots__"):
+        return tuple(map(snapshot_value, map(value.__getattribute__, value.__slots__)))
+    return value
+
+
 class ModuleInfo:
     """Modules output data"""
 
@@ -569,13 +978,18 @@ class ModuleInfo:
         "history",
         "hybrid",
         "mapping",
+        "multicar",
         "pacenotes",
         "relative",
         "sectors",
         "stats",
+        "strategy",
         "tracknotes",
         "vehicles",
         "wheels",
+        "versions",
+        "_snapshots",
+        "_subscribers",
     )
 
     def __init__(self):
@@ -590,9 +1004,83 @@ class ModuleInfo:
         self.relative = RelativeInfo()
         self.sectors = SectorsInfo()
         self.stats = StatsInfo()
+        self.strategy = StrategyInfo()
         self.tracknotes = NotesInfo()
         self.vehicles = VehiclesInfo()
         self.wheels = WheelsInfo()
+        self.multicar = MultiCarInfo(
+            TrackedCar("", None, self.delta, self.fuel, self.energy, self.wheels)
+        )
+        # Data change notification
+        names = self.__slots__[:-3]
+        self.versions: dict[str, int] = dict.fromkeys(names, 0)
+        self._snapshots: dict[str, tuple] = dict.fromkeys(names, ())
+        self._subscribers: dict[str, tuple[InfoSubscriber, ...]] = dict.fromkeys(names, ())
+
+    def track_cars(self, names: Iterable[str]):
+        """Set tracked cars of multi-car mode, keep state of already tracked cars
+
+        Args:
+            names: vehicle names of tracked cars, local player is always tracked.
+        """
+        multicar = self.multicar
+        focused = multicar.cars[multicar.focus].name
+        existing = {car.name: car for car in multicar.cars}
+        cars = [multicar.player]
+        for name in names:
+            if name and len(cars) <= MAX_TRACKED_CARS and all(car.name != name for car in cars):
+                cars.append(existing.get(name) or TrackedCar(name))
+        multicar.cars = tuple(cars)
+        self.focus_car(next(
+            (position for position, car in enumerate(cars) if car.name == focused), 0))
+
+    def focus_car(self, position: int):
+        """Focus tracked car, bind car outputs to module output blocks"""
+        multicar = self.multicar
+        if not 0 <= position < len(multicar.cars):
+            position = 0
+        multicar.focus = position
+        car = multicar.cars[position]
+        for name in MULTI_CAR_BLOCKS:
+            setattr(self, name, getattr(car, name))
+            self.publish(name)
+        self.publish("multicar")
+
+    def subscribe(self, *names: str) -> InfoSubscriber:
+        """Subscribe info block change notification
+
+        Args:
+            names: info block names, such as "fuel", "delta".
+
+        Returns:
+            Subscriber that is marked dirty when any subscribed info block changed.
+        """
+        subscriber = InfoSubscriber(names)
+        for name in names:
+            self._subscribers[name] += (subscriber,)
+        return subscriber
+
+    def unsubscribe(self, subscriber: InfoSubscriber):
+        """Unsubscribe info block change notification"""
+        for name in subscriber.names:
+            self._subscribers[name] = tuple(
+                _sub for _sub in self._subscribers[name] if _sub is not subscriber
+            )
+
+    def publish(self, name: str):
+        """Publish info block change, increase version & mark subscribers dirty"""
+        self.versions[name] += 1
+        for subscriber in self._subscribers[name]:
+            subscriber.mark()
+
+    def publish_changes(self, name: str) -> bool:
+        """Publish info block change only if any value changed since last check"""
+        snapshot = info_snapshot(getattr(self, name))
+        if self._snapshots[name] == snapshot:
+            return False
+        self._snapshots[name] = snapshot
+        self.publish(name)
+        return True
 
 
 minfo = ModuleInfo()
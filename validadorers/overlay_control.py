@@ -37,7 +37,7 @@ class OverlayToggle:
     def __toggle_option(option_name: str):
         """Toggle option"""
         cfg.overlay[option_name] = not cfg.overlay[option_name]
-        cfg.save()
+        cfg.save(section="overlay")
 
 
 class OverlayControl:
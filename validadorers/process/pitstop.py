@@ -2,10 +2,44 @@
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
 from ..const_common import EMPTY_DICT, PITEST_DEFAULT
 from ..regex_pattern import rex_number_extract
 
 
+class PitServiceTime(NamedTuple):
+    """Pit service reference time, for strategy simulation"""
+
+    fuel_base: float = 0.0  # fixed fuel insert & remove time (seconds)
+    fuel_fill_rate: float = 0.0  # liter per second
+    fuel_concurrent: bool = True
+    energy_base: float = 0.0  # fixed virtual energy insert & remove time (seconds)
+    energy_fill_rate: float = 0.0  # percent per second
+    energy_concurrent: bool = True
+    tyre_change: float = 0.0  # four tyre change (seconds)
+    tyre_concurrent: bool = True
+
+
+SERVICE_TIME_DEFAULT = PitServiceTime()
+
+
+def parse_service_time(ref_time: dict) -> PitServiceTime:
+    """Parse pit service reference time from pit stop times"""
+    if not isinstance(ref_time, dict):
+        return SERVICE_TIME_DEFAULT
+    return PitServiceTime(
+        fuel_base=ref_time.get("FuelInsert", 0) + ref_time.get("FuelRemove", 0),
+        fuel_fill_rate=ref_time.get("FuelFillRate", 0),
+        fuel_concurrent=bool(ref_time.get("FuelTimeConcurrent", 0)),
+        energy_base=ref_time.get("virtualEnergyInsert", 0) + ref_time.get("virtualEnergyRemove", 0),
+        energy_fill_rate=ref_time.get("virtualEnergyFillRate", 0) * 100,
+        energy_concurrent=bool(ref_time.get("virtualEnergyTimeConcurrent", 0)),
+        tyre_change=ref_time.get("FourTireChange", 0),
+        tyre_concurrent=bool(ref_time.get("TireTimeConcurrent", 0)),
+    )
+
+
 # Set state & counter
 def set_stopgo_state(raw: dict, ref_time: dict, temp: EstimatePitTime):
     """Set stop-go penalty state"""
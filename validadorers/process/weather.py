@@ -1,7 +1,8 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from array import array
+from math import ceil
 from typing import NamedTuple
 
 from ..const_common import ABS_ZERO_CELSIUS, MAX_SECONDS
@@ -18,6 +19,8 @@ class WeatherNode(NamedTuple):
 
 FORECAST_DEFAULT = (WeatherNode(),)
 FORECAST_NODES_RF2 = ("START", "NODE_25", "NODE_50", "NODE_75", "FINISH")
+TIMELINE_STEP = 30.0  # seconds per timeline sample
+MAX_TIMELINE_SAMPLES = 2880  # 24 hours at 30 seconds step, step increases for longer session
 
 
 def forecast_rf2(data: dict) -> tuple[WeatherNode, ...]:
@@ -37,7 +40,17 @@ def forecast_rf2(data: dict) -> tuple[WeatherNode, ...]:
     return output
 
 
-@lru_cache(maxsize=2)
+# Sky type from rain percent, index = rounded up rain percent (1-60)
+RAIN_SKY_TYPE = tuple(
+    5 if rain <= 10 else
+    6 if rain <= 15 else
+    7 if rain <= 20 else
+    8 if rain <= 40 else
+    9
+    for rain in range(61)
+)
+
+
 def forecast_sky_type(sky_type: int, raininess: float) -> int:
     """Correct current sky type index based on current raininess
 
@@ -61,16 +74,138 @@ def forecast_sky_type(sky_type: int, raininess: float) -> int:
         if sky_type > 4:
             return 4
         return 0
-    if 0 < raininess <= 10:
-        return 5
-    if 10 < raininess <= 15:
-        return 6
-    if 15 < raininess <= 20:
-        return 7
-    if 20 < raininess <= 40:
-        return 8
-    if 40 < raininess <= 60:
-        return 9
     if 60 < raininess:
         return 10
+    if 0 < raininess <= 60:
+        return RAIN_SKY_TYPE[ceil(raininess)]
     return sky_type
+
+
+class WeatherTimeline:
+    """Compiled weather forecast timeline
+
+    Temperature & rain chance are linearly interpolated between forecast nodes,
+    sky type is from last started node and corrected by rain chance.
+    Samples are precomputed at TIMELINE_STEP seconds over session length
+    (forecast horizon), so lookup at any session time is a constant time index.
+    Samples are only recompiled if session length changed.
+
+    Attributes:
+        nodes: source forecast nodes.
+        session_length: compiled session length (seconds).
+        step: seconds per sample.
+        node_index: index of last started forecast node, -1 if not available.
+        sky_type: sky type samples, -1 if not available.
+        temperature: temperature samples (celsius).
+        rain_chance: rain chance samples (percent), -1 if not available.
+    """
+
+    __slots__ = (
+        "nodes",
+        "session_length",
+        "step",
+        "node_index",
+        "sky_type",
+        "temperature",
+        "rain_chance",
+    )
+
+    def __init__(self, nodes: tuple[WeatherNode, ...]):
+        self.nodes = nodes
+        self.compile(0.0)
+
+    def compile(self, session_length: float):
+        """Compile forecast samples over session length (seconds)"""
+        if session_length > 0:
+            samples = min(ceil(session_length / TIMELINE_STEP), MAX_TIMELINE_SAMPLES)
+        else:
+            samples = 1
+        total = samples + 1
+        node_index = array("b", [-1] * total)
+        sky_type = array("b", [-1] * total)
+        temperature = array("d", [ABS_ZERO_CELSIUS] * total)
+        rain_chance = array("d", [-1.0] * total)
+
+        nodes = self.nodes
+        valid = sorted(
+            (index for index, node in enumerate(nodes)
+             if node.sky_type >= 0 and 0 <= node.start_percent <= 1),
+            key=lambda index: nodes[index].start_percent,
+        )
+        last_valid = len(valid) - 1
+        valid_index = 0
+        for index in range(total if valid else 0):
+            percent = index / samples
+            while valid_index < last_valid and nodes[valid[valid_index + 1]].start_percent <= percent:
+                valid_index += 1
+            node = nodes[valid[valid_index]]
+            if valid_index < last_valid and percent >= node.start_percent:
+                next_node = nodes[valid[valid_index + 1]]
+                ratio = (percent - node.start_percent) / (next_node.start_percent - node.start_percent)
+                node_temp = node.temperature + (next_node.temperature - node.temperature) * ratio
+                node_rain = node.rain_chance + (next_node.rain_chance - node.rain_chance) * ratio
+            else:
+                node_temp = node.temperature
+                node_rain = node.rain_chance
+            node_index[index] = valid[valid_index]
+            sky_type[index] = forecast_sky_type(node.sky_type, node_rain)
+            temperature[index] = node_temp
+            rain_chance[index] = node_rain
+
+        self.session_length = session_length
+        self.step = session_length / samples
+        self.node_index = node_index
+        self.sky_type = sky_type
+        self.temperature = temperature
+        self.rain_chance = rain_chance
+
+    def sample_index(self, seconds: float, session_length: float) -> int:
+        """Sample index at session elapsed seconds, recompile if session length changed"""
+        if self.session_length != session_length:
+            self.compile(session_length)
+        if seconds <= 0 or self.step <= 0:
+            return 0
+        return min(round(seconds / self.step), len(self.node_index) - 1)
+
+    def at_time(self, seconds: float, session_length: float) -> WeatherNode:
+        """Forecast at session elapsed seconds"""
+        index = self.sample_index(seconds, session_length)
+        return WeatherNode(
+            start_percent=index * self.step / session_length if session_length > 0 else 0.0,
+            sky_type=self.sky_type[index],
+            temperature=self.temperature[index],
+            rain_chance=self.rain_chance[index],
+        )
+
+    def node_at(self, seconds: float, session_length: float) -> int:
+        """Index of last started forecast node at session elapsed seconds, -1 if not available"""
+        return self.node_index[self.sample_index(seconds, session_length)]
+
+    def node_minutes(self, seconds: float, session_length: float) -> tuple[int, ...]:
+        """Minutes away from start of each forecast node"""
+        return tuple(
+            round((node.start_percent * session_length - seconds) / 60)
+            for node in self.nodes
+        )
+
+
+TIMELINE_DEFAULT = WeatherTimeline(FORECAST_DEFAULT)
+
+
+class ForecastParser:
+    """Weather forecast parser
+
+    Compile forecast into timeline only when REST forecast data changed,
+    output same timeline object while unchanged.
+    """
+
+    __slots__ = ("_last",)
+
+    def __init__(self):
+        self._last = TIMELINE_DEFAULT
+
+    def __call__(self, data: dict) -> WeatherTimeline:
+        nodes = forecast_rf2(data)
+        if self._last.nodes != nodes:
+            self._last = WeatherTimeline(nodes)
+        return self._last
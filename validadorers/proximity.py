@@ -0,0 +1,176 @@
+
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+from .const_common import MAX_METERS, MAX_VEHICLES
+
+HISTORY_SAMPLES = 8  # position samples kept per vehicle for velocity
+
+
+class VehicleProximity:
+    """Player-centred vehicle proximity list
+
+    Holds opponents within max range of player, sorted by straight line distance,
+    so range query is a binary search instead of scanning all vehicles.
+
+    Attributes:
+        max_range: max range (meters) of collected vehicles.
+        vehicles: (straight line distance, vehicle index) sorted by distance.
+    """
+
+    __slots__ = (
+        "max_range",
+        "vehicles",
+        "_candidates",
+    )
+
+    def __init__(self, max_range: float = MAX_METERS):
+        self.max_range = max(max_range, 0.0)
+        self.vehicles: tuple[tuple[float, int], ...] = ()
+        self._candidates: list[tuple[float, int]] = []
+
+    def add(self, distance: float, index: int):
+        """Add vehicle candidate, skip if out of max range"""
+        if distance <= self.max_range:
+            self._candidates.append((distance, index))
+
+    def commit(self):
+        """Sort candidates & publish new list"""
+        candidates = self._candidates
+        candidates.sort()
+        self.vehicles = tuple(candidates)
+        candidates.clear()
+
+    def nearest(self) -> float:
+        """Nearest vehicle distance, MAX_METERS if no vehicle in range"""
+        vehicles = self.vehicles
+        if vehicles:
+            return vehicles[0][0]
+        return MAX_METERS
+
+    def covers(self, distance: float) -> bool:
+        """Whether range query within distance is complete"""
+        return distance <= self.max_range
+
+    def within(self, distance: float) -> tuple[int, ...]:
+        """Vehicle indexes within distance, nearest first"""
+        vehicles = self.vehicles
+        end = bisect_right(vehicles, (distance, MAX_VEHICLES))
+        return tuple(vehicles[pos][1] for pos in range(end))
+
+
+class ClosingPrediction:
+    """Closing speed & closest approach prediction
+
+    Keeps short world position history of each vehicle in preallocated ring
+    arrays, velocity is averaged over history. Relative velocity to player
+    is projected to find time & distance of closest approach, prediction is
+    only computed for proximity candidates.
+    """
+
+    __slots__ = (
+        "_pos_x",
+        "_pos_y",
+        "_time",
+        "_count",
+        "_slot_id",
+        "_last_candidates",
+    )
+
+    def __init__(self, max_vehicles: int = MAX_VEHICLES):
+        total = max_vehicles * HISTORY_SAMPLES
+        self._pos_x = array("d", bytes(8 * total))
+        self._pos_y = array("d", bytes(8 * total))
+        self._time = array("d", bytes(8 * total))
+        self._count = array("l", [0] * max_vehicles)
+        self._slot_id = array("q", [-1] * max_vehicles)
+        self._last_candidates: tuple[int, ...] = ()
+
+    def reset(self):
+        """Clear all history"""
+        for index in range(len(self._slot_id)):
+            self._slot_id[index] = -1
+            self._count[index] = 0
+        self._last_candidates = ()
+
+    def record(self, index: int, slot_id: int, pos_x: float, pos_y: float, elapsed_time: float):
+        """Record vehicle world position sample, skip if time not changed"""
+        count = self._count[index]
+        if self._slot_id[index] != slot_id:
+            self._slot_id[index] = slot_id
+            count = 0
+        elif count:
+            last_time = self._time[index * HISTORY_SAMPLES + (count - 1) % HISTORY_SAMPLES]
+            if elapsed_time == last_time:
+                return
+            if elapsed_time < last_time:
+                count = 0
+        pos = index * HISTORY_SAMPLES + count % HISTORY_SAMPLES
+        self._pos_x[pos] = pos_x
+        self._pos_y[pos] = pos_y
+        self._time[pos] = elapsed_time
+        self._count[index] = count + 1
+
+    def velocity(self, index: int) -> tuple[float, float] | None:
+        """Average velocity (x, y) over history, None if not enough samples"""
+        count = self._count[index]
+        if count < 2:
+            return None
+        base = index * HISTORY_SAMPLES
+        newest = base + (count - 1) % HISTORY_SAMPLES
+        oldest = base + max(count - HISTORY_SAMPLES, 0) % HISTORY_SAMPLES
+        time_diff = self._time[newest] - self._time[oldest]
+        if time_diff <= 0:
+            return None
+        return (
+            (self._pos_x[newest] - self._pos_x[oldest]) / time_diff,
+            (self._pos_y[newest] - self._pos_y[oldest]) / time_diff,
+        )
+
+    def predict(self, data_set, player_index: int, candidates: tuple[int, ...]):
+        """Update closing speed & closest approach of candidates relative to player
+
+        Args:
+            data_set: vehicle data set.
+            player_index: local player index.
+            candidates: vehicle indexes to predict.
+        """
+        for index in self._last_candidates:
+            if index not in candidates:
+                data = data_set[index]
+                data.closingSpeed = 0.0
+                data.timeToClosestApproach = -1.0
+                data.closestApproachDistance = MAX_METERS
+        self._last_candidates = candidates
+        if player_index < 0:
+            return
+        player = data_set[player_index]
+        plr_velocity = self.velocity(player_index)
+        for index in candidates:
+            data = data_set[index]
+            velocity = self.velocity(index)
+            if plr_velocity is None or velocity is None:
+                data.closingSpeed = 0.0
+                data.timeToClosestApproach = -1.0
+                data.closestApproachDistance = MAX_METERS
+                continue
+            rel_x = data.worldPositionX - player.worldPositionX
+            rel_y = data.worldPositionY - player.worldPositionY
+            vel_x = velocity[0] - plr_velocity[0]
+            vel_y = velocity[1] - plr_velocity[1]
+            dot = rel_x * vel_x + rel_y * vel_y
+            distance = data.relativeStraightDistance
+            data.closingSpeed = -dot / distance if distance > 0 else 0.0
+            vel_sq = vel_x * vel_x + vel_y * vel_y
+            if dot < 0 and vel_sq > 0:
+                time_closest = -dot / vel_sq
+                miss_x = rel_x + vel_x * time_closest
+                miss_y = rel_y + vel_y * time_closest
+                data.timeToClosestApproach = time_closest
+                data.closestApproachDistance = (miss_x * miss_x + miss_y * miss_y) ** 0.5
+            else:  # moving apart
+                data.timeToClosestApproach = -1.0
+                data.closestApproachDistance = distance
@@ -0,0 +1,150 @@
+
+
+from __future__ import annotations
+
+from math import ceil
+from typing import Sequence
+
+from .const_common import MAX_SECONDS
+
+PACE_OUTLIER_RATIO = 1.07  # exclude lap time slower than fastest recent lap by ratio (pit, yellow)
+
+
+def recent_pace(laptimes: Sequence[float], fallback: float = 0.0) -> float:
+    """Average pace from recent lap times, exclude invalid & outlier lap times
+
+    Args:
+        laptimes: recent lap times, 0 for invalid lap time.
+        fallback: pace if no valid lap time.
+    """
+    valid = [laptime for laptime in laptimes if 0 < laptime < MAX_SECONDS]
+    if not valid:
+        return fallback if 0 < fallback < MAX_SECONDS else 0.0
+    limit = min(valid) * PACE_OUTLIER_RATIO
+    valid = [laptime for laptime in valid if laptime <= limit]
+    return sum(valid) / len(valid)
+
+
+def next_crossing_after(lap_progress: float, pace: float, target_time: float) -> tuple[int, float]:
+    """Finish line crossing after target time
+
+    Args:
+        lap_progress: total lap progress (completed laps + current lap fraction).
+        pace: lap time (seconds).
+        target_time: seconds from now.
+
+    Returns:
+        Total completed laps at crossing, seconds from now to crossing.
+    """
+    lap_completed = int(lap_progress)
+    first_crossing = (1 - (lap_progress - lap_completed)) * pace
+    if target_time > first_crossing:
+        extra_laps = ceil((target_time - first_crossing) / pace)
+    else:
+        extra_laps = 0
+    return lap_completed + 1 + extra_laps, first_crossing + extra_laps * pace
+
+
+class RaceProjection:
+    """Timed race end projection
+
+    Leader takes checkered flag on first finish line crossing after race timer
+    ended, then every other vehicle finishes on its next crossing.
+    Pace of each vehicle is cached and only recomputed on new lap,
+    update costs O(vehicles).
+
+    Attributes:
+        leader_finish_time: seconds from now until leader finishes, -1 if not available.
+        leader_finish_laps: leader total laps at finish, 0 if not available.
+        player_finish_laps: player total laps at finish, 0 if not available.
+        class_finish_laps: class leader total laps at finish, key = class name.
+    """
+
+    __slots__ = (
+        "leader_finish_time",
+        "leader_finish_laps",
+        "player_finish_laps",
+        "class_finish_laps",
+        "_pace_cache",
+    )
+
+    def __init__(self):
+        self._pace_cache: dict[int, tuple[float, float]] = {}  # index: (lap start, pace)
+        self.reset()
+
+    def reset(self):
+        """Reset"""
+        self.leader_finish_time: float = -1.0
+        self.leader_finish_laps: int = 0
+        self.player_finish_laps: int = 0
+        self.class_finish_laps: dict[str, int] = {}
+        self._pace_cache.clear()
+
+    def pace(self, index: int, data) -> float:
+        """Vehicle pace from lap time history, recompute on new lap only"""
+        history = data.lapTimeHistory
+        cached = self._pace_cache.get(index)
+        if cached is not None and cached[0] == history[5]:
+            return cached[1]
+        pace = recent_pace(history[:5], data.lastLapTime if data.lastLapTime > 0 else data.bestLapTime)
+        self._pace_cache[index] = (history[5], pace)
+        return pace
+
+    def update(
+        self,
+        dataset: Sequence,
+        total_vehicles: int,
+        leader_index: int,
+        player_index: int,
+        seconds_remain: float,
+        leader_finished: bool,
+    ):
+        """Update projection
+
+        Args:
+            dataset: vehicle data set.
+            total_vehicles: total vehicles.
+            leader_index: overall leader index.
+            player_index: local player index.
+            seconds_remain: race timer remaining seconds.
+            leader_finished: whether leader already took checkered flag.
+        """
+        self.class_finish_laps = {}
+        if not 0 <= leader_index < total_vehicles:
+            self.leader_finish_time = -1.0
+            self.leader_finish_laps = self.player_finish_laps = 0
+            return
+
+        # Leader finish
+        leader = dataset[leader_index]
+        if leader_finished:
+            self.leader_finish_time = 0.0
+            self.leader_finish_laps = int(leader.totalLapProgress)
+        else:
+            pace = self.pace(leader_index, leader)
+            if pace <= 0:
+                self.leader_finish_time = -1.0
+                self.leader_finish_laps = self.player_finish_laps = 0
+                return
+            self.leader_finish_laps, self.leader_finish_time = next_crossing_after(
+                leader.totalLapProgress, pace, max(seconds_remain, 0.0))
+
+        # Vehicles finish on next crossing after leader finished
+        finish_time = self.leader_finish_time
+        self.player_finish_laps = 0
+        for index in range(total_vehicles):
+            data = dataset[index]
+            is_class_leader = data.positionInClass == 1
+            if index != player_index and not is_class_leader:
+                continue
+            if index == leader_index:
+                finish_laps = self.leader_finish_laps
+            else:
+                pace = self.pace(index, data)
+                if pace <= 0:
+                    continue
+                finish_laps = next_crossing_after(data.totalLapProgress, pace, finish_time)[0]
+            if index == player_index:
+                self.player_finish_laps = finish_laps
+            if is_class_leader:
+                self.class_finish_laps[data.vehicleClass] = finish_laps
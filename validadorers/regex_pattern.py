@@ -53,6 +53,7 @@ CFG_USER_IMAGE = "_image_file"
 CFG_STRING = (
     # Exact match
     "^process_id$|"
+    "^multi_car_vehicle_names$|"
     "^url_host$|"
     "^LMU$|"
     "^RF2$|"
@@ -74,6 +75,8 @@ CFG_INTEGER = (
     "^lap_time_history_count$|"
     "^leading_zero$|"
     "^manual_steering_range$|"
+    "^maximum_extra_pit_stops$|"
+    "^maximum_ranked_plans$|"
     "^maximum_saving_attempts$|"
     "^player_index$|"
     "^parts_width$|"
@@ -81,6 +84,7 @@ CFG_INTEGER = (
     "^parts_max_width$|"
     "^position_x$|"
     "^position_y$|"
+    "^request_endpoint_count$|"
     "^snap_distance$|"
     "^snap_gap$|"
     "^stint_history_count$|"
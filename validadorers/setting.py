@@ -23,6 +23,7 @@ from .template.setting_tracks import TRACKS_DEFAULT
 from .template.setting_widget import WIDGET_DEFAULT
 from .userfile import set_user_data_path
 from .userfile.json_setting import (
+    JsonFileWriter,
     copy_setting,
     load_setting_json_file,
     load_style_json_file,
@@ -136,6 +137,8 @@ class Setting:
     __slots__ = (
         "_save_delay",
         "_save_queue",
+        "_save_lock",
+        "_save_writers",
         "_setting_to_load",
         "is_saving",
         "version_update",
@@ -155,6 +158,8 @@ class Setting:
         # States
         self._save_delay = 0
         self._save_queue = {}
+        self._save_lock = threading.Lock()
+        self._save_writers = {}
         self._setting_to_load = ""
         self.is_saving = False
         self.version_update = 0
@@ -310,9 +315,13 @@ class Setting:
             max_attempts=self.max_saving_attempts,
         )
 
-    def save(self, delay: int = 66, cfg_type: str = ConfigType.SETTING, next_task: bool = False):
+    def save(
+        self, delay: int = 66, cfg_type: str = ConfigType.SETTING, next_task: bool = False,
+        section: str = ""):
         """Save trigger, limit to one save operation for a given period.
 
+        All queued config types are saved together in one flush after delay.
+
         Args:
             count:
                 Set time delay(count) that can be refreshed before starting saving thread.
@@ -321,7 +330,24 @@ class Setting:
                 Set saving config type.
             next_task:
                 Skip adding save task, run next save task in queue.
+            section:
+                Changed top-level section name, only changed sections are re-serialized.
+                All sections are re-serialized if not specified.
         """
+        with self._save_lock:
+            self.__add_save_task(cfg_type, next_task, section)
+
+            if not self._save_queue:
+                return
+
+            self._save_delay = delay
+
+            if not self.is_saving:
+                self.is_saving = True
+                threading.Thread(target=self.__saving).start()
+
+    def __add_save_task(self, cfg_type: str, next_task: bool, section: str):
+        """Add save task to queue, merge changed sections if already queued"""
         if not next_task:
             filename = getattr(self.filename, cfg_type, None)
             # Check if valid file name
@@ -330,8 +356,16 @@ class Setting:
             # Check if file is locked
             elif filename in self.user.filelock:
                 logger.info("USERDATA: %s is locked, changes not saved", filename)
+            # Merge changed section into queued task
+            elif filename in self._save_queue:
+                dirty = self._save_queue[filename][3]
+                if dirty is not None:
+                    if section:
+                        dirty.add(section)
+                    else:
+                        self._save_queue[filename] = (*self._save_queue[filename][:3], None)
             # Add to save queue
-            elif filename not in self._save_queue:
+            else:
                 # Save to global config path
                 if cfg_type == ConfigType.CONFIG:
                     filepath = self.path.config
@@ -341,43 +375,47 @@ class Setting:
                 else:
                     filepath = self.path.settings
                 dict_user = getattr(self.user, cfg_type)
-                self._save_queue[filename] = (filepath, dict_user)
-
-        for queue_filename, queue_filedata in self._save_queue.items():
-            break  # get next file in queue
-        else:
-            return
-
-        self._save_delay = delay
+                self._save_queue[filename] = (
+                    filepath, dict_user, cfg_type, {section} if section else None)
 
-        if not self.is_saving:
-            self.is_saving = True
-            threading.Thread(
-                target=self.__saving,
-                args=(queue_filename, *queue_filedata),
-            ).start()
-
-    def __saving(self, filename: str, filepath: str, dict_user: dict):
-        """Saving thread"""
+    def __saving(self):
+        """Saving thread, flush all files in save queue"""
         # Update save delay
         while self._save_delay > 0:
             self._save_delay -= 1
             sleep(0.01)
 
-        save_and_verify_json_file(
-            dict_user=dict_user,
-            filename=filename,
-            filepath=filepath,
-            max_attempts=self.max_saving_attempts,
-        )
-
-        self._save_queue.pop(filename, None)
-        self.is_saving = False
-        self.version_update += 1
-
-        # Run next save task in save queue if any
-        if self._save_queue:
-            self.save(0, next_task=True)
+        # Take queued tasks, tasks added while saving are queued for next flush
+        with self._save_lock:
+            save_queue = self._save_queue
+            self._save_queue = {}
+
+        for filename, (filepath, dict_user, _, dirty) in save_queue.items():
+            save_and_verify_json_file(
+                dict_user=dict_user,
+                filename=filename,
+                filepath=filepath,
+                max_attempts=self.max_saving_attempts,
+                writer=self.__get_writer(filename, filepath),
+                dirty=dirty,
+            )
+
+        with self._save_lock:
+            self.version_update += 1
+            # Run next flush with last requested save delay if any added while saving
+            if self._save_queue:
+                threading.Thread(target=self.__saving).start()
+            else:
+                self.is_saving = False
+
+    def __get_writer(self, filename: str, filepath: str) -> JsonFileWriter:
+        """Get incremental json writer"""
+        filename_source = f"{filepath}{filename}"
+        writer = self._save_writers.get(filename_source)
+        if writer is None:
+            writer = JsonFileWriter()
+            self._save_writers[filename_source] = writer
+        return writer
 
     @property
     def max_saving_attempts(self) -> int:
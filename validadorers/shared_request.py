@@ -0,0 +1,163 @@
+
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+from .async_loop import async_loop
+from .async_request import get_response
+
+LATENCY_EMA_FACTOR = 0.1
+
+
+class RequestStats:
+    """Request statistics of endpoint
+
+    Attributes:
+        requests: total requests sent.
+        errors: total failed requests (no data).
+        coalesced: total requests joined to in-flight request.
+        cached: total requests served from response cache.
+        latency: last request latency (seconds).
+        latencyAvg: average request latency (seconds).
+        latencyMax: max request latency (seconds).
+    """
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "coalesced",
+        "cached",
+        "latency",
+        "latencyAvg",
+        "latencyMax",
+    )
+
+    def __init__(self):
+        self.requests: int = 0
+        self.errors: int = 0
+        self.coalesced: int = 0
+        self.cached: int = 0
+        self.latency: float = 0.0
+        self.latencyAvg: float = 0.0
+        self.latencyMax: float = 0.0
+
+    def record(self, latency: float, success: bool):
+        """Record request result"""
+        if self.requests:
+            self.latencyAvg += (latency - self.latencyAvg) * LATENCY_EMA_FACTOR
+        else:
+            self.latencyAvg = latency
+        self.requests += 1
+        self.latency = latency
+        if latency > self.latencyMax:
+            self.latencyMax = latency
+        if not success:
+            self.errors += 1
+
+
+class SharedRequest:
+    """Shared request layer
+
+    Concurrent requests for same resource share one in-flight request
+    (single-flight), and response can be served from short TTL cache.
+    In-flight request is only shared within same event loop, and is added to
+    task group of each caller, so group cancellation also cancels it.
+
+    Attributes:
+        stats: request statistics, key - endpoint (host:port/path), value - RequestStats.
+    """
+
+    __slots__ = (
+        "stats",
+        "_inflight",
+        "_cache",
+    )
+
+    def __init__(self):
+        self.stats: dict[str, RequestStats] = {}
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._cache: dict[tuple, tuple[float, bytes]] = {}
+
+    async def get(
+        self, request: bytes, host: str, port: int, time_out: float,
+        ssl: bool = False, ttl: float = 0.0) -> bytes:
+        """Get response data (bytes), empty if failed
+
+        Args:
+            request: request header.
+            host: host name.
+            port: port number.
+            time_out: request timeout (seconds).
+            ssl: whether use ssl.
+            ttl: max age (seconds) of cached response to reuse, 0 to always request.
+        """
+        key = (host, port, request)
+        if ttl > 0:
+            cache = self._cache.get(key)
+            if cache is not None and monotonic() - cache[0] < ttl:
+                self.endpoint_stats(host, port, request).cached += 1
+                return cache[1]
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.endpoint_stats(host, port, request).coalesced += 1
+        else:
+            task = loop.create_task(self.fetch(key, request, host, port, time_out, ssl))
+            self._inflight[key] = task
+        async_loop.add_task(task)
+        # Shield shared request from cancellation of single caller
+        return await asyncio.shield(task)
+
+    async def fetch(
+        self, key: tuple, request: bytes, host: str, port: int, time_out: float, ssl: bool) -> bytes:
+        """Fetch response & record statistics"""
+        start_time = monotonic()
+        try:
+            raw_bytes = await get_response(request, host, port, time_out, ssl)
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                self._inflight.pop(key, None)
+        finish_time = monotonic()
+        self.endpoint_stats(host, port, request).record(finish_time - start_time, bool(raw_bytes))
+        if raw_bytes:
+            self._cache[key] = (finish_time, raw_bytes)
+        else:
+            self._cache.pop(key, None)
+        return raw_bytes
+
+    def endpoint_stats(self, host: str, port: int, request: bytes) -> RequestStats:
+        """Get endpoint statistics, create if not exist"""
+        endpoint = f"{host}:{port}{request_path(request)}"
+        stats = self.stats.get(endpoint)
+        if stats is None:
+            stats = self.stats[endpoint] = RequestStats()
+        return stats
+
+    def summary(self) -> tuple[int, int, float]:
+        """Summary of all endpoints: total requests, total errors, average latency (seconds)"""
+        all_stats = tuple(self.stats.values())
+        requests = sum(stats.requests for stats in all_stats)
+        errors = sum(stats.errors for stats in all_stats)
+        if not requests:
+            return 0, 0, 0.0
+        latency = sum(stats.latencyAvg * stats.requests for stats in all_stats) / requests
+        return requests, errors, latency
+
+    def top_endpoints(self, count: int) -> tuple[tuple[str, RequestStats], ...]:
+        """Endpoints sorted by average latency, slowest first"""
+        return tuple(sorted(
+            self.stats.items(), key=lambda item: item[1].latencyAvg, reverse=True)[:count])
+
+    def clear_cache(self):
+        """Clear response cache"""
+        self._cache.clear()
+
+
+def request_path(request: bytes) -> str:
+    """Get request path from request header"""
+    return request.split(b" ", 2)[1].decode("latin-1") if request.count(b" ") >= 2 else ""
+
+
+shared_request = SharedRequest()
@@ -0,0 +1,296 @@
+
+
+from __future__ import annotations
+
+from heapq import nsmallest
+from math import ceil
+from typing import Iterator, NamedTuple
+
+from .const_common import FLOAT_INF
+
+MAX_FULL_TYRE_STOPS = 10  # max stops to enumerate every tyre change combination
+
+
+class StrategySetup(NamedTuple):
+    """Strategy simulation setup
+
+    Consumption, capacity and refill values are in same unit, which can be
+    either fuel or virtual energy.
+    """
+
+    laps: float  # race laps left to run, for time-type race if no time is lost in pit
+    laptime: float  # base lap time (seconds)
+    consumption: float  # usage per lap, 0 if not limited by fuel
+    capacity: float  # tank capacity
+    amount_start: float  # amount at start
+    pit_pass_time: float = 0.0  # pit lane pass through time (seconds)
+    refill_base: float = 0.0  # fixed refill service time per stop (seconds)
+    refill_rate: float = 0.0  # refill amount per second, 0 for instant refill
+    refill_concurrent: bool = True
+    tyre_change_time: float = 0.0  # tyre change service time (seconds)
+    tyre_concurrent: bool = True
+    tyre_tread: float = 100.0  # remaining tread of current tyre (percent)
+    tyre_wear: float = 0.0  # tread wear per lap (percent), 0 if not limited by tyre
+    tyre_degradation: float = 0.0  # lap time loss per lap of tyre age (seconds)
+    extra_stops: int = 2  # extra stops to evaluate beyond minimum stops
+    race_seconds: float = 0.0  # time left of time-type race (seconds), 0 for lap-type race
+
+
+class StrategyPlan(NamedTuple):
+    """Strategy plan result"""
+
+    total_time: float  # total race time (seconds), until finish line after timer for time-type race
+    stops: int  # number of pit stops
+    stint_laps: tuple[float, ...]  # laps of each stint
+    refill: tuple[float, ...]  # refill amount of each stop
+    tyre_change: tuple[bool, ...]  # whether change tyre on each stop
+    pit_time: float  # total pit time (seconds)
+
+
+def minimum_stops(setup: StrategySetup) -> int:
+    """Minimum pit stops required to finish race by consumption"""
+    if setup.consumption <= 0:
+        return 0
+    amount_need = setup.laps * setup.consumption - setup.amount_start
+    if amount_need <= 0:
+        return 0
+    if setup.capacity <= 0:
+        return -1
+    return ceil(amount_need / setup.capacity - 0.000001)
+
+
+def stint_layouts(setup: StrategySetup, stops: int) -> list[tuple[float, ...]]:
+    """Feasible stint lap layouts for number of stops
+
+    Layouts are: even stints, full tank stints first, full tank stints last.
+    """
+    laps = setup.laps
+    stints = stops + 1
+    if setup.consumption > 0:
+        max_first = setup.amount_start / setup.consumption
+        max_stint = setup.capacity / setup.consumption
+    else:
+        max_first = max_stint = FLOAT_INF
+    if max_first + stops * max_stint < laps - 0.000001:
+        return []
+
+    layouts = []
+    # Even stints, first stint limited by start amount
+    even = laps / stints
+    if even <= max_first:
+        layouts.append((even,) * stints)
+    elif stops:
+        rest = (laps - max_first) / stops
+        layouts.append((max_first, *(rest,) * stops))
+    # Full tank stints first, remaining laps in last stint
+    laps_left = laps
+    layout = []
+    for index in range(stints):
+        stint = min(max_first if index == 0 else max_stint, laps_left)
+        if index == stops:
+            stint = laps_left
+        layout.append(stint)
+        laps_left -= stint
+    layouts.append(tuple(layout))
+    # Full tank stints last, remaining laps in first stint
+    laps_left = laps
+    layout = []
+    for index in range(stops, -1, -1):
+        stint = min(max_first if index == 0 else max_stint, laps_left)
+        if index == 0:
+            stint = laps_left
+        layout.append(stint)
+        laps_left -= stint
+    layouts.append(tuple(reversed(layout)))
+
+    # Remove duplicated & empty stint layouts
+    unique = {}
+    for layout in layouts:
+        if min(layout) > 0 and layout[0] <= max_first + 0.000001:
+            unique.setdefault(tuple(round(stint, 6) for stint in layout), layout)
+    return list(unique.values())
+
+
+def tyre_change_plans(stops: int) -> Iterator[tuple[bool, ...]]:
+    """Tyre change plans (whether change tyre on each stop)
+
+    Every combination is enumerated for up to MAX_FULL_TYRE_STOPS,
+    otherwise only periodic tyre change (every N stops) is enumerated.
+    """
+    if stops <= MAX_FULL_TYRE_STOPS:
+        for mask in range(1 << stops):
+            yield tuple(bool(mask >> index & 1) for index in range(stops))
+    else:
+        yield (False,) * stops
+        for period in range(1, stops + 1):
+            yield tuple((index + 1) % period == 0 for index in range(stops))
+
+
+def stop_refills(setup: StrategySetup, layout: tuple[float, ...]) -> list[float]:
+    """Refill amount of each stop, refill just enough for next stint"""
+    consumption = setup.consumption
+    if consumption <= 0:
+        return [0.0] * (len(layout) - 1)
+    refills = []
+    amount = setup.amount_start
+    for index in range(1, len(layout)):
+        amount -= layout[index - 1] * consumption
+        refill = min(max(layout[index] * consumption - amount, 0.0), setup.capacity - amount)
+        refills.append(refill)
+        amount += refill
+    return refills
+
+
+def simulate_layout(setup: StrategySetup, layout: tuple[float, ...]) -> Iterator[StrategyPlan]:
+    """Simulate all tyre change plans of stint layout"""
+    stops = len(layout) - 1
+    wear = setup.tyre_wear
+    degradation = setup.tyre_degradation
+    refills = stop_refills(setup, layout)
+
+    # Service time of each stop without & with tyre change
+    service_base = []
+    service_tyre = []
+    for refill in refills:
+        if refill > 0:
+            refill_time = setup.refill_base
+            if setup.refill_rate > 0:
+                refill_time += refill / setup.refill_rate
+        else:
+            refill_time = 0.0
+        if setup.refill_concurrent:
+            concurrent, separate = refill_time, 0.0
+        else:
+            concurrent, separate = 0.0, refill_time
+        service_base.append(concurrent + separate)
+        if setup.tyre_concurrent:
+            service_tyre.append(max(concurrent, setup.tyre_change_time) + separate)
+        else:
+            service_tyre.append(concurrent + separate + setup.tyre_change_time)
+
+    # Cumulative laps at end of each stint
+    stint_end = []
+    total = 0.0
+    for stint in layout:
+        total += stint
+        stint_end.append(total)
+
+    # Current tyre age in laps, estimated from worn tread
+    if wear > 0:
+        age_start = max(100.0 - setup.tyre_tread, 0.0) / wear
+        max_run = {False: setup.tyre_tread / wear, True: 100.0 / wear}
+    else:
+        age_start = 0.0
+        max_run = {False: FLOAT_INF, True: FLOAT_INF}
+
+    base_time = setup.laps * setup.laptime
+    for tyre_change in tyre_change_plans(stops):
+        # Tyre runs between tyre changes
+        run_start = 0.0
+        run_age = age_start
+        is_new = False
+        feasible = True
+        tyre_time = 0.0
+        pit_time = stops * setup.pit_pass_time
+        for index in range(stops + 1):
+            if index == stops or tyre_change[index]:
+                run = stint_end[index] - run_start
+                if run > max_run[is_new] + 0.000001:
+                    feasible = False
+                    break
+                tyre_time += degradation * (run_age * run + run * (run - 1) * 0.5)
+                run_start = stint_end[index]
+                run_age = 0.0
+                is_new = True
+            if index < stops:
+                pit_time += service_tyre[index] if tyre_change[index] else service_base[index]
+        if feasible:
+            yield StrategyPlan(
+                total_time=base_time + pit_time + max(tyre_time, 0.0),
+                stops=stops,
+                stint_laps=layout,
+                refill=tuple(refills),
+                tyre_change=tyre_change,
+                pit_time=pit_time,
+            )
+
+
+def laps_lost(setup: StrategySetup, lost_time: float) -> int:
+    """Full laps lost in time-type race by time lost (pit & tyre degradation)"""
+    race_seconds = setup.race_seconds
+    laptime = setup.laptime
+    return ceil(race_seconds / laptime) - ceil(max(race_seconds - lost_time, 0.0) / laptime)
+
+
+def simulate_stops(setup: StrategySetup, stops: int) -> Iterator[StrategyPlan]:
+    """Simulate all stint layouts of number of stops
+
+    For time-type race, time lost in pit & to tyre degradation shortens race
+    by full laps, so race laps are reduced one lap at a time, and plan is
+    only kept if it loses exactly the number of laps it is simulated with.
+    """
+    if setup.race_seconds <= 0:
+        for layout in stint_layouts(setup, stops):
+            yield from simulate_layout(setup, layout)
+        return
+
+    lost = 0
+    max_lost = 0
+    while lost <= max_lost and setup.laps - lost > 0:
+        lost_setup = setup._replace(laps=setup.laps - lost)
+        base_time = lost_setup.laps * setup.laptime
+        for layout in stint_layouts(lost_setup, stops):
+            for plan in simulate_layout(lost_setup, layout):
+                plan_lost = laps_lost(setup, plan.total_time - base_time)
+                if lost == 0 and plan_lost > max_lost:
+                    max_lost = plan_lost
+                if plan_lost == lost:
+                    yield plan
+        lost += 1
+
+
+def simulate_strategy(
+    setup: StrategySetup, max_plans: int = 10) -> tuple[tuple[StrategyPlan, ...], int]:
+    """Simulate strategy plans
+
+    Lap-type race plans are ranked by total time. Time-type race plans are
+    ranked by completed laps first (more is better), then by total time.
+
+    Args:
+        setup: strategy setup.
+        max_plans: max number of ranked plans to output.
+
+    Returns:
+        Ranked plans (fastest first), total number of evaluated plans.
+    """
+    if setup.laps <= 0 or setup.laptime <= 0:
+        return (), 0
+    stops_min = minimum_stops(setup)
+    if stops_min < 0:
+        return (), 0
+
+    evaluated = 0
+
+    def gen_plans():
+        nonlocal evaluated
+        for stops in range(stops_min, stops_min + max(setup.extra_stops, 0) + 1):
+            for plan in simulate_stops(setup, stops):
+                evaluated += 1
+                yield plan
+
+    if setup.race_seconds > 0:
+        sort_key = plan_completed_laps
+    else:
+        sort_key = plan_total_time
+    ranked = nsmallest(max(max_plans, 1), gen_plans(), key=sort_key)
+    return tuple(ranked), evaluated
+
+
+def plan_total_time(plan: StrategyPlan) -> float:
+    """Sort key - plan total time"""
+    return plan.total_time
+
+
+def plan_completed_laps(plan: StrategyPlan) -> tuple[float, float]:
+    """Sort key - plan completed laps (descending), then total time"""
+    return -round(sum(plan.stint_laps), 6), plan.total_time
@@ -17,9 +17,12 @@ COMMON_DEFAULT = {
         "active_state": True,
         "enable_player_index_override": False,
         "player_index": -1,
+        "enable_multi_car_mode": False,
+        "multi_car_vehicle_names": "",
         "character_encoding": "UTF-8",
         "enable_restapi_access": True,
         "restapi_update_interval": 200,
+        "enable_restapi_event_polling": True,
         "url_host": "localhost",
         "url_port_rf2": 5397,
         "url_port_lmu": 6397,
@@ -77,6 +77,20 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "enable_all_time_best_sectors": True,
     },
+    "module_server": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "url_host": "localhost",
+        "url_port": 8890,
+        "update_interval_relative": 100,
+        "update_interval_vehicles": 100,
+        "update_interval_delta": 50,
+        "update_interval_fuel": 500,
+        "update_interval_energy": 500,
+        "update_interval_sectors": 200,
+        "update_interval_wheels": 200,
+    },
     "module_stats": {
         "enable": True,
         "update_interval": 200,
@@ -84,12 +98,31 @@ MODULE_DEFAULT = {
         "vehicle_classification": "Class - Brand",
         "enable_podium_by_class": True,
     },
+    "module_strategy": {
+        "enable": False,
+        "update_interval": 1000,
+        "idle_update_interval": 1000,
+        "maximum_ranked_plans": 5,
+        "maximum_extra_pit_stops": 2,
+        "tyre_degradation_per_lap": 0.03,
+    },
+    "module_telemetry": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "maximum_samples_per_lap": 60000,
+    },
     "module_vehicles": {
         "enable": True,
         "update_interval": 20,
         "idle_update_interval": 400,
         "lap_difference_ahead_threshold": 0.9,
         "lap_difference_behind_threshold": 0.9,
+        "number_of_mini_sectors": 50,
+        "proximity_range": 1500,
+        "closing_prediction_range": 200,
+        "approaching_speed_threshold": 8,
+        "approaching_time_threshold": 5,
     },
     "module_wheels": {
         "enable": True,
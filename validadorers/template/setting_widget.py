@@ -207,6 +207,27 @@ WIDGET_DEFAULT = {
         "column_index_lifespan_laps": 3,
         "column_index_lifespan_minutes": 4,
     },
+    "corner_delta": {
+        "enable": False,
+        "update_interval": 20,
+        "position_x": 57,
+        "position_y": 186,
+        "opacity": 0.9,
+        "layout": 0,
+        "font_name": "Consolas",
+        "font_size": 15,
+        "font_weight": "bold",
+        "bar_padding": 0.2,
+        "bar_gap": 2,
+        "deltabest_source": "Best",
+        "corner_name_width": 14,
+        "font_color_corner_name": "#FFFFFF",
+        "bkg_color_corner_name": "#222222",
+        "font_color_corner_delta": "#AAAAAA",
+        "bkg_color_corner_delta": "#222222",
+        "font_color_time_gain": "#22CC22",
+        "font_color_time_loss": "#FF4400",
+    },
     "cruise": {
         "enable": True,
         "update_interval": 100,
@@ -836,6 +857,27 @@ WIDGET_DEFAULT = {
         "number_of_more_laps": 3,
         "number_of_less_laps": 0,
     },
+    "gap_graph": {
+        "enable": False,
+        "update_interval": 100,
+        "position_x": 433,
+        "position_y": 520,
+        "opacity": 0.9,
+        "bkg_color": "#CC222222",
+        "display_width": 300,
+        "display_height": 80,
+        "display_margin": 4,
+        "gap_display_range": 5.0,
+        "show_intra_lap_trend": True,
+        "number_of_trend_samples": 120,
+        "number_of_laps": 20,
+        "show_reference_line": True,
+        "reference_line_color": "#666666",
+        "rival_ahead_color": "#FF6600",
+        "rival_ahead_line_width": 2,
+        "rival_behind_color": "#00AAFF",
+        "rival_behind_line_width": 2,
+    },
     "gear": {
         "enable": True,
         "update_interval": 20,
@@ -1045,11 +1087,29 @@ WIDGET_DEFAULT = {
         "bkg_color_last_fuel": "#88444444",
         "bkg_color_last_wear": "#88333333",
         "font_color_invalid_laptime": "#FF6600",
+        "font_color_best_laptime": "#44CC44",
         "column_index_laps": 1,
         "column_index_time": 2,
         "column_index_fuel": 3,
         "column_index_wear": 4,
     },
+    "mini_sectors": {
+        "enable": False,
+        "update_interval": 50,
+        "position_x": 317,
+        "position_y": 40,
+        "opacity": 0.9,
+        "bar_length": 400,
+        "bar_height": 10,
+        "bar_gap": 1,
+        "show_current_mini_sector": True,
+        "bkg_color": "#222222",
+        "bkg_color_no_time": "#444444",
+        "bkg_color_slower": "#FFCC00",
+        "bkg_color_personal_best": "#00CC00",
+        "bkg_color_class_best": "#CC00FF",
+        "bkg_color_current_mini_sector": "#FFFFFF",
+    },
     "navigation": {
         "enable": True,
         "update_interval": 20,
@@ -1304,6 +1364,13 @@ WIDGET_DEFAULT = {
         "indicator_size_multiplier": 8,
         "indicator_color_nearby": "#FFFF00",
         "indicator_color_critical": "#FF6600",
+        "show_collision_risk": True,
+        "collision_risk_time": 1.5,
+        "collision_risk_distance": 2.5,
+        "vehicle_color_collision_risk": "#FF0000",
+        "show_approaching_indicator": True,
+        "approaching_indicator_width": 6,
+        "approaching_indicator_color": "#FF00FF",
         "show_center_mark": True,
         "center_mark_style": 0,
         "center_mark_radius": 30,
@@ -2161,6 +2228,34 @@ WIDGET_DEFAULT = {
         "column_index_tyre": 4,
         "column_index_wear": 5,
     },
+    "strategy": {
+        "enable": False,
+        "update_interval": 100,
+        "position_x": 523,
+        "position_y": 483,
+        "opacity": 0.9,
+        "layout": 0,
+        "font_name": "Consolas",
+        "font_size": 15,
+        "font_weight": "bold",
+        "bar_padding": 0.2,
+        "bar_gap": 1,
+        "number_of_plans": 3,
+        "font_color_best_plan": "#222222",
+        "bkg_color_best_plan": "#00CC00",
+        "font_color_pit_stops": "#222222",
+        "bkg_color_pit_stops": "#CCCCCC",
+        "font_color_time_delta": "#DDDDDD",
+        "bkg_color_time_delta": "#222222",
+        "font_color_tyre_changes": "#222222",
+        "bkg_color_tyre_changes": "#EEEEEE",
+        "font_color_next_refill": "#DDDDDD",
+        "bkg_color_next_refill": "#444444",
+        "column_index_pit_stops": 1,
+        "column_index_time_delta": 2,
+        "column_index_tyre_changes": 3,
+        "column_index_next_refill": 4,
+    },
     "suspension_force": {
         "enable": True,
         "update_interval": 20,
@@ -2237,11 +2332,21 @@ WIDGET_DEFAULT = {
         "show_tinypedal_performance": True,
         "font_color_tinypedal": "#FFFFFF",
         "bkg_color_tinypedal": "#222222",
+        "show_request_performance": False,
+        "font_color_request": "#FFFFFF",
+        "bkg_color_request": "#222222",
+        "show_request_endpoints": False,
+        "request_endpoint_count": 3,
+        "font_color_request_endpoint": "#AAAAAA",
+        "bkg_color_request_endpoint": "#222222",
         "average_samples": 40,
         "prefix_system": "OS ",
         "prefix_tinypedal": "TP ",
+        "prefix_request": "RQ ",
         "column_index_system": 1,
         "column_index_tinypedal": 2,
+        "column_index_request": 3,
+        "column_index_request_endpoint": 4,
     },
     "timing": {
         "enable": True,
@@ -2939,6 +3044,11 @@ WIDGET_DEFAULT = {
         "font_color_player_best_laptime": "#000000",
         "bkg_color_player_best_laptime": "#FFFFFF",
 
+        "show_mini_sector_state": True,
+        "font_color_mini_sector_slower": "#FFCC00",
+        "font_color_mini_sector_personal_best": "#00CC00",
+        "font_color_mini_sector_class_best": "#CC00FF",
+
         "show_gap": True,
         "font_color_time_gap": "#FFFFFF",
         "bkg_color_time_gap": "#222222",
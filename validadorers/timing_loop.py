@@ -0,0 +1,145 @@
+
+
+from __future__ import annotations
+
+from array import array
+from math import ceil, floor
+
+from .const_common import MAX_VEHICLES
+
+MARKER_SPACING = 50.0  # meters between virtual timing markers
+MIN_MARKERS = 2
+
+
+class TimingLoop:
+    """Virtual timing loop
+
+    Track is divided into fixed distance markers, session time of each marker
+    crossing is recorded per vehicle in preallocated ring arrays holding one lap
+    of markers. Gap between two vehicles is time difference at most recent
+    marker crossed by both vehicles, which is O(1) lookup.
+
+    Attributes:
+        spacing: marker spacing (meters).
+        track_length: track length (meters).
+        markers: number of markers per lap (ring size).
+    """
+
+    __slots__ = (
+        "spacing",
+        "track_length",
+        "markers",
+        "_times",
+        "_marker_id",
+        "_last_marker",
+        "_last_distance",
+        "_last_time",
+        "_slot_id",
+    )
+
+    def __init__(self, spacing: float = MARKER_SPACING, max_vehicles: int = MAX_VEHICLES):
+        self.spacing = max(spacing, 1.0)
+        self.track_length = 0.0
+        self.markers = MIN_MARKERS
+        self._times: tuple[array, ...] = ()
+        self._marker_id: tuple[array, ...] = ()
+        self._last_marker = array("q", [-1] * max_vehicles)
+        self._last_distance = array("d", bytes(8 * max_vehicles))
+        self._last_time = array("d", bytes(8 * max_vehicles))
+        self._slot_id = array("q", [-1] * max_vehicles)
+        self.resize(0.0)
+
+    def resize(self, track_length: float):
+        """Reallocate ring arrays for track length, clear all records"""
+        self.track_length = max(track_length, 0.0)
+        self.markers = max(ceil(self.track_length / self.spacing), MIN_MARKERS)
+        total = len(self._last_marker)
+        self._times = tuple(array("d", bytes(8 * self.markers)) for _ in range(total))
+        self._marker_id = tuple(array("q", [-1] * self.markers) for _ in range(total))
+        for index in range(total):
+            self.reset_vehicle(index)
+
+    def reset_vehicle(self, index: int, slot_id: int = -1):
+        """Clear vehicle records"""
+        self._last_marker[index] = -1
+        self._slot_id[index] = slot_id
+        self._marker_id[index][:] = array("q", [-1] * self.markers)
+
+    def update(self, index: int, slot_id: int, total_distance: float, elapsed_time: float):
+        """Record marker crossings of vehicle since last update
+
+        Crossing time is interpolated between last & current sample.
+        Backward movement less than marker spacing (such as distance jitter
+        at finish line) is ignored, larger backward movement clears records.
+
+        Args:
+            index: vehicle index.
+            slot_id: vehicle slot id, records are cleared if changed.
+            total_distance: total traveled distance (completed laps * track length + lap distance).
+            elapsed_time: session elapsed time (seconds).
+        """
+        marker = floor(total_distance / self.spacing)
+        last_marker = self._last_marker[index]
+        if (
+            last_marker >= 0
+            and self._slot_id[index] == slot_id
+            and 0 < self._last_distance[index] - total_distance < self.spacing
+            and elapsed_time >= self._last_time[index]
+        ):
+            return  # keep last sample until moved past it
+        if (
+            self._slot_id[index] != slot_id
+            or last_marker < 0
+            or marker < last_marker  # went backwards, such as reset to pit
+            or marker - last_marker > self.markers  # teleported over a lap
+            or elapsed_time < self._last_time[index]
+        ):
+            self.reset_vehicle(index, slot_id)
+        elif marker > last_marker:
+            times = self._times[index]
+            marker_id = self._marker_id[index]
+            last_distance = self._last_distance[index]
+            last_time = self._last_time[index]
+            distance_diff = total_distance - last_distance
+            time_diff = elapsed_time - last_time
+            ring = self.markers
+            spacing = self.spacing
+            for crossed in range(last_marker + 1, marker + 1):
+                if distance_diff > 0:
+                    ratio = (crossed * spacing - last_distance) / distance_diff
+                else:
+                    ratio = 1.0
+                slot = crossed % ring
+                times[slot] = last_time + time_diff * ratio
+                marker_id[slot] = crossed
+        self._last_marker[index] = marker
+        self._last_distance[index] = total_distance
+        self._last_time[index] = elapsed_time
+
+    def gap(self, ahead_index: int, behind_index: int) -> float:
+        """Time gap (seconds) of behind vehicle to ahead vehicle
+
+        Gap is measured at most recent marker crossed by behind vehicle,
+        returns -1 if either vehicle has no record of that marker.
+        """
+        marker = self._last_marker[behind_index]
+        if marker < 0 or self._last_marker[ahead_index] < marker:
+            return -1.0
+        slot = marker % self.markers
+        if (
+            self._marker_id[behind_index][slot] != marker
+            or self._marker_id[ahead_index][slot] != marker
+        ):
+            return -1.0
+        return self._times[behind_index][slot] - self._times[ahead_index][slot]
+
+    def relative_gap(self, index_from: int, index_to: int) -> float | None:
+        """Relative time gap between two vehicles, positive if index_from is ahead
+
+        Returns None if not available.
+        """
+        if self._last_marker[index_from] >= self._last_marker[index_to]:
+            gap = self.gap(index_from, index_to)
+            return gap if gap >= 0 else None
+        gap = self.gap(index_to, index_from)
+        return -gap if gap >= 0 else None
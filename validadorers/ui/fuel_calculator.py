@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import os
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil, floor
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QPainter
 from PySide6.QtWidgets import (
     QDoubleSpinBox,
@@ -28,11 +29,14 @@ from PySide6.QtWidgets import (
 
 from .. import calculation as calc
 from ..api_control import api
+from ..const_common import MAX_SECONDS
 from ..const_file import FileFilter
 from ..formatter import laptime_string_to_seconds
-from ..module_info import ConsumptionDataSet, minfo
+from ..module_info import ConsumptionColumns, ConsumptionDataSet, minfo
 from ..setting import cfg
+from ..strategy import StrategySetup, simulate_strategy
 from ..units import set_symbol_fuel, set_unit_fuel
+from ..userfile.combo_summary import ComboSummary, load_combo_summary
 from ..userfile.consumption_history import load_consumption_history_file
 from ._common import BaseDialog, UIScaler
 
@@ -131,10 +135,18 @@ class PitStopPreview(QWidget):
 class FuelCalculator(BaseDialog):
     """Fuel calculator"""
 
+    strategy_simulated = Signal(object)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.set_utility_title("Fuel Calculator")
 
+        # Strategy simulation worker
+        self.strategy_worker = ThreadPoolExecutor(max_workers=1)
+        self.strategy_running = False
+        self.strategy_pending = None
+        self.strategy_simulated.connect(self.refresh_strategy)
+
         # Set (freeze) fuel unit
         self.is_gallon = cfg.units["fuel_unit"] == "Gallon"
         self.unit_fuel = set_unit_fuel(cfg.units["fuel_unit"])
@@ -234,22 +246,33 @@ class FuelCalculator(BaseDialog):
             filepath=filepath,
             filename=filename,
         )
+        self.history_summary = ConsumptionColumns(len(history_data))
+        self.history_summary.extend(history_data)
         self.refresh_table(history_data)
-        self.fill_in_data(history_data)
+        self.refresh_summary(self.history_summary, load_combo_summary(filepath, filename))
+        self.fill_in_data(history_data, self.history_summary)
         self.status_bar.showMessage(f"File Source: {filename}")
 
     def load_live_data(self):
         """Load history data from live session"""
+        self.history_summary = minfo.history.consumptionSummary
         self.refresh_table(minfo.history.consumptionDataSet)
-        self.fill_in_data(minfo.history.consumptionDataSet)
+        self.refresh_summary(
+            self.history_summary,
+            load_combo_summary(cfg.path.fuel_delta, api.read.session.combo_name()),
+        )
+        self.fill_in_data(minfo.history.consumptionDataSet, self.history_summary)
+        # Default pit seconds from mapped pit lane pass time if not set
+        if not self.input_race.pit_seconds.value():
+            self.input_race.pit_seconds.setValue(minfo.mapping.pitPassTime)
         self.status_bar.showMessage(f"Live Source: {api.read.session.combo_name()}")
 
-    def fill_in_data(self, dataset: deque[ConsumptionDataSet]):
+    def fill_in_data(self, dataset: deque[ConsumptionDataSet], summary: ConsumptionColumns):
         """Fill in history data to edit"""
         latest_history = dataset[0]
         # Load laptime from last valid lap
-        laptime = latest_history.lapTimeLast
-        if laptime > 0 and latest_history.isValidLap:
+        laptime = summary.last_valid("lapTimeLast")
+        if laptime > 0:
             self.input_laptime.minutes.setValue(laptime // 60)
             self.input_laptime.seconds.setValue(laptime % 60)
             self.input_laptime.mseconds.setValue(laptime % 1 * 1000)
@@ -258,12 +281,12 @@ class FuelCalculator(BaseDialog):
         if capacity:
             self.input_fuel.capacity.setValue(self.unit_fuel(capacity))
         # Load consumption from last valid lap
-        if latest_history.isValidLap:
-            fuel_used = latest_history.lastLapUsedFuel
+        if summary.lastValidIndex >= 0:
+            fuel_used = summary.last_valid("lastLapUsedFuel")
             self.input_fuel.fuel_used.setValue(self.unit_fuel(fuel_used))
-            energy_used = latest_history.lastLapUsedEnergy
+            energy_used = summary.last_valid("lastLapUsedEnergy")
             self.input_fuel.energy_used.setValue(energy_used)
-            tyre_wear = latest_history.tyreAvgWearLast
+            tyre_wear = summary.last_valid("tyreAvgWearLast")
             self.input_tyre.wear_lap.setValue(tyre_wear)
 
     def refresh_table(self, dataset: deque[ConsumptionDataSet]):
@@ -298,6 +321,58 @@ class FuelCalculator(BaseDialog):
             self.table_history.setItem(row_index, 6, tyre_wear)
             self.table_history.setItem(row_index, 7, capacity_fuel)
 
+    def refresh_summary(self, summary: ConsumptionColumns, combo: ComboSummary | None = None):
+        """Refresh history summary table
+
+        Average, min, max of valid laps, and all time best lap time & median
+        consumption from combo summary database (generated by analytics.py).
+        """
+        if combo is None:
+            combo = ComboSummary()
+        all_time = (
+            combo.bestLaptime,
+            combo.fuelPerLap,
+            combo.energyPerLap,
+            combo.tyreWearPerLap,
+        )
+        for row_index, channel in enumerate(ConsumptionColumns.CHANNELS):
+            stats = summary.stats(channel)
+            value_all = all_time[row_index]
+            if channel == "lapTimeLast":
+                values = tuple(calc.sec2laptime_full(value) for value in stats[1:])
+                text_all = calc.sec2laptime_full(value_all) if value_all < MAX_SECONDS else "-"
+            elif channel == "lastLapUsedFuel":
+                values = tuple(f"{self.unit_fuel(value):.3f}" for value in stats[1:])
+                text_all = f"{self.unit_fuel(value_all):.3f}" if value_all > 0 else "-"
+            else:
+                values = tuple(f"{value:.3f}" for value in stats[1:])
+                text_all = f"{value_all:.3f}" if value_all > 0 else "-"
+            for column_index, text in enumerate((*values, text_all)):
+                self.table_summary.setItem(
+                    row_index, column_index, self.__add_table_item(text, Qt.ItemIsEnabled))
+        self.table_summary.setHorizontalHeaderLabels((
+            f"Average({summary.stats('lapTimeLast').count} laps)",
+            "Min",
+            "Max",
+            f"All Time({combo.validLaps} laps)",
+        ))
+
+    def add_average_data(self):
+        """Add average data of valid laps"""
+        summary = self.history_summary
+        laptime = summary.stats("lapTimeLast")
+        if not laptime.count:
+            QMessageBox.warning(
+                self, "Error",
+                "No valid lap data.")
+            return
+        self.input_laptime.minutes.setValue(laptime.mean // 60)
+        self.input_laptime.seconds.setValue(laptime.mean % 60)
+        self.input_laptime.mseconds.setValue(laptime.mean % 1 * 1000)
+        self.input_fuel.fuel_used.setValue(self.unit_fuel(summary.stats("lastLapUsedFuel").mean))
+        self.input_fuel.energy_used.setValue(summary.stats("lastLapUsedEnergy").mean)
+        self.input_tyre.wear_lap.setValue(summary.stats("tyreAvgWearLast").mean)
+
     def __add_table_item(self, text: str, flags: Qt.ItemFlags):
         """Add table item"""
         item = QTableWidgetItem()
@@ -414,10 +489,47 @@ class FuelCalculator(BaseDialog):
         button_adddata.clicked.connect(self.add_selected_data)
         button_adddata.setFocusPolicy(Qt.NoFocus)
 
+        self.table_summary = QTableWidget(self)
+        self.table_summary.setColumnCount(4)
+        self.table_summary.setRowCount(len(ConsumptionColumns.CHANNELS))
+        self.table_summary.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_summary.setFixedHeight(UIScaler.size(9))
+        self.table_summary.setVerticalHeaderLabels((
+            "Time",
+            f"Fuel({self.symbol_fuel})",
+            "Energy(%)",
+            "Tyre(%)",
+        ))
+
+        button_addaverage = QPushButton("Add Average Data")
+        button_addaverage.clicked.connect(self.add_average_data)
+        button_addaverage.setFocusPolicy(Qt.NoFocus)
+
+        layout_button = QHBoxLayout()
+        layout_button.addWidget(button_adddata)
+        layout_button.addWidget(button_addaverage)
+
+        self.table_strategy = QTableWidget(self)
+        self.table_strategy.setColumnCount(6)
+        self.table_strategy.verticalHeader().setVisible(False)
+        self.table_strategy.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_strategy.setFixedHeight(UIScaler.size(12))
+        self.table_strategy.setHorizontalHeaderLabels((
+            "Stops",
+            "Total Time",
+            "Delta",
+            "Tyre Change",
+            "Stint Laps",
+            "Refill",
+        ))
+
         layout_panel = QVBoxLayout()
         layout_panel.setContentsMargins(0, 0, 0, 0)
         layout_panel.addWidget(self.table_history)
-        layout_panel.addWidget(button_adddata)
+        layout_panel.addWidget(self.table_summary)
+        layout_panel.addLayout(layout_button)
+        layout_panel.addWidget(QLabel("Strategy Plans:"))
+        layout_panel.addWidget(self.table_strategy)
         panel.setLayout(layout_panel)
 
     def update_input(self):
@@ -467,6 +579,106 @@ class FuelCalculator(BaseDialog):
         else:
             self.pit_preview.update_input(fuel_total_runlaps, fuel_stint_runlaps, fuel_start_runlaps)
 
+        # Simulate strategy plans
+        if total_race_seconds:
+            total_race_laps = total_formation_laps + calc.time_type_full_laps_remain(
+                laptime, total_race_seconds)
+        else:
+            total_race_laps = total_formation_laps + absolute_race_laps
+        service = api.read.vehicle.pit_service_time()
+        tyre_setup = cfg.user.setting["module_strategy"]
+        if energy_used > 0:
+            refill_to_display = 1.0
+            setup = StrategySetup(
+                laps=total_race_laps,
+                laptime=laptime,
+                consumption=energy_used,
+                capacity=100,
+                amount_start=energy_start,
+                refill_base=service.energy_base,
+                refill_rate=service.energy_fill_rate,
+                refill_concurrent=service.energy_concurrent,
+            )
+        else:
+            # Simulate in liter, as pit service fill rate is in liter per second
+            if self.is_gallon:
+                to_liter = 3.785411784
+                refill_to_display = 1 / to_liter
+            else:
+                to_liter = refill_to_display = 1.0
+            setup = StrategySetup(
+                laps=total_race_laps,
+                laptime=laptime,
+                consumption=fuel_used * to_liter,
+                capacity=tank_capacity * to_liter,
+                amount_start=fuel_start * to_liter,
+                refill_base=service.fuel_base,
+                refill_rate=service.fuel_fill_rate,
+                refill_concurrent=service.fuel_concurrent,
+            )
+        self.simulate_strategy(setup._replace(
+            pit_pass_time=average_pit_seconds or minfo.mapping.pitPassTime,
+            tyre_change_time=service.tyre_change,
+            tyre_concurrent=service.tyre_concurrent,
+            tyre_tread=self.input_tyre.start_tread.value(),
+            tyre_wear=self.input_tyre.wear_lap.value(),
+            tyre_degradation=tyre_setup["tyre_degradation_per_lap"],
+            extra_stops=tyre_setup["maximum_extra_pit_stops"],
+            race_seconds=total_race_seconds,
+        ), refill_to_display)
+
+    def simulate_strategy(self, setup: StrategySetup, refill_to_display: float):
+        """Simulate strategy plans in worker thread, keep only latest setup while running
+
+        Args:
+            setup: strategy setup.
+            refill_to_display: ratio to convert simulated refill amount to display unit.
+        """
+        if self.strategy_running:
+            self.strategy_pending = setup, refill_to_display
+            return
+        self.strategy_running = True
+        self.strategy_worker.submit(self.__simulate_task, setup, refill_to_display)
+
+    def __simulate_task(self, setup: StrategySetup, refill_to_display: float):
+        """Strategy simulation task"""
+        self.strategy_simulated.emit(
+            (*simulate_strategy(setup, max_plans=10), refill_to_display))
+
+    def refresh_strategy(self, result: tuple):
+        """Refresh strategy plans table"""
+        self.strategy_running = False
+        if self.strategy_pending is not None:
+            pending = self.strategy_pending
+            self.strategy_pending = None
+            self.simulate_strategy(*pending)
+
+        plans, evaluated, refill_to_display = result
+        best_time = plans[0].total_time if plans else 0.0
+        self.table_strategy.setRowCount(0)
+        for row_index, plan in enumerate(plans):
+            self.table_strategy.insertRow(row_index)
+            values = (
+                f"{plan.stops}",
+                calc.sec2sessiontime(plan.total_time),
+                f"+{plan.total_time - best_time:.1f}",
+                f"{plan.tyre_change.count(True)}",
+                " / ".join(f"{stint:.1f}" for stint in plan.stint_laps),
+                " / ".join(f"{refill * refill_to_display:.1f}" for refill in plan.refill),
+            )
+            for column_index, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setTextAlignment(Qt.AlignCenter)
+                item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+                self.table_strategy.setItem(row_index, column_index, item)
+        self.table_strategy.setToolTip(f"Evaluated plans: {evaluated}")
+
+    def closeEvent(self, event):
+        """Wait strategy simulation finished on close"""
+        self.strategy_pending = None
+        self.strategy_worker.shutdown(wait=True)
+        super().closeEvent(event)
+
     def calc_consumption(self, output_type, tank_capacity, consumption, fuel_start,
         total_race_seconds, absolute_race_laps, total_formation_laps, average_pit_seconds, laptime):
         """Calculate and output results"""
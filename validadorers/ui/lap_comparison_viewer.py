@@ -0,0 +1,258 @@
+
+
+from __future__ import annotations
+
+import os
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from .. import calculation as calc
+from ..api_control import api
+from ..const_common import DELTA_DEFAULT, MAX_SECONDS
+from ..const_file import FileExt
+from ..lap_comparison import (
+    LapDelta,
+    ReferenceLap,
+    corner_time_loss,
+    create_curve_grades,
+    detect_corners,
+    section_average,
+    trace_from_delta,
+    trace_from_telemetry,
+)
+from ..setting import cfg
+from ..units import set_symbol_speed, set_unit_speed
+from ..userfile.delta_best import load_delta_best_file
+from ..userfile.telemetry_log import load_telemetry_lap, load_telemetry_lap_list
+from ..userfile.track_map import load_track_map_file
+from ._common import BaseDialog, CompactButton, NumericTableItem, UIScaler
+
+DELTA_BEST_ID = "Delta Best"
+TABLE_HEADER = ("Section", "Start", "End", "Reference", "Target", "Delta", "Speed", "Throttle", "Brake")
+# Logged channels to load, speed, throttle & brake are compared as section average
+COMPARE_CHANNELS = ("distance", "laptime", "speed", "throttle", "brake")
+
+
+class LapComparisonViewer(BaseDialog):
+    """Lap comparison viewer"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.set_utility_title("Lap Comparison Viewer")
+        self.setMinimumSize(UIScaler.size(50), UIScaler.size(30))
+
+        self.traces = {}  # lap id: lap trace cache
+        self.track_name = ""
+        self.corners = ()
+        self.sector_dists = ()
+        self.unit_speed = set_unit_speed(cfg.units["speed_unit"])
+        self.symbol_speed = set_symbol_speed(cfg.units["speed_unit"])
+
+        # Selector
+        self.combo_list = QComboBox()
+        self.combo_list.currentIndexChanged.connect(self.select_combo)
+        self.reference_list = QComboBox()
+        self.reference_list.currentIndexChanged.connect(self.refresh_table)
+        self.target_list = QComboBox()
+        self.target_list.currentIndexChanged.connect(self.refresh_table)
+
+        # Table
+        self.table_compare = QTableWidget(self)
+        self.table_compare.setColumnCount(len(TABLE_HEADER))
+        self.table_compare.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_compare.setHorizontalHeaderLabels(
+            [f"{name} ({self.symbol_speed})" if name == "Speed" else name for name in TABLE_HEADER])
+        self.table_compare.verticalHeader().setVisible(False)
+        self.table_compare.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_compare.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        for idx in range(1, len(TABLE_HEADER)):
+            self.table_compare.horizontalHeader().setSectionResizeMode(idx, QHeaderView.Fixed)
+            self.table_compare.setColumnWidth(idx, UIScaler.size(6))
+
+        self.label_summary = QLabel("")
+
+        # Button
+        button_reload = CompactButton("Reload")
+        button_reload.clicked.connect(self.reload_combo)
+
+        button_close = CompactButton("Close")
+        button_close.clicked.connect(self.close)
+
+        # Set layout
+        layout_main = QVBoxLayout()
+        layout_selector = QHBoxLayout()
+        layout_laps = QHBoxLayout()
+        layout_button = QHBoxLayout()
+
+        layout_selector.addWidget(self.combo_list, stretch=1)
+
+        layout_laps.addWidget(QLabel("Reference:"))
+        layout_laps.addWidget(self.reference_list, stretch=1)
+        layout_laps.addWidget(QLabel("Target:"))
+        layout_laps.addWidget(self.target_list, stretch=1)
+
+        layout_button.addWidget(button_reload)
+        layout_button.addWidget(self.label_summary, stretch=1)
+        layout_button.addWidget(button_close)
+
+        layout_main.addLayout(layout_selector)
+        layout_main.addLayout(layout_laps)
+        layout_main.addWidget(self.table_compare)
+        layout_main.addLayout(layout_button)
+        layout_main.setContentsMargins(self.MARGIN, self.MARGIN, self.MARGIN, self.MARGIN)
+        self.setLayout(layout_main)
+
+        self.reload_combo()
+
+    def reload_combo(self):
+        """Reload combo list from recorded telemetry log files"""
+        last_combo = self.combo_list.currentText() or api.read.session.combo_name()
+        combo_names = sorted(
+            filename[:-len(FileExt.TELEMETRY)]
+            for filename in os.listdir(cfg.path.delta_best)
+            if filename.endswith(FileExt.TELEMETRY)
+        ) if os.path.exists(cfg.path.delta_best) else []
+        self.combo_list.blockSignals(True)
+        self.combo_list.clear()
+        self.combo_list.addItems(combo_names)
+        self.combo_list.setCurrentText(last_combo)
+        self.combo_list.blockSignals(False)
+        self.select_combo()
+
+    def select_combo(self):
+        """Select combo, load lap list & track corners"""
+        combo_name = self.combo_list.currentText()
+        self.traces.clear()
+        lap_ids = load_telemetry_lap_list(cfg.path.delta_best, combo_name) if combo_name else ()
+
+        # Delta best as default reference
+        delta_best, _ = load_delta_best_file(
+            filepath=cfg.path.delta_best,
+            filename=combo_name,
+            defaults=(DELTA_DEFAULT, MAX_SECONDS),
+        )
+        if len(delta_best) > 10:
+            self.traces[DELTA_BEST_ID] = trace_from_delta(delta_best)
+
+        # Load track name from latest lap, fallback to combo name
+        track_name = combo_name.split(" - ", 1)[0]
+        if lap_ids:
+            loaded = load_telemetry_lap(cfg.path.delta_best, combo_name, lap_ids[-1], ())
+            if loaded is not None:
+                track_name = loaded[0].get("track_name", track_name)
+        self.load_corners(track_name)
+
+        reference_ids = [*self.traces.keys(), *lap_ids]
+        for lap_list, lap_items in ((self.reference_list, reference_ids), (self.target_list, lap_ids)):
+            lap_list.blockSignals(True)
+            lap_list.clear()
+            lap_list.addItems(lap_items)
+            lap_list.blockSignals(False)
+        if lap_ids:
+            self.target_list.setCurrentIndex(len(lap_ids) - 1)
+        self.refresh_table()
+
+    def load_corners(self, track_name: str):
+        """Load track corners & sector distances from track map"""
+        if self.track_name == track_name:
+            return
+        self.track_name = track_name
+        raw_coords, raw_dists, sectors_index = load_track_map_file(
+            filepath=cfg.path.track_map,
+            filename=track_name,
+        )
+        if raw_coords and raw_dists:
+            self.corners = detect_corners(
+                raw_coords, raw_dists,
+                create_curve_grades(cfg.user.config["track_map_viewer"]),
+            )
+            if sectors_index:
+                self.sector_dists = tuple(raw_dists[index][0] for index in sectors_index)
+            else:
+                self.sector_dists = ()
+        else:
+            self.corners = ()
+            self.sector_dists = ()
+
+    def load_trace(self, lap_id: str):
+        """Load lap trace, cached"""
+        trace = self.traces.get(lap_id)
+        if trace is None:
+            loaded = load_telemetry_lap(
+                cfg.path.delta_best, self.combo_list.currentText(), lap_id, COMPARE_CHANNELS)
+            if loaded is None or len(loaded[1].get("distance", ())) < 10:
+                return None
+            trace = self.traces[lap_id] = trace_from_telemetry(loaded[1])
+        return trace
+
+    def refresh_table(self):
+        """Refresh comparison table"""
+        self.table_compare.setRowCount(0)
+        self.label_summary.setText("")
+        reference_trace = self.load_trace(self.reference_list.currentText())
+        target_trace = self.load_trace(self.target_list.currentText())
+        if reference_trace is None or target_trace is None:
+            return
+
+        reference = ReferenceLap(reference_trace)
+        lap_delta = reference.compare(target_trace)
+        self.label_summary.setText(f"Lap time difference: {lap_delta.laptime_diff:+.3f}")
+
+        # Sectors
+        boundaries = (0.0, *self.sector_dists, reference.length)
+        for index, split in enumerate(reference.sector_splits(lap_delta, self.sector_dists)):
+            self.add_row(
+                f"Sector {index + 1}", boundaries[index], boundaries[index + 1],
+                split.reference, split.target, split.difference, lap_delta)
+
+        # Corners, where time is lost
+        for corner_delta in corner_time_loss(lap_delta, self.corners):
+            corner = corner_delta.corner
+            self.add_row(
+                corner.name, corner.start, corner.end, None, None, corner_delta.time_lost, lap_delta)
+
+    def add_row(
+        self, name: str, start: float, end: float,
+        reference: float | None, target: float | None, delta: float, lap_delta: LapDelta):
+        """Add comparison row, channel delta is target minus reference section average"""
+        channel_deltas = {
+            name: section_average(lap_delta.grid, data, start, end)
+            for name, data in lap_delta.channels.items()
+        }
+        speed = channel_deltas.get("speed")
+        throttle = channel_deltas.get("throttle")
+        brake = channel_deltas.get("brake")
+
+        row_index = self.table_compare.rowCount()
+        self.table_compare.insertRow(row_index)
+        flag_selectable = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+        item = QTableWidgetItem(name)
+        item.setFlags(flag_selectable)
+        self.table_compare.setItem(row_index, 0, item)
+
+        values = (
+            (start, f"{start:.0f}"),
+            (end, f"{end:.0f}"),
+            (reference, calc.sec2laptime(reference) if reference is not None else ""),
+            (target, calc.sec2laptime(target) if target is not None else ""),
+            (delta, f"{delta:+.3f}"),
+            (speed, f"{self.unit_speed(speed):+.1f}" if speed is not None else ""),
+            (throttle, f"{throttle * 100:+.1f}%" if throttle is not None else ""),
+            (brake, f"{brake * 100:+.1f}%" if brake is not None else ""),
+        )
+        for column_index, (value, text) in enumerate(values, 1):
+            item = NumericTableItem(value or 0, text)
+            item.setFlags(flag_selectable)
+            item.setTextAlignment(Qt.AlignCenter)
+            self.table_compare.setItem(row_index, column_index, item)
@@ -20,6 +20,7 @@ from .config import FontConfig, UserConfig
 from .driver_stats_viewer import DriverStatsViewer
 from .fuel_calculator import FuelCalculator
 from .heatmap_editor import HeatmapEditor
+from .lap_comparison_viewer import LapComparisonViewer
 from .log_info import LogInfo
 from .track_info_editor import TrackInfoEditor
 from .track_map_viewer import TrackMapViewer
@@ -370,6 +371,9 @@ class ToolsMenu(QMenu):
 
         utility_mapviewer = self.addAction("Track Map Viewer")
         utility_mapviewer.triggered.connect(self.open_utility_mapviewer)
+
+        utility_lapcompare = self.addAction("Lap Comparison Viewer")
+        utility_lapcompare.triggered.connect(self.open_utility_lapcompare)
         self.addSeparator()
 
         editor_heatmap = self.addAction("Heatmap Editor")
@@ -408,6 +412,11 @@ class ToolsMenu(QMenu):
         _dialog = TrackMapViewer(self._parent)
         _dialog.show()
 
+    def open_utility_lapcompare(self):
+        """Lap comparison viewer"""
+        _dialog = LapComparisonViewer(self._parent)
+        _dialog.show()
+
     def open_editor_heatmap(self):
         """Edit heatmap preset"""
         _dialog = HeatmapEditor(self._parent)
@@ -343,5 +343,5 @@ class PaceNotesControl(QWidget):
         if self.mcfg[key] == value:
             return False
         self.mcfg[key] = value
-        cfg.save()
+        cfg.save(section="pace_notes_playback")
         return True
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..api_control import api
+from ..module_info import TRACKED_CARS_SEPARATOR, minfo
 from ..setting import cfg
 from ._common import UIScaler
 
@@ -54,11 +55,15 @@ class SpectateList(QWidget):
         layout_button.addStretch(1)
         layout_button.addWidget(self.button_toggle)
 
+        # Multi-car mode
+        self.multicar_list = MultiCarList(self)
+
         # Layout
         layout_main = QVBoxLayout()
         layout_main.addWidget(self.label_spectating)
         layout_main.addWidget(self.listbox_spectate)
         layout_main.addLayout(layout_button)
+        layout_main.addWidget(self.multicar_list)
         margin = UIScaler.pixel(6)
         layout_main.setContentsMargins(margin, margin, margin, margin)
         self.setLayout(layout_main)
@@ -80,7 +85,7 @@ class SpectateList(QWidget):
     def toggle_spectate(self, checked: bool):
         """Toggle spectate mode"""
         cfg.telemetry_api["enable_player_index_override"] = checked
-        cfg.save()
+        cfg.save(section="telemetry_api")
         api.setup()
         self.refresh()
 
@@ -149,4 +154,157 @@ class SpectateList(QWidget):
         if cfg.telemetry_api["player_index"] != index:
             cfg.telemetry_api["player_index"] = index
             api.setup()
-            cfg.save()
+            cfg.save(section="telemetry_api")
+
+
+class MultiCarList(QWidget):
+    """Multi-car mode list view
+
+    Tracked cars are computed in parallel by data modules,
+    focused car is shown on overlay without reset on switching.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.last_enabled = None
+
+        # Label
+        self.label_focused = QLabel("")
+
+        # List box
+        self.listbox_vehicles = QListWidget(self)
+        self.listbox_vehicles.setAlternatingRowColors(True)
+        self.listbox_vehicles.itemDoubleClicked.connect(self.track_selected)
+
+        self.listbox_tracked = QListWidget(self)
+        self.listbox_tracked.setAlternatingRowColors(True)
+        self.listbox_tracked.itemDoubleClicked.connect(self.focus_selected)
+
+        layout_list = QHBoxLayout()
+        layout_list.addWidget(self.listbox_vehicles)
+        layout_list.addWidget(self.listbox_tracked)
+
+        # Button
+        self.button_track = QPushButton("Track")
+        self.button_track.clicked.connect(self.track_selected)
+
+        self.button_untrack = QPushButton("Untrack")
+        self.button_untrack.clicked.connect(self.untrack_selected)
+
+        self.button_focus = QPushButton("Focus")
+        self.button_focus.clicked.connect(self.focus_selected)
+
+        self.button_refresh = QPushButton("Refresh")
+        self.button_refresh.clicked.connect(self.refresh)
+
+        self.button_toggle = QPushButton("")
+        self.button_toggle.setCheckable(True)
+        self.button_toggle.setChecked(cfg.telemetry_api["enable_multi_car_mode"])
+        self.button_toggle.toggled.connect(self.toggle_multicar)
+        self.refresh()
+
+        layout_button = QHBoxLayout()
+        layout_button.addWidget(self.button_track)
+        layout_button.addWidget(self.button_untrack)
+        layout_button.addWidget(self.button_focus)
+        layout_button.addWidget(self.button_refresh)
+        layout_button.addStretch(1)
+        layout_button.addWidget(self.button_toggle)
+
+        # Layout
+        layout_main = QVBoxLayout()
+        layout_main.addWidget(self.label_focused)
+        layout_main.addLayout(layout_list)
+        layout_main.addLayout(layout_button)
+        layout_main.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout_main)
+
+    def set_button_state(self, enabled: bool):
+        """Set button state"""
+        self.button_toggle.setChecked(enabled)
+        self.button_toggle.setText("Enabled" if enabled else "Disabled")
+        self.listbox_vehicles.setDisabled(not enabled)
+        self.listbox_tracked.setDisabled(not enabled)
+        self.button_track.setDisabled(not enabled)
+        self.button_untrack.setDisabled(not enabled)
+        self.button_focus.setDisabled(not enabled)
+        self.button_refresh.setDisabled(not enabled)
+        self.label_focused.setDisabled(not enabled)
+        if enabled:
+            logger.info("ENABLED: multi-car mode")
+        else:
+            logger.info("DISABLED: multi-car mode")
+
+    def toggle_multicar(self, checked: bool):
+        """Toggle multi-car mode"""
+        cfg.telemetry_api["enable_multi_car_mode"] = checked
+        cfg.save(section="telemetry_api")
+        minfo.track_cars(self.saved_names() if checked else ())
+        self.refresh()
+
+    def refresh(self):
+        """Refresh vehicle & tracked car list"""
+        enabled = cfg.telemetry_api["enable_multi_car_mode"]
+
+        self.listbox_vehicles.clear()
+        self.listbox_tracked.clear()
+        if enabled:
+            vehicle_names = {
+                api.read.vehicle.vehicle_name(index)
+                for index in range(api.read.vehicle.total_vehicles())
+            }
+            vehicle_names.discard("")
+            self.listbox_vehicles.addItems(sorted(vehicle_names, key=str.lower))
+            self.listbox_tracked.addItems(
+                car.name if car.name else "Player" for car in minfo.multicar.cars)
+            self.listbox_tracked.setCurrentRow(minfo.multicar.focus)
+            self.label_focused.setText(f"Multi-car focused: <b>{self.focused_name()}</b>")
+        else:
+            self.label_focused.setText("Multi-car focused: <b>Disabled</b>")
+
+        # Update button state only if changed
+        if self.last_enabled != enabled:
+            self.last_enabled = enabled
+            self.set_button_state(enabled)
+
+    def track_selected(self):
+        """Add selected vehicle to tracked cars"""
+        selected_item = self.listbox_vehicles.currentItem()
+        if selected_item is not None:
+            self.save_tracked((*self.tracked_names(), selected_item.text()))
+
+    def untrack_selected(self):
+        """Remove selected car from tracked cars, local player is always tracked"""
+        row_index = self.listbox_tracked.currentRow()
+        if row_index > 0:
+            names = list(self.tracked_names())
+            names.pop(row_index - 1)
+            self.save_tracked(names)
+
+    def focus_selected(self):
+        """Focus selected tracked car"""
+        minfo.focus_car(max(self.listbox_tracked.currentRow(), 0))
+        self.label_focused.setText(f"Multi-car focused: <b>{self.focused_name()}</b>")
+
+    def focused_name(self) -> str:
+        """Focused car name"""
+        multicar = minfo.multicar
+        return multicar.cars[multicar.focus].name or "Player"
+
+    @staticmethod
+    def tracked_names() -> tuple[str, ...]:
+        """Tracked vehicle names, exclude local player"""
+        return tuple(car.name for car in minfo.multicar.cars[1:])
+
+    @staticmethod
+    def saved_names() -> list[str]:
+        """Tracked vehicle names from config"""
+        return cfg.telemetry_api["multi_car_vehicle_names"].split(TRACKED_CARS_SEPARATOR)
+
+    def save_tracked(self, names: tuple[str, ...] | list[str]):
+        """Save & apply tracked cars"""
+        minfo.track_cars(names)
+        cfg.telemetry_api["multi_car_vehicle_names"] = TRACKED_CARS_SEPARATOR.join(
+            self.tracked_names())
+        cfg.save(section="telemetry_api")
+        self.refresh()
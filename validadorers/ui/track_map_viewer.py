@@ -22,11 +22,15 @@ from PySide6.QtWidgets import (
 
 from .. import calculation as calc
 from ..const_file import ConfigType, FileExt, FileFilter
+from ..lap_comparison import create_curve_grades
+from ..map_index import MapIndex, MapLOD
 from ..setting import cfg
 from ..userfile.track_map import load_track_map_file
 from ._common import BaseDialog, CompactButton, UIScaler
 from .config import UserConfig
 
+MAP_MAX_PIXEL_ERROR = 0.5
+
 
 class TrackMapViewer(BaseDialog):
     """Track map viewer"""
@@ -89,7 +93,9 @@ class MapView(QWidget):
         self.raw_coords = None
         self.raw_dists = None
 
-        self.map_path = None
+        self.map_index = None
+        self.map_lod = None
+        self.map_paths = {}  # detail level: map path
         self.sfinish_path = None
         self.sector1_path = None
         self.sector2_path = None
@@ -137,13 +143,7 @@ class MapView(QWidget):
         self.distance_circle_radius = [
             self.ecfg[f"distance_circle_{idx}_radius"] for idx in range(10)
         ]
-        self.curve_grades = [
-            (self.ecfg["curve_grade_hairpin"], "Hairpin"),
-            *[(self.ecfg[f"curve_grade_{idx}"], str(idx))
-            for idx in range(1, 9) if self.ecfg[f"curve_grade_{idx}"] >= 0],
-            (self.ecfg["curve_grade_straight"], "Straight"),
-        ]
-        self.curve_grades.sort()
+        self.curve_grades = create_curve_grades(self.ecfg)
         self.length_grades = [
             (self.ecfg["length_grade_short"], "Short"),
             (self.ecfg["length_grade_normal"], "Normal"),
@@ -267,9 +267,7 @@ class MapView(QWidget):
         """Update highlighted coordinates"""
         if not self.raw_coords:
             return
-        dist = self.spinbox_pos_dist.value()
-        index = calc.binary_search_higher_column(
-            self.raw_dists, dist, 0, self.map_nodes - 1)
+        index = self.map_index.node_at_distance(self.spinbox_pos_dist.value())
         self.highlighted_coords = self.raw_coords[index]
         self.update()
 
@@ -279,12 +277,10 @@ class MapView(QWidget):
             return
         if temp_dists == self.marked_dists:
             return
-        end_node = self.map_nodes - 1
         self.marked_coords.clear()
         for dist in temp_dists:
             if 0 <= dist <= self.map_length:
-                index = calc.binary_search_higher_column(
-                    self.raw_dists, dist, 0, end_node)
+                index = self.map_index.node_at_distance(dist)
                 self.marked_coords.append(QPointF(*self.raw_coords[index]))
         self.marked_dists = temp_dists
         self.update()
@@ -350,6 +346,12 @@ class MapView(QWidget):
             self.map_filename = filename
             self.create_map_path(self.raw_coords, sector_index)
         else:
+            # Clear invalid map, avoid seeking with previous map index
+            self.raw_coords = None
+            self.raw_dists = None
+            self.map_index = None
+            self.map_lod = None
+            self.map_paths.clear()
             self.map_length = 0
             self.map_nodes = 0
             self.map_filename = ""
@@ -366,19 +368,13 @@ class MapView(QWidget):
 
     def create_map_path(self, raw_coords, sectors_index):
         """Create map path"""
-        map_path = QPainterPath()
         sfinish_path = QPainterPath()
         sector1_path = QPainterPath()
         sector1_path = QPainterPath()
 
-        for index, coords in enumerate(raw_coords):
-            if index == 0:
-                map_path.moveTo(*coords)
-            else:
-                map_path.lineTo(*coords)
-        # Close map loop if start & end distance less than 500 meters
-        if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
-            map_path.closeSubpath()
+        self.map_index = MapIndex(raw_coords, self.raw_dists)
+        self.map_lod = MapLOD(raw_coords)
+        self.map_paths.clear()
         # Create start/finish path
         sfinish_path = self.create_sector_path(
             sfinish_path, self.ecfg["start_line_length"], 0, 1)
@@ -390,11 +386,27 @@ class MapView(QWidget):
             sector1_path, self.ecfg["sector_line_length"],
             sectors_index[1], sectors_index[1] + 1)
 
-        self.map_path = map_path
         self.sfinish_path = sfinish_path
         self.sector1_path = sector1_path
         self.sector2_path = sector1_path
 
+    def map_path(self) -> QPainterPath:
+        """Map path of cheapest detail level for current map scale, cached"""
+        max_error = MAP_MAX_PIXEL_ERROR / max(self.map_scale, 0.000001)
+        level = self.map_lod.level(max_error)
+        map_path = self.map_paths.get(level)
+        if map_path is None:
+            map_path = self.map_paths[level] = QPainterPath()
+            raw_coords = self.raw_coords
+            nodes = self.map_lod.level_index(max_error)
+            map_path.moveTo(*raw_coords[nodes[0]])
+            for index in nodes[1:]:
+                map_path.lineTo(*raw_coords[index])
+            # Close map loop if start & end distance less than 500 meters
+            if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
+                map_path.closeSubpath()
+        return map_path
+
     def create_sector_path(self, sector_path, length, node_idx1, node_idx2):
         """Create sector line"""
         pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
@@ -424,6 +436,19 @@ class MapView(QWidget):
             scale -= zoom_step
         self.spinbox_map_scale.setValue(scale)
 
+    def mouseDoubleClickEvent(self, event):
+        """Mouse double click seek to nearest map node"""
+        if not self.raw_coords or event.button() != Qt.LeftButton:
+            return
+        pos_x, pos_y = self.raw_coords[self.map_seek_index]
+        click = event.position()
+        index = self.map_index.nearest_node(
+            pos_x + (click.x() - self.center_x) / self.map_scale,
+            pos_y + (click.y() - self.center_y) / self.map_scale,
+        )
+        if index >= 0:
+            self.spinbox_pos_dist.setValue(round(self.map_index.distances[index]))
+
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
@@ -439,8 +464,7 @@ class MapView(QWidget):
             return
 
         # Locate position node index
-        self.map_seek_index = calc.binary_search_higher_column(
-            self.raw_dists, self.map_seek_dist, 0, self.map_nodes - 1)
+        self.map_seek_index = self.map_index.node_at_distance(self.map_seek_dist)
 
         # Raw coordinates
         pos_x, pos_y = self.raw_coords[self.map_seek_index]
@@ -469,11 +493,11 @@ class MapView(QWidget):
         turn_direct = calc.turning_direction(
             yaw_radians, *point_one, *point_end)
 
-        curve_length = calc_section_length(
+        curve_length = calc.section_length(
             self.map_length, self.map_nodes, self.curve_nodes,
             self.map_seek_index, self.raw_dists)
         length_desc = calc.select_grade(self.length_grades, curve_length)
-        curve_desc = curve_description(arc_radius, turn_direct, self.curve_grades)
+        curve_desc = calc.curve_description(arc_radius, turn_direct, self.curve_grades)
 
         slope_delta = calc_section_height_delta(
             self.map_nodes, self.curve_nodes, self.map_seek_index, self.raw_dists)
@@ -508,18 +532,20 @@ class MapView(QWidget):
 
     def draw_map_image(self, painter):
         """Draw map image"""
+        map_path = self.map_path()
+
         # Draw map outline
         if self.ecfg["map_outline_width"] > 0:
             self.pen.setWidth(self.ecfg["map_width"] + self.ecfg["map_outline_width"])
             self.pen.setColor(self.ecfg["map_outline_color"])
             painter.setPen(self.pen)
-            painter.drawPath(self.map_path)
+            painter.drawPath(map_path)
 
         # Draw map
         self.pen.setWidth(self.ecfg["map_width"])
         self.pen.setColor(self.ecfg["map_color"])
         painter.setPen(self.pen)
-        painter.drawPath(self.map_path)
+        painter.drawPath(map_path)
 
         # Draw start/finish line
         self.pen.setWidth(self.ecfg["start_line_width"])
@@ -676,21 +702,6 @@ def gen_section_path(
         yield QPointF(*raw_coords[index])
 
 
-def calc_section_length(
-    map_length: float, total_nodes: int, section_nodes: int,
-    seek_index: int, raw_dists: tuple) -> float:
-    """Calculate section length from selected nodes"""
-    max_nodes = int(min(section_nodes, total_nodes - 2))
-    end_index = seek_index + max_nodes
-    if end_index >= total_nodes:
-        length = (
-            map_length - raw_dists[seek_index][0]
-            + raw_dists[end_index - total_nodes][0])
-    else:
-        length = raw_dists[end_index][0] - raw_dists[seek_index][0]
-    return length
-
-
 def calc_section_height_delta(
     total_nodes: int, section_nodes: int, seek_index: int, raw_dists: tuple) -> float:
     """Calculate section height delta from selected nodes"""
@@ -700,15 +711,3 @@ def calc_section_height_delta(
         end_index -= total_nodes
     height_delta = raw_dists[end_index][1] - raw_dists[seek_index][1]
     return height_delta
-
-
-def curve_description(arc_radius: float, turn_direct: int, curve_grade: tuple) -> str:
-    """Curve description"""
-    if arc_radius >= curve_grade[-1][0]:
-        return curve_grade[-1][1]
-    if turn_direct > 0:
-        direct_desc = "Right"
-    else:
-        direct_desc = "Left"
-    curve_desc = calc.select_grade(curve_grade, arc_radius)
-    return f"{direct_desc} {curve_desc}"
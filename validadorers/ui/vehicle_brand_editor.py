@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import os
@@ -20,6 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..api_control import api
+from ..async_loop import async_loop
 from ..async_request import get_response, set_header_get
 from ..const_file import ConfigType, FileFilter
 from ..setting import cfg, copy_setting
@@ -163,7 +163,7 @@ class VehicleBrandEditor(BaseEditor):
         time_out = 3
 
         try:
-            raw_veh_data = asyncio.run(get_response(request_header, url_host, url_port, time_out))
+            raw_veh_data = async_loop.run(get_response(request_header, url_host, url_port, time_out))
             self.parse_brand_data(json.loads(raw_veh_data))
         except (AttributeError, TypeError, IndexError, KeyError, ValueError,
                 OSError, TimeoutError, BaseException):
@@ -23,16 +23,18 @@ Check for updates
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import threading
 
 from . import overlay_signal, version
-from .async_request import get_response, set_header_get
+from .async_loop import async_loop
+from .async_request import set_header_get
 from .const_app import APP_NAME, REPO_NAME
+from .shared_request import shared_request
 
 VERSION_NA = (0, 0, 0)  # major, minor, patch
 DATE_NA = VERSION_NA  # year, month, day
+RESPONSE_TTL = 60  # seconds, reuse release data if checked again shortly
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +52,7 @@ def request_latest_release():
         "Accept: application/vnd.github+json",
         "X-GitHub-Api-Version: 2022-11-28",
     )
-    return get_response(request_header, host, port, timeout, ssl=True)
+    return shared_request.get(request_header, host, port, timeout, ssl=True, ttl=RESPONSE_TTL)
 
 
 def parse_version(data: bytes) -> tuple[int, int, int]:
@@ -119,7 +121,7 @@ class UpdateChecker:
 
     def __checking(self):
         """Fetch version info from github Rest API"""
-        raw_bytes = asyncio.run(request_latest_release())
+        raw_bytes = async_loop.run(request_latest_release())
         checked_version = parse_version(raw_bytes)
         checked_date = parse_date(raw_bytes)
         current_version = tuple(map(int, version.__version__.split(".")))
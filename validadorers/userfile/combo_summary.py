@@ -0,0 +1,176 @@
+
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from statistics import median
+from typing import Iterable, NamedTuple
+
+from ..const_common import MAX_SECONDS
+from ..const_file import FileExt, StatsFile
+from ..validator import valid_sectors
+from .consumption_history import load_consumption_history_file
+from .delta_best import load_delta_best_file
+from .fuel_delta import load_fuel_delta_file
+from .sector_best import load_sector_best_file
+
+logger = logging.getLogger(__name__)
+
+COMBO_SOURCE_EXT = (
+    FileExt.CSV,
+    FileExt.SECTOR,
+    FileExt.FUEL,
+    FileExt.ENERGY,
+    FileExt.CONSUMPTION,
+)
+
+
+class ComboSummary(NamedTuple):
+    """Combo summary data set"""
+
+    combo: str = ""
+    modified: float = 0.0
+    bestLaptime: float = MAX_SECONDS
+    theoreticalBest: float = MAX_SECONDS
+    fuelPerLap: float = 0.0
+    energyPerLap: float = 0.0
+    tyreWearPerLap: float = 0.0
+    validLaps: int = 0
+
+
+def scan_combo_files(filepath: str) -> dict[str, float]:
+    """Scan combo names from userdata path
+
+    Returns:
+        Dictionary, key = combo name, value = last modified time of combo files.
+    """
+    combos = {}
+    if not os.path.isdir(filepath):
+        return combos
+    with os.scandir(filepath) as entries:
+        for entry in entries:
+            combo_name, extension = os.path.splitext(entry.name)
+            if extension not in COMBO_SOURCE_EXT or not entry.is_file():
+                continue
+            modified = entry.stat().st_mtime
+            if modified > combos.get(combo_name, 0.0):
+                combos[combo_name] = modified
+    return combos
+
+
+def summarize_combo(filepath: str, combo_name: str, modified: float = 0.0) -> ComboSummary:
+    """Summarize combo stats from userdata files"""
+    source = f"{filepath}{combo_name}"
+
+    # Best lap
+    best_laptime = MAX_SECONDS
+    if os.path.exists(f"{source}{FileExt.CSV}"):
+        best_laptime = load_delta_best_file(
+            filepath=filepath,
+            filename=combo_name,
+            defaults=((), MAX_SECONDS),
+        )[1]
+
+    # Theoretical best from all time best sectors
+    theoretical_best = MAX_SECONDS
+    if os.path.exists(f"{source}{FileExt.SECTOR}"):
+        all_best_s_tb = load_sector_best_file(
+            filepath=filepath,
+            filename=combo_name,
+            session_id=("", 0, 0),
+            defaults=[MAX_SECONDS, MAX_SECONDS, MAX_SECONDS],
+        )[2]
+        if valid_sectors(all_best_s_tb):
+            theoretical_best = sum(all_best_s_tb)
+
+    # Consumption from valid laps in history
+    fuel_per_lap = energy_per_lap = wear_per_lap = 0.0
+    valid_laps = 0
+    if os.path.exists(f"{source}{FileExt.CONSUMPTION}"):
+        history = tuple(
+            data for data in load_consumption_history_file(filepath, combo_name)
+            if data.isValidLap and data.lapTimeLast > 0
+        )
+        valid_laps = len(history)
+        if history:
+            fuel_per_lap = median(data.lastLapUsedFuel for data in history)
+            energy_per_lap = median(data.lastLapUsedEnergy for data in history)
+            wear_per_lap = median(data.tyreAvgWearLast for data in history)
+
+    # Fallback to last lap consumption delta
+    if not fuel_per_lap and os.path.exists(f"{source}{FileExt.FUEL}"):
+        fuel_per_lap = load_fuel_delta_file(filepath, combo_name, FileExt.FUEL, ((), 0.0, 0.0))[1]
+    if not energy_per_lap and os.path.exists(f"{source}{FileExt.ENERGY}"):
+        energy_per_lap = load_fuel_delta_file(filepath, combo_name, FileExt.ENERGY, ((), 0.0, 0.0))[1]
+
+    return ComboSummary(
+        combo=combo_name,
+        modified=modified,
+        bestLaptime=best_laptime,
+        theoreticalBest=theoretical_best,
+        fuelPerLap=fuel_per_lap,
+        energyPerLap=energy_per_lap,
+        tyreWearPerLap=wear_per_lap,
+        validLaps=valid_laps,
+    )
+
+
+def connect_summary_db(filepath: str, filename: str = StatsFile.COMBO_SUMMARY) -> sqlite3.Connection:
+    """Connect combo summary database (*.db), create table if not exists"""
+    connection = sqlite3.connect(f"{filepath}{filename}{FileExt.DB}")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS combo_summary ("
+        "combo TEXT PRIMARY KEY, modified REAL, bestLaptime REAL, theoreticalBest REAL, "
+        "fuelPerLap REAL, energyPerLap REAL, tyreWearPerLap REAL, validLaps INTEGER)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_combo_best ON combo_summary (bestLaptime)"
+    )
+    return connection
+
+
+def load_summary_modified(connection: sqlite3.Connection) -> dict[str, float]:
+    """Load last modified time of summarized combos"""
+    return dict(connection.execute("SELECT combo, modified FROM combo_summary"))
+
+
+def save_combo_summary(connection: sqlite3.Connection, dataset: Iterable[ComboSummary]) -> int:
+    """Save combo summary data set, returns number of saved combos"""
+    with connection:
+        cursor = connection.executemany(
+            f"INSERT OR REPLACE INTO combo_summary VALUES ({','.join('?' * len(ComboSummary._fields))})",
+            dataset,
+        )
+    return cursor.rowcount
+
+
+def delete_combo_summary(connection: sqlite3.Connection, combo_names: Iterable[str]) -> None:
+    """Delete combo summary that no longer has source files"""
+    with connection:
+        connection.executemany(
+            "DELETE FROM combo_summary WHERE combo = ?",
+            ((combo_name,) for combo_name in combo_names),
+        )
+
+
+def load_combo_summary(
+    filepath: str, combo_name: str, filename: str = StatsFile.COMBO_SUMMARY
+) -> ComboSummary | None:
+    """Load combo summary from database (*.db)"""
+    if not os.path.exists(f"{filepath}{filename}{FileExt.DB}"):
+        return None
+    try:
+        connection = sqlite3.connect(f"{filepath}{filename}{FileExt.DB}")
+        try:
+            row = connection.execute(
+                "SELECT * FROM combo_summary WHERE combo = ?", (combo_name,)
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is not None:
+            return ComboSummary(*row)
+    except sqlite3.Error:
+        logger.info("MISSING: invalid combo summary (%s) data", FileExt.DB)
+    return None
@@ -1,13 +1,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import shutil
 from time import localtime, monotonic, sleep, strftime
-from typing import Callable
+from typing import Any, Callable, Mapping
 
+from ..const_common import EMPTY_DICT
 from ..const_file import FileExt
 from ..setting_validator import PresetValidator
 
@@ -32,16 +34,88 @@ def copy_setting(dict_user: dict) -> dict:
     return dict_user.copy()
 
 
+def content_hash(raw_data: bytes) -> str:
+    """Content hash of raw file data"""
+    return hashlib.md5(raw_data).hexdigest()
+
+
+def schema_version(dict_def: Mapping[str, Any]) -> int:
+    """Schema version of default setting, changes if any default key or section changed"""
+    return hash(tuple(
+        (key, tuple(value)) if isinstance(value, Mapping) else (key, type(value).__name__)
+        for key, value in dict_def.items()
+    ))
+
+
+class PresetCache:
+    """Validated preset cache
+
+    Validated preset is cached per file with content hash and schema version.
+    Unchanged file skips validation, changed file only re-validates modified sections.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self):
+        # file path: (content hash, schema version, raw setting, validated setting)
+        self._cache: dict[str, tuple[str, int, dict, dict]] = {}
+
+    def clear(self):
+        """Clear cache"""
+        self._cache.clear()
+
+    def validate(self, filename_source: str, raw_data: bytes, dict_def: Mapping[str, Any]) -> dict:
+        """Validate raw preset data, reuse cached setting if available
+
+        Args:
+            filename_source: full preset file path, used as cache key.
+            raw_data: raw preset file data.
+            dict_def: default setting dictionary.
+
+        Returns:
+            Validated setting copy.
+        """
+        digest = content_hash(raw_data)
+        schema = schema_version(dict_def)
+        cached = self._cache.get(filename_source)
+        if cached is not None and cached[1] == schema:
+            # Unchanged, skip validation
+            if cached[0] == digest:
+                return copy_setting(cached[3])
+            last_raw, last_valid = cached[2], cached[3]
+        else:
+            last_raw = last_valid = EMPTY_DICT
+
+        setting_user = json.loads(raw_data)
+        PresetValidator.update_api_setting(setting_user)
+        setting_raw = copy_setting(setting_user)
+        # Check top-level key
+        PresetValidator.validate_key_pair(setting_user, dict_def, False)
+        # Check sub-level key, skip unchanged section
+        for item in setting_user.keys():
+            if (
+                item in last_valid
+                and item in setting_raw
+                and setting_raw[item] == last_raw.get(item)
+            ):
+                setting_user[item] = last_valid[item].copy()
+            else:
+                PresetValidator.validate_key_pair(setting_user[item], dict_def[item], True)
+
+        self._cache[filename_source] = (digest, schema, setting_raw, setting_user)
+        return copy_setting(setting_user)
+
+
 def load_setting_json_file(
     filename: str, filepath: str, dict_def: dict, file_info: str = "user preset"
 ) -> dict:
     """Load setting json file & verify"""
     filename_source = f"{filepath}{filename}"
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            setting_user = json.load(jsonfile)
+        with open(filename_source, "rb") as jsonfile:
+            raw_data = jsonfile.read()
         # Verify & assign setting
-        setting_user = PresetValidator.validate(setting_user, dict_def)
+        setting_user = preset_cache.validate(filename_source, raw_data, dict_def)
     except FileNotFoundError:
         logger.info("USERDATA: %s not found, fall back to default", filename)
         setting_user = copy_setting(dict_def)
@@ -118,6 +192,97 @@ def verify_json_file(
     return False
 
 
+class JsonFileWriter:
+    """Incremental JSON file writer
+
+    Serialized text is cached per top-level section, only sections marked as
+    changed (dirty) by caller are re-serialized on saving. Output is identical
+    to indented json dump. Saving is skipped if content hash and file state
+    match last saved file, and saved file is verified by content hash.
+    """
+
+    __slots__ = (
+        "_source",
+        "_sections",
+        "_last_hash",
+        "_last_stat",
+    )
+
+    def __init__(self):
+        self._source: dict | None = None
+        self._sections: dict[str, str] = {}  # section key: serialized section text
+        self._last_hash = ""
+        self._last_stat = (0, 0)  # modified time, file size
+
+    def serialize(self, dict_user: dict, dirty: set[str] | None = None) -> bytes:
+        """Serialize dictionary, re-serialize dirty sections only
+
+        Args:
+            dict_user: dictionary to serialize.
+            dirty: changed section keys, None to re-serialize all sections.
+        """
+        sections = self._sections
+        if self._source is not dict_user:  # reloaded, cached text is invalid
+            self._source = dict_user
+            sections.clear()
+
+        output = []
+        for key, value in dict_user.items():
+            section_text = sections.get(key)
+            if section_text is None or dirty is None or key in dirty:
+                section_text = json.dumps(value, indent=4).replace("\n", "\n    ")
+                sections[key] = section_text
+            output.append(f"{json.dumps(key)}: {section_text}")
+
+        # Remove deleted section
+        if len(sections) > len(output):
+            for key in tuple(sections):
+                if key not in dict_user:
+                    sections.pop(key)
+
+        if not output:
+            return b"{}"
+        return ("{\n    " + ",\n    ".join(output) + "\n}").encode("utf-8")
+
+    def is_unchanged(self, digest: str, filename_source: str) -> bool:
+        """Check if content hash and file state match last saved file"""
+        return digest == self._last_hash and file_stat(filename_source) == self._last_stat
+
+    def set_saved(self, digest: str, filename_source: str):
+        """Set last saved file state"""
+        self._last_hash = digest
+        self._last_stat = file_stat(filename_source)
+
+
+def file_stat(filename_source: str) -> tuple[int, int]:
+    """File state (modified time, file size)"""
+    try:
+        stat = os.stat(filename_source)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return 0, 0
+
+
+def save_raw_file(raw_data: bytes, filename: str, filepath: str) -> None:
+    """Save raw file data"""
+    filename_source = f"{filepath}{filename}"
+    with open(filename_source, "wb") as rawfile:
+        rawfile.write(raw_data)
+
+
+def verify_raw_file(digest: str, filename: str, filepath: str) -> bool:
+    """Verify saved raw file data by content hash"""
+    filename_source = f"{filepath}{filename}"
+    try:
+        with open(filename_source, "rb") as rawfile:
+            return content_hash(rawfile.read()) == digest
+    except FileNotFoundError:
+        logger.error("USERDATA: not found %s", filename_source)
+    except OSError:
+        logger.error("USERDATA: unable to verify %s", filename_source)
+    return False
+
+
 def create_backup_file(
     filename: str, filepath: str, extension: str = FileExt.BAK, show_log: bool = False
 ) -> bool:
@@ -200,9 +365,24 @@ def save_and_verify_json_file(
     filepath: str,
     max_attempts: int = 10,
     compact_json: bool = False,
+    writer: JsonFileWriter | None = None,
+    dirty: set[str] | None = None,
 ) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
-    file_found = os.path.exists(f"{filepath}{filename}")
+    """Save and verify json file, backup or restore if saving failed
+
+    Args:
+        writer: incremental writer, serializes changed sections only,
+            skips saving unchanged file, and verifies by content hash.
+        dirty: changed section keys for incremental writer, None if all changed.
+    """
+    filename_source = f"{filepath}{filename}"
+    file_found = os.path.exists(filename_source)
+    if writer is not None:
+        raw_data = writer.serialize(dict_user, dirty)
+        digest = content_hash(raw_data)
+        if file_found and writer.is_unchanged(digest, filename_source):
+            logger.info("USERDATA: %s unchanged, skip saving", filename)
+            return
     # Create backup: abort saving if backup failed; skip backup and create new if not exist
     if not file_found:
         logger.info("USERDATA: %s not found, create new", filename)
@@ -213,9 +393,15 @@ def save_and_verify_json_file(
     attempts = max_attempts
     timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
-            break
+        if writer is not None:
+            save_raw_file(raw_data, filename, filepath)
+            if verify_raw_file(digest, filename, filepath):
+                writer.set_saved(digest, filename_source)
+                break
+        else:
+            save_json_file(dict_user, filename, filepath, compact_json=compact_json)
+            if verify_json_file(dict_user, filename, filepath):
+                break
         attempts -= 1
         logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
         sleep(0.05)
@@ -237,3 +423,6 @@ def save_and_verify_json_file(
         max_attempts - attempts,
         attempts,
     )
+
+
+preset_cache = PresetCache()
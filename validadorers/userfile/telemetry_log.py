@@ -0,0 +1,209 @@
+
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import zipfile
+from array import array
+
+from ..const_file import FileExt
+from ..validator import invalid_save_name
+
+logger = logging.getLogger(__name__)
+
+# Channel name, array type code
+TELEMETRY_CHANNELS = (
+    ("distance", "f"),
+    ("laptime", "f"),
+    ("speed", "f"),
+    ("throttle", "f"),
+    ("brake", "f"),
+    ("steering", "f"),
+    ("gear", "b"),
+    ("rpm", "f"),
+    ("tyre_temp_fl", "f"),
+    ("tyre_temp_fr", "f"),
+    ("tyre_temp_rl", "f"),
+    ("tyre_temp_rr", "f"),
+    ("tyre_pres_fl", "f"),
+    ("tyre_pres_fr", "f"),
+    ("tyre_pres_rl", "f"),
+    ("tyre_pres_rr", "f"),
+    ("pos_x", "f"),
+    ("pos_y", "f"),
+    ("pos_z", "f"),
+)
+TELEMETRY_INFO = "info.json"
+IS_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class TelemetryBuffer:
+    """Preallocated columnar telemetry buffer for one lap
+
+    Attributes:
+        capacity: max number of samples.
+        count: number of recorded samples.
+        columns: channel data arrays, in order of TELEMETRY_CHANNELS.
+    """
+
+    __slots__ = (
+        "capacity",
+        "count",
+        "columns",
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = max(int(capacity), 1)
+        self.count = 0
+        self.columns = tuple(
+            array(typecode, bytes(array(typecode).itemsize * self.capacity))
+            for _, typecode in TELEMETRY_CHANNELS
+        )
+
+    def reset(self):
+        """Reset buffer, keep allocated memory"""
+        self.count = 0
+
+    def is_full(self) -> bool:
+        """Whether buffer is full"""
+        return self.count >= self.capacity
+
+    def record(
+        self,
+        distance: float,
+        laptime: float,
+        speed: float,
+        throttle: float,
+        brake: float,
+        steering: float,
+        gear: int,
+        rpm: float,
+        tyre_temp: tuple[float, ...],
+        tyre_pres: tuple[float, ...],
+        pos_xyz: tuple[float, float, float],
+    ) -> bool:
+        """Record sample in place, returns False if buffer is full"""
+        index = self.count
+        if index >= self.capacity:
+            return False
+        columns = self.columns
+        columns[0][index] = distance
+        columns[1][index] = laptime
+        columns[2][index] = speed
+        columns[3][index] = throttle
+        columns[4][index] = brake
+        columns[5][index] = steering
+        columns[6][index] = min(max(gear, -128), 127)
+        columns[7][index] = rpm
+        columns[8][index] = tyre_temp[0]
+        columns[9][index] = tyre_temp[1]
+        columns[10][index] = tyre_temp[2]
+        columns[11][index] = tyre_temp[3]
+        columns[12][index] = tyre_pres[0]
+        columns[13][index] = tyre_pres[1]
+        columns[14][index] = tyre_pres[2]
+        columns[15][index] = tyre_pres[3]
+        columns[16][index] = pos_xyz[0]
+        columns[17][index] = pos_xyz[1]
+        columns[18][index] = pos_xyz[2]
+        self.count = index + 1
+        return True
+
+
+def column_to_bytes(column: array, count: int) -> bytes:
+    """Convert column data to little-endian bytes"""
+    data = column[:count]
+    if IS_BIG_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+def bytes_to_column(typecode: str, raw_data: bytes) -> array:
+    """Convert little-endian bytes to column data"""
+    data = array(typecode)
+    data.frombytes(raw_data)
+    if IS_BIG_ENDIAN:
+        data.byteswap()
+    return data
+
+
+def load_telemetry_lap_list(
+    filepath: str, filename: str, extension: str = FileExt.TELEMETRY
+) -> tuple[str, ...]:
+    """Load recorded lap id list from telemetry log file (*.telemetry), oldest first"""
+    try:
+        with zipfile.ZipFile(f"{filepath}{filename}{extension}", "r") as zfile:
+            return tuple(sorted(
+                name.split("/", 1)[0] for name in zfile.namelist()
+                if name.endswith(f"/{TELEMETRY_INFO}")
+            ))
+    except FileNotFoundError:
+        logger.info("MISSING: telemetry log (%s) data", extension)
+    except (zipfile.BadZipFile, OSError):
+        logger.info("MISSING: invalid telemetry log (%s) data", extension)
+    return ()
+
+
+def load_telemetry_lap(
+    filepath: str, filename: str, lap_id: str, channels: tuple[str, ...] | None = None,
+    extension: str = FileExt.TELEMETRY,
+) -> tuple[dict, dict[str, array]] | None:
+    """Load recorded lap from telemetry log file (*.telemetry)
+
+    Args:
+        filepath: file path.
+        filename: file name (combo name).
+        lap_id: recorded lap id.
+        channels: channel names to load, None for all channels.
+
+    Returns:
+        Lap info dict and channel data dict, or None if not found.
+    """
+    try:
+        with zipfile.ZipFile(f"{filepath}{filename}{extension}", "r") as zfile:
+            lap_info = json.loads(zfile.read(f"{lap_id}/{TELEMETRY_INFO}"))
+            lap_channels = lap_info["channels"]
+            if channels is None:
+                channels = tuple(lap_channels)
+            dataset = {
+                name: bytes_to_column(lap_channels[name], zfile.read(f"{lap_id}/{name}"))
+                for name in channels
+                if name in lap_channels
+            }
+        return lap_info, dataset
+    except FileNotFoundError:
+        logger.info("MISSING: telemetry log (%s) data", extension)
+    except (KeyError, ValueError, TypeError, zipfile.BadZipFile, OSError):
+        logger.info("MISSING: invalid telemetry log (%s) lap data", extension)
+    return None
+
+
+def save_telemetry_lap(
+    filepath: str, filename: str, lap_id: str, lap_info: dict, buffer: TelemetryBuffer,
+    extension: str = FileExt.TELEMETRY,
+) -> None:
+    """Append recorded lap to telemetry log file (*.telemetry)
+
+    Each channel is saved as separated deflate compressed column entry,
+    appending new lap does not rewrite existing laps.
+    """
+    count = buffer.count
+    if count < 10 or invalid_save_name(filename):
+        return
+    lap_info = lap_info.copy()
+    lap_info["samples"] = count
+    lap_info["channels"] = dict(TELEMETRY_CHANNELS)
+    try:
+        with zipfile.ZipFile(
+            f"{filepath}{filename}{extension}", "a",
+            compression=zipfile.ZIP_DEFLATED, compresslevel=6,
+        ) as zfile:
+            for (name, _), column in zip(TELEMETRY_CHANNELS, buffer.columns):
+                zfile.writestr(f"{lap_id}/{name}", column_to_bytes(column, count))
+            # Write info last, lap without info is ignored on loading
+            zfile.writestr(f"{lap_id}/{TELEMETRY_INFO}", json.dumps(lap_info))
+        logger.info("USERDATA: %s%s lap %s saved", filename, extension, lap_id)
+    except (zipfile.BadZipFile, OSError):
+        logger.error("USERDATA: failed saving %s%s lap %s", filename, extension, lap_id)
@@ -32,6 +32,7 @@ __all__ = [
     "brake_pressure",
     "brake_temperature",
     "brake_wear",
+    "corner_delta",
     "cruise",
     "damage",
     "deltabest",
@@ -46,11 +47,13 @@ __all__ = [
     "friction_circle",
     "fuel",
     "fuel_energy_saver",
+    "gap_graph",
     "gear",
     "heading",
     "instrument",
     "lap_time_history",
     "laps_and_position",
+    "mini_sectors",
     "navigation",
     "p2p",
     "pace_notes",
@@ -72,6 +75,7 @@ __all__ = [
     "steering",
     "steering_wheel",
     "stint_history",
+    "strategy",
     "suspension_force",
     "suspension_position",
     "system_performance",
@@ -100,6 +104,7 @@ from . import brake_performance
 from . import brake_pressure
 from . import brake_temperature
 from . import brake_wear
+from . import corner_delta
 from . import cruise
 from . import damage
 from . import deltabest
@@ -114,11 +119,13 @@ from . import force
 from . import friction_circle
 from . import fuel
 from . import fuel_energy_saver
+from . import gap_graph
 from . import gear
 from . import heading
 from . import instrument
 from . import lap_time_history
 from . import laps_and_position
+from . import mini_sectors
 from . import navigation
 from . import p2p
 from . import pace_notes
@@ -140,6 +147,7 @@ from . import standings_hybrid  # Corrigido: garantir que o widget híbrido seja
 from . import steering
 from . import steering_wheel
 from . import stint_history
+from . import strategy
 from . import suspension_force
 from . import suspension_position
 from . import system_performance
@@ -33,6 +33,7 @@ from .. import overlay_signal, realtime_state
 from .. import regex_pattern as rxp
 from ..const_app import APP_NAME
 from ..formatter import format_module_name
+from ..module_info import InfoSubscriber, minfo
 from ..setting import Setting
 from ._common import ExLabel, FontMetrics, MousePosition
 
@@ -58,6 +59,9 @@ class Overlay(QWidget):
         self.setWindowTitle(f"{APP_NAME} - {widget_name.capitalize()}")
         self.move(self.wcfg["position_x"], self.wcfg["position_y"])
 
+        # Module info change subscribers
+        self._info_subscribers: list[InfoSubscriber] = []
+
         # Set update timer
         self._update_timer = QBasicTimer()
         self._update_interval = max(
@@ -76,6 +80,7 @@ class Overlay(QWidget):
         """Stop and close widget"""
         self.__toggle_timer(True)
         self.__break_signal()
+        self.__unsubscribe_info()
         self.unload_resource()
         self.wcfg = None
         self.cfg = None
@@ -84,6 +89,29 @@ class Overlay(QWidget):
     def post_update(self):
         """Run once after state inactive"""
 
+    def subscribe_info(self, *names: str) -> InfoSubscriber:
+        """Subscribe module info change notification
+
+        Subscriber is marked dirty only when any subscribed info block changed,
+        check subscriber.changed() in timerEvent to skip idle update.
+        Unsubscribe automatically on close.
+
+        Args:
+            names: module info block names, such as "fuel", "delta".
+
+        Returns:
+            InfoSubscriber object.
+        """
+        subscriber = minfo.subscribe(*names)
+        self._info_subscribers.append(subscriber)
+        return subscriber
+
+    def __unsubscribe_info(self):
+        """Unsubscribe all module info change notification"""
+        for subscriber in self._info_subscribers:
+            minfo.unsubscribe(subscriber)
+        self._info_subscribers.clear()
+
     def unload_resource(self):
         """Unload resource (such as images) on close, can re-implement in widget"""
         instance_var_list = dir(self)
@@ -177,7 +205,7 @@ class Overlay(QWidget):
             self.wcfg["position_y"] = self.y()
             save_changes = True
         if save_changes:
-            self.cfg.save()
+            self.cfg.save(section=self.widget_name)
 
     @Slot(bool)  # type: ignore[operator]
     def __toggle_lock(self, locked: bool):
@@ -23,7 +23,9 @@ Overlay base painter class.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QRectF, Qt
+from array import array
+
+from PySide6.QtCore import QPointF, QRectF, Qt
 from PySide6.QtGui import QFont, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
@@ -387,3 +389,150 @@ class TextBar(QWidget):
         pen.setColor(self.fg_color)
         painter.setPen(pen)
         painter.drawText(self.rect_text, Qt.AlignCenter, self.text)
+
+
+class ScrollingPlot:
+    """Scrolling plot
+
+    Plot is drawn on a circular offscreen pixmap. Write head moves one column
+    per flushed sample, only the new column is painted over the oldest column,
+    and final plot is composited with two blits (newest column on the left).
+
+    Multiple series are supported. With decimation (samples per column) above 1,
+    min/max envelope of accumulated samples is also drawn on each line column.
+    """
+
+    __slots__ = (
+        "pixmap",
+        "_width",
+        "_height",
+        "_column_width",
+        "_decimation",
+        "_clear_padding",
+        "_head",
+        "_samples",
+        "_started",
+        "_series",
+        "_last_values",
+        "_new_values",
+        "_min_values",
+        "_max_values",
+    )
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        column_width: int = 1,
+        decimation: int = 1,
+        clear_padding: int = 0,
+    ):
+        """
+        Args:
+            width: plot width in pixel.
+            height: plot height in pixel.
+            column_width: column width in pixel per flushed sample.
+            decimation: number of samples combined into one column.
+            clear_padding: extra pixel cleared on oldest side of new column,
+                set to max line width to remove line cap leftovers.
+        """
+        self._width = max(int(width), 1)
+        self._height = max(int(height), 1)
+        self._column_width = max(int(column_width), 1)
+        self._decimation = max(int(decimation), 1)
+        self._clear_padding = max(int(clear_padding), 0)
+        self._head = 0
+        self._samples = 0
+        self._started = False
+        self._series: list[tuple[QPen, bool]] = []
+        self._last_values = array("d")
+        self._new_values = array("d")
+        self._min_values = array("d")
+        self._max_values = array("d")
+        self.pixmap = QPixmap(self._width, self._height)
+        self.pixmap.fill(Qt.transparent)
+
+    def add_series(self, pen: QPen, point_style: bool = False) -> int:
+        """Add plot series, draw in order of added
+
+        Returns:
+            Series index.
+        """
+        self._series.append((pen, point_style))
+        for values in (self._last_values, self._new_values, self._min_values, self._max_values):
+            values.append(0.0)
+        return len(self._series) - 1
+
+    def clear(self):
+        """Clear plot"""
+        self._head = 0
+        self._samples = 0
+        self._started = False
+        self.pixmap.fill(Qt.transparent)
+
+    def append(self, values: array) -> bool:
+        """Append new sample of all series
+
+        Args:
+            values: y position of each series in order of series index.
+
+        Returns:
+            True if new column painted.
+        """
+        first_sample = not self._samples
+        new_values = self._new_values
+        min_values = self._min_values
+        max_values = self._max_values
+        for index, value in enumerate(values):
+            new_values[index] = value
+            if first_sample or value < min_values[index]:
+                min_values[index] = value
+            if first_sample or value > max_values[index]:
+                max_values[index] = value
+        self._samples += 1
+        if self._samples < self._decimation:
+            return False
+        self.__paint_column()
+        self._samples = 0
+        return True
+
+    def draw(self, painter: QPainter, pos_x: int = 0, pos_y: int = 0):
+        """Composite plot to target painter with two blits"""
+        head = self._head
+        painter.drawPixmap(pos_x, pos_y, self.pixmap, head, 0, self._width - head, 0)
+        if head:
+            painter.drawPixmap(pos_x + self._width - head, pos_y, self.pixmap, 0, 0, head, 0)
+
+    def __paint_column(self):
+        """Paint new column at write head"""
+        width = self._width
+        column_width = self._column_width
+        head = self._head = (self._head - column_width) % width
+        painter = QPainter(self.pixmap)
+        # Clear oldest column
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        clear_left = head - self._clear_padding
+        painter.fillRect(clear_left, 0, head + column_width - clear_left, self._height, Qt.transparent)
+        if clear_left < 0:
+            painter.fillRect(width + clear_left, 0, -clear_left, self._height, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Draw new column
+        pos_new = head
+        pos_last = head + column_width
+        is_envelope = self._samples > 1
+        last_values = self._last_values
+        for index, (pen, point_style) in enumerate(self._series):
+            value = self._new_values[index]
+            painter.setPen(pen)
+            if point_style:
+                painter.drawPoint(QPointF(pos_new, value))
+            elif self._started:
+                painter.drawLine(QPointF(pos_last, last_values[index]), QPointF(pos_new, value))
+            if is_envelope and not point_style:
+                painter.drawLine(
+                    QPointF(pos_new, self._min_values[index]),
+                    QPointF(pos_new, self._max_values[index]),
+                )
+            last_values[index] = value
+        self._started = True
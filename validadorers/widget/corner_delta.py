@@ -0,0 +1,145 @@
+#  SectorFlow is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 SectorFlow developers
+#  Based on TinyPedal - Copyright (C) 2022-2025 TinyPedal developers
+#
+#  This file is part of SectorFlow.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Corner Delta Widget
+"""
+
+from bisect import bisect_right
+
+from ..module_info import minfo
+from ._base import Overlay
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config, widget_name):
+        # Assign base setting
+        super().__init__(config, widget_name)
+        layout = self.set_grid_layout(gap=self.wcfg["bar_gap"])
+        self.set_primary_layout(layout=layout)
+
+        # Config font
+        font_m = self.get_font_metrics(
+            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+
+        # Config variable
+        bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
+        self.delta_source = f"delta{self.wcfg['deltabest_source']}"
+        self.name_width = max(int(self.wcfg["corner_name_width"]), 1)
+
+        # Base style
+        self.set_base_style(self.set_qss(
+            font_family=self.wcfg["font_name"],
+            font_size=self.wcfg["font_size"],
+            font_weight=self.wcfg["font_weight"])
+        )
+
+        # Corner name
+        bar_style_name = self.set_qss(
+            fg_color=self.wcfg["font_color_corner_name"],
+            bg_color=self.wcfg["bkg_color_corner_name"]
+        )
+        self.bar_name = self.set_qlabel(
+            text="-",
+            style=bar_style_name,
+            width=font_m.width * self.name_width + bar_padx,
+        )
+
+        # Corner delta
+        self.bar_style_delta = (
+            self.set_qss(
+                fg_color=self.wcfg["font_color_time_gain"],
+                bg_color=self.wcfg["bkg_color_corner_delta"]),
+            self.set_qss(
+                fg_color=self.wcfg["font_color_time_loss"],
+                bg_color=self.wcfg["bkg_color_corner_delta"]),
+            self.set_qss(
+                fg_color=self.wcfg["font_color_corner_delta"],
+                bg_color=self.wcfg["bkg_color_corner_delta"]),
+        )
+        self.bar_delta = self.set_qlabel(
+            text="-.---",
+            style=self.bar_style_delta[2],
+            width=font_m.width * 7 + bar_padx,
+        )
+
+        # Set layout
+        if self.wcfg["layout"] == 0:  # horizontal
+            layout.addWidget(self.bar_name, 0, 0)
+            layout.addWidget(self.bar_delta, 0, 1)
+        else:
+            layout.addWidget(self.bar_name, 0, 0)
+            layout.addWidget(self.bar_delta, 1, 0)
+
+        # Last data
+        self.last_corners = None
+        self.corner_starts = ()
+        self.corner_index = -1  # current corner index, -1 if not in corner
+        self.entry_delta = 0.0  # delta at corner entry
+        self.delta_info = self.subscribe_info("delta")
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        if not self.delta_info.changed():
+            return
+
+        corners = minfo.mapping.corners
+        if self.last_corners is not corners:
+            self.last_corners = corners
+            self.corner_starts = tuple(corner.start for corner in corners)
+            self.corner_index = -1
+            self.update_name(self.bar_name, "-")
+            self.update_delta(self.bar_delta, None)
+
+        if not corners:
+            return
+
+        lap_distance = minfo.delta.lapDistance
+        delta = getattr(minfo.delta, self.delta_source)
+        index = bisect_right(self.corner_starts, lap_distance) - 1
+        in_corner = index >= 0 and lap_distance <= corners[index].end
+
+        if in_corner:
+            if self.corner_index != index:  # corner entry
+                self.corner_index = index
+                self.entry_delta = delta
+                self.update_name(self.bar_name, corners[index].name)
+            self.update_delta(self.bar_delta, delta - self.entry_delta)
+        elif self.corner_index >= 0:  # corner exit, keep last corner result
+            self.corner_index = -1
+
+    # GUI update methods
+    def update_name(self, target, data):
+        """Corner name"""
+        if target.last != data:
+            target.last = data
+            target.setText(data[:self.name_width])
+
+    def update_delta(self, target, data):
+        """Corner delta, positive = time lost"""
+        if target.last != data:
+            target.last = data
+            if data is None:
+                target.setText("-.---")
+                target.updateStyle(self.bar_style_delta[2])
+            else:
+                target.setText(f"{data:+.3f}"[:7])
+                target.updateStyle(self.bar_style_delta[data > 0])
@@ -96,9 +96,13 @@ class Realtime(Overlay):
         self.delta_best = 0
         self.last_laptime = 0
         self.new_lap = True
+        self.delta_info = self.subscribe_info("delta")
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if not self.delta_info.changed():
+            return
+
         if minfo.delta.lapTimeCurrent < self.freeze_duration:
             temp_best = minfo.delta.lapTimeLast - self.last_laptime
             self.new_lap = True
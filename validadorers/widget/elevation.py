@@ -26,6 +26,7 @@ from PySide6.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 
 from .. import calculation as calc
 from ..api_control import api
+from ..map_index import MapLOD, max_pixel_error
 from ..module_info import minfo
 from ..units import set_symbol_distance, set_unit_distance
 from ._base import Overlay
@@ -173,20 +174,24 @@ class Realtime(Overlay):
             map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
 
             # Set middle nodes
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.display_width, self.display_detail_level)
+            # Select elevation detail level, error stays under max pixel error
+            map_lod = minfo.mapping.elevationsLOD
+            if map_lod is None or map_lod.coords is not raw_coords:
+                map_lod = MapLOD(raw_coords, vertical=True)
+            map_scaled = self.map_scaled
+            total_nodes = len(map_scaled) - 1
+            nodes = map_lod.level_index(
+                max_pixel_error(self.display_detail_level) / max(self.map_scale[1], 0.000001))
             last_dist = 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
+            for index in nodes:
+                coords = map_scaled[index]
                 if index == 0:
                     map_path.lineTo(0, sf_y_average)
-                elif index >= total_nodes:  # don't skip last node
+                elif index >= total_nodes:
                     map_path.lineTo(self.display_width, sf_y_average)
-                elif coords[0] > last_dist and last_skip >= skip_node:
+                elif coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                     last_dist = coords[0]
-                last_skip += 1
 
             # Set boundary end node
             map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
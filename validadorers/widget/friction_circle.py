@@ -21,15 +21,137 @@
 Friction circle Widget
 """
 
-from collections import deque
+from array import array
 
 from PySide6.QtCore import QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap, QRadialGradient
+from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, QPixmap, QRadialGradient
 
 from .. import calculation as calc
 from ..module_info import minfo
 from ._base import Overlay
 
+FADE_STEP_SAMPLES = 4  # number of new samples between each fade compositing
+
+
+class TraceBuffer:
+    """Trace coordinates ring buffer
+
+    Preallocated x,y coordinates array, oldest sample is overwritten when full.
+    """
+
+    __slots__ = (
+        "_data",
+        "_size",
+        "_head",
+        "count",
+    )
+
+    def __init__(self, size: int):
+        self._data = array("f", bytes(8 * size))  # x,y pairs
+        self._size = size
+        self._head = 0  # next write index
+        self.count = 0
+
+    def clear(self):
+        """Clear samples"""
+        self._head = 0
+        self.count = 0
+
+    def append(self, pos_x: float, pos_y: float):
+        """Append new sample"""
+        index = self._head * 2
+        self._data[index] = pos_x
+        self._data[index + 1] = pos_y
+        self._head = (self._head + 1) % self._size
+        if self.count < self._size:
+            self.count += 1
+
+    def newest(self, offset: int = 0) -> QPointF:
+        """Get newest sample point, offset 1 for previous sample"""
+        index = (self._head - 1 - offset) % self._size * 2
+        return QPointF(self._data[index], self._data[index + 1])
+
+    def oldest(self, offset: int = 0) -> QPointF:
+        """Get oldest sample point, offset 1 for next sample"""
+        index = (self._head - self.count + offset) % self._size * 2
+        return QPointF(self._data[index], self._data[index + 1])
+
+    def is_full(self) -> bool:
+        """Whether buffer is full, next sample overwrites oldest sample"""
+        return self.count >= self._size
+
+
+class TraceCoverage:
+    """Trace pixel coverage counter
+
+    Count number of trace segments (or points) covering each pixel, so that
+    oldest segment can be erased without removing pixels of newer segments
+    that overlap it. Cost is proportional to segment length, not sample count.
+    """
+
+    __slots__ = (
+        "_counts",
+        "_width",
+        "_height",
+        "_kernel",
+    )
+
+    def __init__(self, width: int, height: int, pen_width: int):
+        self._counts = array("i", bytes(4 * width * height))
+        self._width = width
+        self._height = height
+        radius = max(pen_width, 1) // 2 + 2  # include antialiasing edge
+        self._kernel = tuple(
+            (offset_x, offset_y)
+            for offset_x in range(-radius, radius + 1)
+            for offset_y in range(-radius, radius + 1)
+            if offset_x * offset_x + offset_y * offset_y <= radius * radius
+        )
+
+    def clear(self):
+        """Clear coverage"""
+        self._counts = array("i", bytes(4 * self._width * self._height))
+
+    def add(self, pos1: QPointF, pos2: QPointF):
+        """Add segment (or point if same position) coverage"""
+        counts = self._counts
+        for index in self.pixels(pos1, pos2):
+            counts[index] += 1
+
+    def remove(self, pos1: QPointF, pos2: QPointF) -> list[tuple[int, int]]:
+        """Remove segment (or point) coverage, return uncovered pixels"""
+        counts = self._counts
+        width = self._width
+        uncovered = []
+        for index in self.pixels(pos1, pos2):
+            counts[index] -= 1
+            if counts[index] <= 0:
+                counts[index] = 0
+                uncovered.append((index % width, index // width))
+        return uncovered
+
+    def pixels(self, pos1: QPointF, pos2: QPointF) -> set[int]:
+        """Pixel indexes covered by segment"""
+        x1, y1 = pos1.x(), pos1.y()
+        x2, y2 = pos2.x(), pos2.y()
+        steps = int(max(abs(x2 - x1), abs(y2 - y1))) + 1
+        step_x = (x2 - x1) / steps
+        step_y = (y2 - y1) / steps
+        centers = {
+            (int(x1 + step_x * step), int(y1 + step_y * step))
+            for step in range(steps + 1)
+        }
+        width = self._width
+        height = self._height
+        indexes = set()
+        for center_x, center_y in centers:
+            for offset_x, offset_y in self._kernel:
+                pos_x = center_x + offset_x
+                pos_y = center_y + offset_y
+                if 0 <= pos_x < width and 0 <= pos_y < height:
+                    indexes.add(pos_y * width + pos_x)
+        return indexes
+
 
 class Realtime(Overlay):
     """Draw widget"""
@@ -86,12 +208,18 @@ class Realtime(Overlay):
         self.resize(self.area_size, self.area_size)
         self.pixmap_background = QPixmap(self.area_size, self.area_size)
         self.pixmap_dot = QPixmap(self.dot_size * 2, self.dot_size * 2)
-        self.pixmap_trace = QPixmap(self.area_size, self.area_size)
-        self.pixmap_trace.fill(Qt.transparent)
+        self.image_trace = QImage(
+            self.area_size, self.area_size, QImage.Format_ARGB32_Premultiplied)
+        self.image_trace.fill(Qt.transparent)
         if self.wcfg["show_trace_fade_out"]:
-            trace_alpha = int(255 * min(max(self.wcfg["trace_fade_out_step"], 0.1), 0.9) / 2)
+            # Combine fade out steps for compositing once per FADE_STEP_SAMPLES
+            fade_step = min(max(self.wcfg["trace_fade_out_step"], 0.1), 0.9) / 2
+            trace_alpha = int(255 * (1 - (1 - fade_step) ** FADE_STEP_SAMPLES))
             self.pixmap_fademask = QPixmap(self.area_size, self.area_size)
             self.pixmap_fademask.fill(QColor(0, 0, 0, trace_alpha))
+        else:
+            self.trace_coverage = TraceCoverage(
+                self.area_size, self.area_size, self.wcfg["trace_width"])
 
         self.pen_mark = QPen()
         self.pen_trace = QPen()
@@ -109,12 +237,18 @@ class Realtime(Overlay):
 
         # Last data
         self.gforce_raw = 0,0
-        self.data_gforce = deque([], max(self.wcfg["trace_max_samples"], 5))
+        trace_max_samples = max(self.wcfg["trace_max_samples"], 5)
+        self.data_gforce = TraceBuffer(trace_max_samples)
+        self.trace_pending_samples = 0
         self.last_x = self.area_center
         self.last_y = self.area_center
 
     def post_update(self):
         self.data_gforce.clear()
+        self.trace_pending_samples = 0
+        self.image_trace.fill(Qt.transparent)
+        if not self.wcfg["show_trace_fade_out"]:
+            self.trace_coverage.clear()
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -136,8 +270,7 @@ class Realtime(Overlay):
             self.last_x = temp_gforce_raw[1] * self.global_scale + self.area_center
             self.last_y = temp_gforce_raw[0] * self.global_scale + self.area_center
             if self.wcfg["show_trace"]:
-                self.data_gforce.append(QPointF(self.last_x, self.last_y))
-                self.draw_trace()
+                self.draw_trace(self.last_x, self.last_y)
             self.update()
 
     # GUI update methods
@@ -158,7 +291,7 @@ class Realtime(Overlay):
             )
         # Draw trace
         if self.wcfg["show_trace"]:
-            painter.drawPixmap(0, 0, self.pixmap_trace)
+            painter.drawImage(0, 0, self.image_trace)
         # Draw dot
         if self.wcfg["show_dot"]:
             painter.drawPixmap(
@@ -235,21 +368,45 @@ class Realtime(Overlay):
             painter.setPen(self.pen_mark)
             painter.drawEllipse(pos, pos, size, size)
 
-    def draw_trace(self):
-        """Draw trace image"""
-        painter = QPainter(self.pixmap_trace)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    def draw_trace(self, pos_x: float, pos_y: float):
+        """Draw trace image
+
+        Only newest trace segment is painted on persistent trace image.
+        With fade out, fade mask is composited once per FADE_STEP_SAMPLES;
+        without fade out, oldest segment is erased once buffer is full,
+        so trace always shows exactly max samples.
+        """
+        data = self.data_gforce
+        is_points = self.wcfg["trace_style"]
         if self.wcfg["show_trace_fade_out"]:
-            painter.setCompositionMode(QPainter.CompositionMode_DestinationOut)
-            painter.drawPixmap(0, 0, self.pixmap_fademask)
-            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            data.append(pos_x, pos_y)
         else:
-            self.pixmap_trace.fill(Qt.transparent)
+            coverage = self.trace_coverage
+            if data.is_full():
+                oldest = data.oldest()
+                uncovered = coverage.remove(oldest, oldest if is_points else data.oldest(1))
+                for pixel_x, pixel_y in uncovered:
+                    self.image_trace.setPixel(pixel_x, pixel_y, 0)
+            data.append(pos_x, pos_y)
+            if is_points:
+                coverage.add(data.newest(), data.newest())
+            elif data.count >= 2:  # first point is covered by first segment
+                coverage.add(data.newest(1), data.newest())
+
+        painter = QPainter(self.image_trace)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        if self.wcfg["show_trace_fade_out"]:
+            self.trace_pending_samples += 1
+            if self.trace_pending_samples >= FADE_STEP_SAMPLES:
+                self.trace_pending_samples = 0
+                painter.setCompositionMode(QPainter.CompositionMode_DestinationOut)
+                painter.drawPixmap(0, 0, self.pixmap_fademask)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         painter.setPen(self.pen_trace)
-        if self.wcfg["trace_style"]:
-            painter.drawPoints(self.data_gforce)
+        if is_points or data.count < 2:
+            painter.drawPoint(data.newest())
         else:
-            painter.drawPolyline(self.data_gforce)
+            painter.drawLine(data.newest(1), data.newest())
 
     def draw_dot(self):
         """Draw dot image (one time)"""
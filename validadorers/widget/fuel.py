@@ -327,10 +327,15 @@ class Realtime(Overlay):
             self.wcfg["warning_flash_interval"],
             self.wcfg["number_of_warning_flashes"],
         )
+        self.fuel_info = self.subscribe_info("fuel")
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         is_low_fuel = minfo.fuel.estimatedLaps <= self.wcfg["low_fuel_lap_threshold"]
+        # Skip if fuel data not changed, keep updating low fuel warning flash
+        if not self.fuel_info.changed() and not is_low_fuel:
+            return
+
         if self.wcfg["show_low_fuel_warning_flash"] and minfo.fuel.estimatedValidConsumption:
             is_low_fuel = self.warn_flash.state(is_low_fuel)
             if is_low_fuel:
@@ -0,0 +1,144 @@
+#  SectorFlow is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 SectorFlow developers
+#  Based on TinyPedal - Copyright (C) 2022-2025 TinyPedal developers
+#
+#  This file is part of SectorFlow.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Gap Graph Widget
+"""
+
+from math import isnan
+
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QPainter, QPainterPath, QPen
+
+from ..module_info import minfo
+from ._base import Overlay
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config, widget_name):
+        # Assign base setting
+        super().__init__(config, widget_name)
+
+        # Config variable
+        self.margin = max(int(self.wcfg["display_margin"]), 0)
+        self.display_width = max(int(self.wcfg["display_width"]), 10)
+        self.display_height = max(int(self.wcfg["display_height"]), 10)
+        self.gap_range = max(self.wcfg["gap_display_range"], 0.1)
+        self.show_trend = self.wcfg["show_intra_lap_trend"]
+        if self.show_trend:
+            self.max_samples = max(int(self.wcfg["number_of_trend_samples"]), 2)
+        else:
+            self.max_samples = max(int(self.wcfg["number_of_laps"]), 2)
+
+        # Config canvas
+        self.resize(self.display_width + self.margin * 2, self.display_height + self.margin * 2)
+
+        self.pen_ahead = self.set_line_pen(
+            self.wcfg["rival_ahead_color"], self.wcfg["rival_ahead_line_width"])
+        self.pen_behind = self.set_line_pen(
+            self.wcfg["rival_behind_color"], self.wcfg["rival_behind_line_width"])
+        self.pen_reference = self.set_line_pen(
+            self.wcfg["reference_line_color"], 1, Qt.DashLine)
+
+        # Last data
+        self.last_version = -1
+        self.last_rivals = (-1, -1)
+        self.path_ahead = QPainterPath()
+        self.path_behind = QPainterPath()
+        self.vehicles_info = self.subscribe_info("vehicles")
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        if not self.vehicles_info.changed():
+            return
+
+        plr_index = minfo.vehicles.playerIndex
+        classes_list = minfo.relative.classes
+        if 0 <= plr_index < len(classes_list):
+            rivals = tuple(classes_list[plr_index][4:6])
+        else:
+            rivals = (-1, -1)
+
+        gap_history = minfo.vehicles.gapHistory
+        if self.last_version != gap_history.version or self.last_rivals != rivals:
+            self.last_version = gap_history.version
+            self.last_rivals = rivals
+            ahead_index, behind_index = rivals
+            # Interval to rival ahead (player behind) & rival behind (rival behind player)
+            self.path_ahead = self.create_path(gap_history, plr_index, ahead_index)
+            self.path_behind = self.create_path(gap_history, behind_index, plr_index)
+            self.update()
+
+    # GUI update methods
+    def paintEvent(self, event):
+        """Draw gap graph"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.fillRect(self.rect(), self.wcfg["bkg_color"])
+        # Reference line at half range
+        if self.wcfg["show_reference_line"]:
+            pos_y = self.margin + self.display_height * 0.5
+            painter.setPen(self.pen_reference)
+            painter.drawLine(QPointF(0, pos_y), QPointF(self.width(), pos_y))
+        painter.setPen(self.pen_behind)
+        painter.drawPath(self.path_behind)
+        painter.setPen(self.pen_ahead)
+        painter.drawPath(self.path_ahead)
+
+    # Additional methods
+    @staticmethod
+    def set_line_pen(color, width, style=Qt.SolidLine):
+        """Set line pen"""
+        pen = QPen()
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setColor(color)
+        pen.setWidth(width)
+        pen.setStyle(style)
+        return pen
+
+    def create_path(self, gap_history, index, target):
+        """Create interval path of vehicle to target vehicle ahead"""
+        path = QPainterPath()
+        if index < 0 or target < 0:
+            return path
+        if self.show_trend:
+            gaps = enumerate(gap_history.trend_gaps(index, target, self.max_samples))
+            first = 0
+        else:
+            first = gap_history.last_lap(index) - self.max_samples + 1
+            gaps = gap_history.lap_gaps(index, target, self.max_samples)
+        x_scale = self.display_width / (self.max_samples - 1)
+        y_scale = self.display_height / self.gap_range
+        bottom = self.margin + self.display_height
+        new_line = True
+        for sample, gap in gaps:
+            if isnan(gap):
+                new_line = True
+                continue
+            point = QPointF(
+                self.margin + (sample - first) * x_scale,
+                bottom - min(max(gap, 0.0), self.gap_range) * y_scale,
+            )
+            if new_line:
+                path.moveTo(point)
+                new_line = False
+            else:
+                path.lineTo(point)
+        return path
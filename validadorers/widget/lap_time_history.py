@@ -90,7 +90,10 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["bkg_color_last_time"]),
             self.set_qss(
                 fg_color=self.wcfg["font_color_invalid_laptime"],
-                bg_color=self.wcfg["bkg_color_last_time"])
+                bg_color=self.wcfg["bkg_color_last_time"]),
+            self.set_qss(
+                fg_color=self.wcfg["font_color_best_laptime"],
+                bg_color=self.wcfg["bkg_color_last_time"]),
         )
         self.bars_time = self.set_qlabel(
             text=TEXT_NOLAPTIME,
@@ -179,7 +182,10 @@ class Realtime(Overlay):
         ):
             self.last_data_version = minfo.history.consumptionDataVersion
             self.last_max_energy = max_energy
-            self.update_laps_history(minfo.history.consumptionDataSet)
+            self.update_laps_history(
+                minfo.history.consumptionDataSet,
+                minfo.history.consumptionSummary.stats("lapTimeLast").min,
+            )
 
     # GUI update methods
     def update_laps(self, target, data):
@@ -206,8 +212,8 @@ class Realtime(Overlay):
             target.last = data
             target.setText(f"{data:03.1f}"[:3])
 
-    def update_laps_history(self, dataset):
-        """Laps history data"""
+    def update_laps_history(self, dataset, best_laptime: float = 0.0):
+        """Laps history data, highlight fastest valid lap time"""
         is_energy = bool(self.wcfg["show_virtual_energy_if_available"] and api.read.vehicle.max_virtual_energy())
         for index in range(self.history_slot):
             if index < len(dataset):
@@ -222,8 +228,11 @@ class Realtime(Overlay):
                 self.update_time(self.bars_time[index], data.lapTimeLast)
                 self.update_fuel(self.bars_fuel[index], data.lastLapUsedEnergy if is_energy else data.lastLapUsedFuel)
                 self.update_wear(self.bars_wear[index], data.tyreAvgWearLast)
-                # Highlight invalid lap time
-                self.bars_time[index].updateStyle(self.bar_style_time[2 - data.isValidLap])
+                # Highlight invalid or fastest lap time
+                if data.isValidLap and data.lapTimeLast == best_laptime:
+                    self.bars_time[index].updateStyle(self.bar_style_time[3])
+                else:
+                    self.bars_time[index].updateStyle(self.bar_style_time[2 - data.isValidLap])
             elif not self.wcfg["show_empty_history"]:
                 unavailable = True
             else:
@@ -0,0 +1,96 @@
+#  SectorFlow is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 SectorFlow developers
+#  Based on TinyPedal - Copyright (C) 2022-2025 TinyPedal developers
+#
+#  This file is part of SectorFlow.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Mini Sectors Widget
+"""
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPainter
+
+from ..module_info import minfo
+from ._base import Overlay
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config, widget_name):
+        # Assign base setting
+        super().__init__(config, widget_name)
+
+        # Config variable
+        self.bar_length = max(int(self.wcfg["bar_length"]), 25)
+        self.bar_height = max(int(self.wcfg["bar_height"]), 1)
+        self.cell_gap = max(int(self.wcfg["bar_gap"]), 0)
+
+        # Mini sector state color (none, slower, personal best, class best)
+        self.state_color = (
+            self.wcfg["bkg_color_no_time"],
+            self.wcfg["bkg_color_slower"],
+            self.wcfg["bkg_color_personal_best"],
+            self.wcfg["bkg_color_class_best"],
+        )
+
+        # Config canvas
+        self.resize(self.bar_length, self.bar_height)
+        self.rect_cell = QRectF(0, 0, 0, self.bar_height)
+
+        # Last data
+        self.states = ()
+        self.current_sector = -1
+        self.vehicles_info = self.subscribe_info("vehicles")
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        if not self.vehicles_info.changed():
+            return
+
+        plr_index = minfo.vehicles.playerIndex
+        if plr_index < 0:
+            return
+
+        mini_sectors = minfo.vehicles.miniSectors
+        states = mini_sectors.states(plr_index)
+        if self.wcfg["show_current_mini_sector"]:
+            current_sector = (mini_sectors.last_sector[plr_index] + 1) % mini_sectors.sectors
+        else:
+            current_sector = -1
+
+        if self.states != states or self.current_sector != current_sector:
+            self.states = states
+            self.current_sector = current_sector
+            self.update()
+
+    # GUI update methods
+    def paintEvent(self, event):
+        """Draw mini sectors"""
+        total = len(self.states)
+        if total < 1:
+            return
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.wcfg["bkg_color"])
+        cell_width = (self.bar_length + self.cell_gap) / total - self.cell_gap
+        rect = self.rect_cell
+        rect.setWidth(max(cell_width, 1))
+        for sector, state in enumerate(self.states):
+            rect.moveLeft(sector * (cell_width + self.cell_gap))
+            if sector == self.current_sector:
+                painter.fillRect(rect, self.wcfg["bkg_color_current_mini_sector"])
+            else:
+                painter.fillRect(rect, self.state_color[state])
@@ -272,6 +272,16 @@ class Realtime(Overlay):
         if self.wcfg["show_vehicle_standings"]:
             painter.setPen(self.pen_text)
 
+        # Vehicles within view range
+        proximity = minfo.vehicles.proximity
+        if proximity.covers(self.view_range):
+            nearby = set(proximity.within(self.view_range))
+        else:
+            nearby = {
+                index for index in veh_draw_order
+                if veh_info[index].relativeStraightDistance < self.view_range
+            }
+
         # Draw vehicle within view range
         for index in veh_draw_order:
             data = veh_info[index]
@@ -287,7 +297,7 @@ class Realtime(Overlay):
                 painter.resetTransform()
 
             # Draw opponent vehicle in view range
-            elif data.relativeStraightDistance < self.view_range:
+            elif index in nearby:
                 # Rotated position relative to player
                 # Position = raw position * global scale + offset
                 pos_x = data.relativeRotatedPositionX * self.global_scale + self.area_center
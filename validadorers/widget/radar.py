@@ -86,6 +86,8 @@ class Realtime(Overlay):
         )
         self.vehicle_hide_range = self.set_range_dimension("vehicle_maximum_visible_distance")
         self.radar_hide_range = self.set_range_dimension("auto_hide_minimum_distance")
+        self.vehicle_query_range = self.query_range(self.vehicle_hide_range)
+        self.radar_query_range = self.query_range(self.radar_hide_range)
         self.radar_fade_factor = self.set_radar_fade_factor(self.radar_radius)
         self.radar_fade_color = QColor(0, 0, 0)
 
@@ -103,6 +105,18 @@ class Realtime(Overlay):
             self.cone_angle_l = left_start * 16, cone_angle * 16
             self.cone_angle_r = right_start * 16, cone_angle * 16
 
+        # Collision risk & approaching vehicle
+        self.show_collision_risk = self.wcfg["show_collision_risk"]
+        self.collision_risk_time = max(self.wcfg["collision_risk_time"], 0)
+        self.collision_risk_distance = max(self.wcfg["collision_risk_distance"], 0)
+        self.approaching_color = QColor(self.wcfg["approaching_indicator_color"])
+        self.rect_approaching = QRectF(
+            self.area_size * 0.25,
+            self.area_size - max(self.wcfg["approaching_indicator_width"], 1),
+            self.area_size * 0.5,
+            max(self.wcfg["approaching_indicator_width"], 1),
+        )
+
         # Config canvas
         self.resize(self.area_size, self.area_size)
         self.pixmap_mask = QPixmap(self.area_size, self.area_size)
@@ -169,6 +183,10 @@ class Realtime(Overlay):
                     self.radar_fade_color.setAlphaF(radar_alpha)
                     painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
                     painter.fillRect(self.rect_radar, self.radar_fade_color)
+            # Draw approaching vehicle indicator above fade mask
+            if self.wcfg["show_approaching_indicator"] and minfo.vehicles.approachingIndex >= 0:
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+                self.draw_approaching_indicator(painter)
 
     def draw_radar_mask(self):
         """Draw radar mask"""
@@ -297,6 +315,13 @@ class Realtime(Overlay):
             lin_gra.setColorAt(1, Qt.transparent)
             painter.fillRect(pos_right, 0, indicator.width, self.area_size, lin_gra)
 
+    def draw_approaching_indicator(self, painter):
+        """Draw approaching fast vehicle indicator at rear edge"""
+        approaching_time = minfo.vehicles.approachingTime
+        alpha = 1 / (1 + max(approaching_time, 0))  # more opaque as vehicle closer
+        self.approaching_color.setAlphaF(max(alpha, 0.3))
+        painter.fillRect(self.rect_approaching, self.approaching_color)
+
     def draw_vehicle(self, painter, indicator):
         """Draw opponents vehicles"""
         painter.setPen(self.pen_veh)
@@ -305,7 +330,7 @@ class Realtime(Overlay):
         nearest_right = indicator.max_range_x
 
         # Draw opponent vehicle within radar range
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
+        for veh_info in self.nearby_vehicles(self.vehicle_query_range):
             if veh_info.isPlayer:
                 continue
             # -x = left, +x = right, -y = ahead, +y = behind
@@ -369,6 +394,10 @@ class Realtime(Overlay):
 
     def color_lap_diff(self, veh_info):
         """Compare lap differences & set color"""
+        if (self.show_collision_risk and
+            0 <= veh_info.timeToClosestApproach <= self.collision_risk_time and
+            veh_info.closestApproachDistance <= self.collision_risk_distance):
+            return self.wcfg["vehicle_color_collision_risk"]
         if veh_info.positionOverall == 1:
             return self.wcfg["vehicle_color_leader"]
         if veh_info.inPit:
@@ -414,7 +443,9 @@ class Realtime(Overlay):
 
     def is_nearby(self):
         """Check nearby vehicles"""
-        for veh_info in islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles):
+        if self.wcfg["show_approaching_indicator"] and minfo.vehicles.approachingIndex >= 0:
+            return True
+        for veh_info in self.nearby_vehicles(self.radar_query_range):
             # -x = left, +x = right, -y = ahead, +y = behind
             if (not veh_info.isPlayer and
                 self.radar_hide_range.behind > veh_info.relativeRotatedPositionY > -self.radar_hide_range.ahead and
@@ -438,6 +469,21 @@ class Realtime(Overlay):
         offset = veh_width * self.global_scale * 0.5
         return IndicatorDimension(min_range_x, max_range_x, max_range_y, crit_range, width, edge, offset)
 
+    @staticmethod
+    def nearby_vehicles(query_range):
+        """Vehicles within query range, from proximity list if range covered"""
+        proximity = minfo.vehicles.proximity
+        if proximity.covers(query_range):
+            data_set = minfo.vehicles.dataSet
+            return (data_set[index] for index in proximity.within(query_range))
+        return islice(minfo.vehicles.dataSet, minfo.vehicles.totalVehicles)
+
+    @staticmethod
+    def query_range(distance_rect):
+        """Straight line range that covers distance rectangle"""
+        return calc.distance(
+            (0, 0), (max(distance_rect.ahead, distance_rect.behind), distance_rect.side))
+
     def set_range_dimension(self, prefix):
         """Set range dimension for radar & autohide"""
         if self.wcfg[f"{prefix}_ahead"] < 0:
@@ -298,6 +298,26 @@ class Realtime(Overlay):
                 fg_color=self.wcfg.get("font_color_player_last_laptime", self.wcfg["font_color_player_best_laptime"]),
                 bg_color=self.wcfg.get("bkg_color_player_last_laptime", self.wcfg["bkg_color_player_best_laptime"]))
         )
+        # Last laptime font color from mini sector state of last completed lap
+        self.show_mini_sector_state = self.wcfg.get("show_mini_sector_state", True)
+        self.bar_style_mini_sector = (
+            self.bar_style_llp,
+            *(
+                (
+                    self.set_qss(
+                        fg_color=self.wcfg.get(f"font_color_mini_sector_{state}", default_color),
+                        bg_color=self.wcfg.get("bkg_color_last_laptime", self.wcfg["bkg_color_best_laptime"])),
+                    self.set_qss(
+                        fg_color=self.wcfg.get(f"font_color_mini_sector_{state}", default_color),
+                        bg_color=self.wcfg.get("bkg_color_player_last_laptime", self.wcfg["bkg_color_player_best_laptime"])),
+                )
+                for state, default_color in (
+                    ("slower", "#FFCC00"),
+                    ("personal_best", "#00CC00"),
+                    ("class_best", "#CC00FF"),
+                )
+            ),
+        )
         self.bars_llp = self.set_qlabel(
             style=self.bar_style_llp[0],
             width=9 * font_m.width + bar_padx,
@@ -1357,7 +1377,7 @@ class Realtime(Overlay):
                         del self.invalid_lap_time[veh_idx]
                     
                     self.bars_llp[row_idx].setText(laptime_text)
-                    self.bars_llp[row_idx].setStyleSheet(self.bar_style_llp[data.isPlayer])
+                    self.bars_llp[row_idx].setStyleSheet(self.last_laptime_style(veh_idx, data.isPlayer))
             except:
                 # Se falhar ao obter flag, verifica apenas pelo sinal do tempo
                 if last_time < 0:
@@ -1381,7 +1401,7 @@ class Realtime(Overlay):
                     if veh_idx in self.invalid_lap_time:
                         del self.invalid_lap_time[veh_idx]
                     self.bars_llp[row_idx].setText(laptime_text)
-                    self.bars_llp[row_idx].setStyleSheet(self.bar_style_llp[data.isPlayer])
+                    self.bars_llp[row_idx].setStyleSheet(self.last_laptime_style(veh_idx, data.isPlayer))
         else:
             # Nenhuma volta completada ainda - mostra apenas "--"
             self.bars_llp[row_idx].setText("--")
@@ -1396,6 +1416,13 @@ class Realtime(Overlay):
         # Update vehicle damage
         self.update_damage(row_idx, veh_idx, data.isPlayer)
 
+    def last_laptime_style(self, veh_idx, is_player):
+        """Last laptime style, colored by mini sector state of last completed lap"""
+        if self.show_mini_sector_state:
+            state = minfo.vehicles.miniSectors.lap_state(veh_idx)
+            return self.bar_style_mini_sector[state][is_player]
+        return self.bar_style_llp[is_player]
+
     def update_gap(self, row_idx, veh_idx, place, veh_class, is_player):
         """Update gap - relative distance in race, lap times in quali/prac
         
@@ -1782,6 +1809,10 @@ class Realtime(Overlay):
 
     def calculate_time_gap_relative(self, idx_from, idx_to):
         """Calculate relative time gap between two vehicles (can be + or -)"""
+        # Time gap at last shared timing marker
+        time_gap = minfo.vehicles.timingLoop.relative_gap(idx_from, idx_to)
+        if time_gap is not None:
+            return time_gap
         try:
             # Get lap progress for both vehicles
             from_laps = api.read.lap.completed_laps(idx_from)
@@ -1883,6 +1914,10 @@ class Realtime(Overlay):
         permitindo que o gap seja calculado desde a largada, sem precisar passar pela
         linha de chegada primeiro.
         """
+        # Time gap at last shared timing marker
+        time_gap = minfo.vehicles.timingLoop.relative_gap(idx_from, idx_to)
+        if time_gap is not None:
+            return time_gap
         try:
             # Obter comprimento da pista
             track_length = api.read.lap.track_length()
@@ -0,0 +1,172 @@
+#  SectorFlow is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 SectorFlow developers
+#  Based on TinyPedal - Copyright (C) 2022-2025 TinyPedal developers
+#
+#  This file is part of SectorFlow.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Strategy Widget
+"""
+
+from ..module_info import minfo
+from ..units import set_unit_fuel
+from ._base import Overlay
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config, widget_name):
+        # Assign base setting
+        super().__init__(config, widget_name)
+        layout = self.set_grid_layout(gap=self.wcfg["bar_gap"])
+        self.set_primary_layout(layout=layout)
+
+        # Config font
+        font_m = self.get_font_metrics(
+            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+
+        # Config variable
+        layout_reversed = self.wcfg["layout"] != 0
+        bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
+        self.plan_count = max(int(self.wcfg["number_of_plans"]), 1)
+
+        # Config units
+        self.unit_fuel = set_unit_fuel(self.cfg.units["fuel_unit"])
+
+        # Base style
+        self.set_base_style(self.set_qss(
+            font_family=self.wcfg["font_name"],
+            font_size=self.wcfg["font_size"],
+            font_weight=self.wcfg["font_weight"])
+        )
+
+        # Pit stops
+        bar_style_stops = (
+            self.set_qss(
+                fg_color=self.wcfg["font_color_best_plan"],
+                bg_color=self.wcfg["bkg_color_best_plan"]),
+            self.set_qss(
+                fg_color=self.wcfg["font_color_pit_stops"],
+                bg_color=self.wcfg["bkg_color_pit_stops"]),
+        )
+        self.bars_stops = self.set_qlabel(
+            text="-",
+            style=bar_style_stops[1],
+            width=font_m.width * 2 + bar_padx,
+            count=self.plan_count,
+        )
+        self.bars_stops[0].updateStyle(bar_style_stops[0])
+        self.set_grid_layout_table_column(
+            layout=layout,
+            targets=self.bars_stops,
+            column_index=self.wcfg["column_index_pit_stops"],
+            bottom_to_top=layout_reversed,
+        )
+
+        # Time delta to best plan
+        bar_style_time = self.set_qss(
+            fg_color=self.wcfg["font_color_time_delta"],
+            bg_color=self.wcfg["bkg_color_time_delta"]
+        )
+        self.bars_time = self.set_qlabel(
+            text="--.-",
+            style=bar_style_time,
+            width=font_m.width * 6 + bar_padx,
+            count=self.plan_count,
+        )
+        self.set_grid_layout_table_column(
+            layout=layout,
+            targets=self.bars_time,
+            column_index=self.wcfg["column_index_time_delta"],
+            bottom_to_top=layout_reversed,
+        )
+
+        # Tyre changes
+        bar_style_tyre = self.set_qss(
+            fg_color=self.wcfg["font_color_tyre_changes"],
+            bg_color=self.wcfg["bkg_color_tyre_changes"]
+        )
+        self.bars_tyre = self.set_qlabel(
+            text="-",
+            style=bar_style_tyre,
+            width=font_m.width * 2 + bar_padx,
+            count=self.plan_count,
+        )
+        self.set_grid_layout_table_column(
+            layout=layout,
+            targets=self.bars_tyre,
+            column_index=self.wcfg["column_index_tyre_changes"],
+            bottom_to_top=layout_reversed,
+        )
+
+        # Next stop refill
+        bar_style_refill = self.set_qss(
+            fg_color=self.wcfg["font_color_next_refill"],
+            bg_color=self.wcfg["bkg_color_next_refill"]
+        )
+        self.bars_refill = self.set_qlabel(
+            text="---.-",
+            style=bar_style_refill,
+            width=font_m.width * 5 + bar_padx,
+            count=self.plan_count,
+        )
+        self.set_grid_layout_table_column(
+            layout=layout,
+            targets=self.bars_refill,
+            column_index=self.wcfg["column_index_next_refill"],
+            bottom_to_top=layout_reversed,
+        )
+
+        # Last data
+        self.strategy_info = self.subscribe_info("strategy")
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        if not self.strategy_info.changed():
+            return
+
+        plans = minfo.strategy.plans
+        is_energy = minfo.strategy.isEnergy
+        best_time = plans[0].total_time if plans else 0.0
+        for index in range(self.plan_count):
+            if index < len(plans):
+                plan = plans[index]
+                stops = plan.stops
+                time_delta = min(plan.total_time - best_time, 999.9)
+                tyre_changes = plan.tyre_change.count(True)
+                refill = min(plan.refill[0], 999.9) if plan.refill else 0.0
+                if not is_energy:
+                    refill = self.unit_fuel(refill)
+                self.update_plan(index, stops, time_delta, tyre_changes, refill)
+            else:
+                self.update_plan(index, None, None, None, None)
+
+    # GUI update methods
+    def update_plan(self, index, stops, time_delta, tyre_changes, refill):
+        """Strategy plan"""
+        self.update_text(self.bars_stops[index], stops, "-", "{}")
+        self.update_text(self.bars_time[index], time_delta, "--.-", "+{:.1f}")
+        self.update_text(self.bars_tyre[index], tyre_changes, "-", "{}")
+        self.update_text(self.bars_refill[index], refill, "---.-", "{:.1f}")
+
+    def update_text(self, target, data, text_def, text_format):
+        """Update text"""
+        if target.last != data:
+            target.last = data
+            if data is None:
+                target.setText(text_def)
+            else:
+                target.setText(text_format.format(data))
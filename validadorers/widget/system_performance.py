@@ -27,8 +27,11 @@ from functools import partial
 import psutil
 
 from .. import calculation as calc
+from ..shared_request import shared_request
 from ._base import Overlay
 
+ENDPOINT_WIDTH = 24  # max characters of endpoint path
+
 
 class Realtime(Overlay):
     """Draw widget"""
@@ -50,12 +53,14 @@ class Realtime(Overlay):
             prefix_just = max(
                 len(self.wcfg["prefix_system"]),
                 len(self.wcfg["prefix_tinypedal"]),
+                len(self.wcfg["prefix_request"]),
             )
         else:
             prefix_just = 0
 
         self.prefix_sys = self.wcfg["prefix_system"].ljust(prefix_just)
         self.prefix_app = self.wcfg["prefix_tinypedal"].ljust(prefix_just)
+        self.prefix_req = self.wcfg["prefix_request"].ljust(prefix_just)
 
         # Base style
         self.set_base_style(self.set_qss(
@@ -98,6 +103,51 @@ class Realtime(Overlay):
                 column=self.wcfg["column_index_tinypedal"],
             )
 
+        # Network request performance
+        if self.wcfg["show_request_performance"]:
+            text_req = f"{self.prefix_req}   0ms   0E"
+            bar_style_req = self.set_qss(
+                fg_color=self.wcfg["font_color_request"],
+                bg_color=self.wcfg["bkg_color_request"]
+            )
+            self.bar_req = self.set_qlabel(
+                text=text_req,
+                style=bar_style_req,
+                width=font_m.width * len(text_req) + bar_padx,
+            )
+            self.set_primary_orient(
+                target=self.bar_req,
+                column=self.wcfg["column_index_request"],
+            )
+
+        # Network request slowest endpoints
+        self.endpoint_count = max(self.wcfg["request_endpoint_count"], 1)
+        if self.wcfg["show_request_endpoints"]:
+            layout_endpoint = self.set_grid_layout()
+            text_endpoint = " " * (ENDPOINT_WIDTH + 11)
+            bar_style_endpoint = self.set_qss(
+                fg_color=self.wcfg["font_color_request_endpoint"],
+                bg_color=self.wcfg["bkg_color_request_endpoint"]
+            )
+            self.bars_endpoint = tuple(
+                self.set_qlabel(
+                    text=text_endpoint,
+                    style=bar_style_endpoint,
+                    width=font_m.width * len(text_endpoint) + bar_padx,
+                )
+                for _ in range(self.endpoint_count)
+            )
+            self.set_grid_layout_vert(
+                layout=layout_endpoint,
+                targets=self.bars_endpoint,
+                row_start=0,
+                column=0,
+            )
+            self.set_primary_orient(
+                target=layout_endpoint,
+                column=self.wcfg["column_index_request_endpoint"],
+            )
+
         # Last data
         self.app_info = psutil.Process(os.getpid())
         self.cpu_count = os.cpu_count()
@@ -119,6 +169,19 @@ class Realtime(Overlay):
                 self.app_cpu_ema, self.app_info.cpu_percent() / self.cpu_count)
             self.update_app(self.bar_app, self.app_cpu_ema, self.prefix_app)
 
+        if self.wcfg["show_request_performance"]:
+            self.update_request(self.bar_req, shared_request.summary(), self.prefix_req)
+
+        if self.wcfg["show_request_endpoints"]:
+            endpoints = shared_request.top_endpoints(self.endpoint_count)
+            for index, target in enumerate(self.bars_endpoint):
+                if index < len(endpoints):
+                    endpoint, stats = endpoints[index]
+                    data = endpoint.partition("/")[2], stats.latencyAvg, stats.errors
+                else:
+                    data = None
+                self.update_endpoint(target, data)
+
     # GUI update methods
     def update_system(self, target, data, prefix):
         """System performance"""
@@ -137,3 +200,23 @@ class Realtime(Overlay):
             cpu = f"{data: >4.2f}"[:4].strip(".")
             mem = f"{memory_used: >4.2f}"[:4].strip(".")
             target.setText(f"{prefix}{cpu: >4}%{mem: >5}MB")
+
+    def update_request(self, target, data, prefix):
+        """Network request performance, average latency & total errors"""
+        if target.last != data:
+            target.last = data
+            latency = min(data[2] * 1000, 9999)
+            errors = min(data[1], 999)
+            target.setText(f"{prefix}{latency: >4.0f}ms{errors: >4}E")
+
+    def update_endpoint(self, target, data):
+        """Network request endpoint path, average latency & total errors"""
+        if target.last != data:
+            target.last = data
+            if data is None:
+                target.setText("")
+                return
+            path = f"/{data[0]}"[-ENDPOINT_WIDTH:]
+            latency = min(data[1] * 1000, 9999)
+            errors = min(data[2], 999)
+            target.setText(f"{path: <{ENDPOINT_WIDTH}}{latency: >4.0f}ms{errors: >4}E")
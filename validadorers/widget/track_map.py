@@ -27,6 +27,7 @@ from PySide6.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 from .. import calculation as calc
 from ..api_control import api
 from ..formatter import random_color_class
+from ..map_index import MapLOD, max_pixel_error
 from ..module_info import minfo
 from ._base import Overlay
 
@@ -153,18 +154,16 @@ class Realtime(Overlay):
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin, angle)
 
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.temp_map_size * 3, self.display_detail_level)
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                elif index >= total_nodes:  # don't skip last node
-                    map_path.lineTo(*coords)
-                elif last_skip >= skip_node:
-                    map_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
+            # Select map detail level, error stays under max pixel error
+            map_lod = minfo.mapping.coordinatesLOD
+            if map_lod is None or map_lod.coords is not raw_coords:
+                map_lod = MapLOD(raw_coords)
+            map_scaled = self.map_scaled
+            nodes = map_lod.level_index(
+                max_pixel_error(self.display_detail_level) / max(self.map_scale, 0.000001))
+            map_path.moveTo(*map_scaled[nodes[0]])
+            for index in nodes[1:]:
+                map_path.lineTo(*map_scaled[index])
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -337,8 +336,8 @@ class Realtime(Overlay):
         # Verify data set
         if not map_data:
             return
-        dist_data = minfo.mapping.elevations
-        if not dist_data:
+        map_index = minfo.mapping.mapIndex
+        if map_index is None or len(map_index.distances) != len(map_data):
             return
         deltabest_data = minfo.delta.deltaBestData
         deltabest_max_index = len(deltabest_data) - 1
@@ -350,7 +349,6 @@ class Realtime(Overlay):
             return
 
         laptime_scale = laptime_best / laptime_pace
-        dist_end_index = min(len(dist_data), len(map_data)) - 1
 
         # Calculate pit timer & target time
         if plr_veh_info.pitRequested and not plr_veh_info.inPit:  # out pit lane
@@ -386,7 +384,7 @@ class Realtime(Overlay):
             else:
                 estimate_dist = 0
 
-            dist_node_index = calc.binary_search_higher_column(dist_data, estimate_dist, 0, dist_end_index)
+            dist_node_index = map_index.node_at_distance(estimate_dist)
             painter.translate(*map_data[dist_node_index])
             painter.setPen(self.pen_pit_styles[0])
             painter.drawEllipse(self.veh_shape)
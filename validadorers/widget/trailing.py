@@ -21,12 +21,15 @@
 Trailing Widget
 """
 
-from PySide6.QtCore import QPointF, QRect, Qt
+from array import array
+
+from PySide6.QtCore import QRect, Qt
 from PySide6.QtGui import QPainter, QPen, QPixmap
 
 from ..api_control import api
 from ..module_info import minfo
 from ._base import Overlay
+from ._painter import ScrollingPlot
 
 
 class Realtime(Overlay):
@@ -41,8 +44,13 @@ class Realtime(Overlay):
         self.display_height = max(int(self.wcfg["display_height"]), 2)
         self.area_width = max(int(self.wcfg["display_width"]), 2)
         self.area_height = self.display_height + self.margin * 2
-        self.display_scale = max(int(
-            self.wcfg["update_interval"] / 20 * self.wcfg["display_scale"]), 1)
+        px_per_sample = self.wcfg["update_interval"] / 20 * self.wcfg["display_scale"]
+        if px_per_sample >= 1:
+            column_width = int(px_per_sample)
+            decimation = 1
+        else:  # combine multiple samples into 1 pixel column
+            column_width = 1
+            decimation = max(round(1 / max(px_per_sample, 0.001)), 1)
 
         max_line_width = int(max(
             1,
@@ -52,35 +60,18 @@ class Realtime(Overlay):
             self.wcfg["ffb_line_width"],
             self.wcfg["steering_line_width"],
         ))
-        max_samples = 3 + max_line_width  # 3 offset + max line width
-        self.samples_offset = max_samples - 2
 
         # Config canvas
         self.resize(self.area_width, self.area_height)
         self.rect_viewport = self.set_viewport_orientation()
 
         self.pixmap_background = QPixmap(self.area_width, self.area_height)
-        self.pixmap_plot = QPixmap(self.area_width, self.area_height)
-        self.pixmap_plot.fill(Qt.transparent)
-        self.pixmap_plot_section = QPixmap(self.display_scale * 3, self.area_height)
-        self.pixmap_plot_section.fill(Qt.transparent)
-
-        if self.wcfg["show_throttle"]:
-            self.data_throttle = self.create_data_samples(max_samples)
-        if self.wcfg["show_brake"]:
-            self.data_brake = self.create_data_samples(max_samples)
-        if self.wcfg["show_clutch"]:
-            self.data_clutch = self.create_data_samples(max_samples)
-        if self.wcfg["show_ffb"]:
-            self.data_ffb = self.create_data_samples(max_samples)
-        if self.wcfg["show_steering"]:
-            self.data_steering = self.create_data_samples(max_samples)
-        if self.wcfg["show_wheel_lock"]:
-            self.data_wheel_lock = self.create_data_samples(max_samples)
-        if self.wcfg["show_wheel_slip"]:
-            self.data_wheel_slip = self.create_data_samples(max_samples)
-
-        self.draw_queue = sorted(self.config_draw_order(), reverse=True)
+        self.plot = ScrollingPlot(
+            self.area_width, self.area_height, column_width, decimation, max_line_width)
+        draw_queue = tuple(self.config_draw_order())
+        for plot_name, pen, line_style in draw_queue:
+            setattr(self, f"data_{plot_name}", self.plot.add_series(pen, line_style))
+        self.plot_values = array("d", bytes(8 * len(draw_queue)))
         self.draw_background()
 
         # Last data
@@ -150,9 +141,8 @@ class Realtime(Overlay):
                 self.update_sample(self.data_wheel_slip, wheel_slip)
 
             # Update after all pedal data set
-            self.draw_plot_section()
-            self.draw_plot()
-            self.update()  # trigger paint event
+            if self.plot.append(self.plot_values):
+                self.update()  # trigger paint event
 
     # GUI update methods
     def paintEvent(self, event):
@@ -160,7 +150,7 @@ class Realtime(Overlay):
         painter = QPainter(self)
         painter.setViewport(self.rect_viewport)
         painter.drawPixmap(0, 0, self.pixmap_background)
-        painter.drawPixmap(0, 0, self.pixmap_plot)
+        self.plot.draw(painter)
 
     def draw_background(self):
         """Draw background"""
@@ -189,41 +179,10 @@ class Realtime(Overlay):
             pos_offset = self.display_height * offset + self.margin
             painter.drawLine(0, pos_offset, self.area_width, pos_offset)
 
-    def draw_plot(self):
-        """Draw final plot"""
-        painter = QPainter(self.pixmap_plot)
-        painter.setCompositionMode(QPainter.CompositionMode_Source)
-        # Draw last plot, +3 sample offset, -2 sample crop
-        painter.drawPixmap(
-            self.display_scale * 3, 0, self.pixmap_plot,
-            self.display_scale * 2, 0, 0 ,0)
-        # Draw section plot
-        painter.drawPixmap(0, 0, self.pixmap_plot_section)
-
-    def draw_plot_section(self):
-        """Draw section plot"""
-        self.pixmap_plot_section.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_plot_section)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        for _, data, pen, line_style in self.draw_queue:
-            painter.setPen(pen)
-            if line_style:
-                painter.drawPoints(data)
-            else:
-                painter.drawPolyline(data)
-
     # Additional methods
-    def create_data_samples(self, max_samples):
-        """Create data sample list"""
-        return tuple(QPointF(index * self.display_scale, 0) for index in range(max_samples))
-
-    def update_sample(self, dataset, value):
-        """Update input position samples"""
-        # Scale & set new input position
-        dataset[0].setY(value * self.display_height + self.margin)
-        # Move old input data (Y) 1 display unit to right
-        for index in range(self.samples_offset, -1, -1):
-            dataset[index + 1].setY(dataset[index].y())
+    def update_sample(self, index, value):
+        """Update input position sample"""
+        self.plot_values[index] = value * self.display_height + self.margin
 
     def set_viewport_orientation(self):
         """Set viewport orientation"""
@@ -243,14 +202,18 @@ class Realtime(Overlay):
 
     def config_draw_order(self):
         """Config plot draw order"""
-        plot_names = (
-            "throttle",
-            "brake",
-            "clutch",
-            "ffb",
-            "steering",
-            "wheel_lock",
-            "wheel_slip",
+        plot_names = sorted(
+            (
+                "throttle",
+                "brake",
+                "clutch",
+                "ffb",
+                "steering",
+                "wheel_lock",
+                "wheel_slip",
+            ),
+            key=lambda name: self.wcfg[f"draw_order_index_{name}"],
+            reverse=True,
         )
         for plot_name in plot_names:
             if not self.wcfg[f"show_{plot_name}"]:
@@ -260,8 +223,7 @@ class Realtime(Overlay):
             pen.setWidth(self.wcfg[f"{plot_name}_line_width"])
             pen.setColor(self.wcfg[f"{plot_name}_color"])
             yield (
-                self.wcfg[f"draw_order_index_{plot_name}"],  # index
-                getattr(self, f"data_{plot_name}"),  # data
+                plot_name,
                 pen,  # pen style
                 self.wcfg[f"{plot_name}_line_style"],  # line style
             )
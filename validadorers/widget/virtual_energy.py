@@ -22,6 +22,7 @@ Virtual energy Widget
 """
 
 from .. import calculation as calc
+from ..const_common import TEXT_NA
 from ..module_info import minfo
 from ._base import Overlay
 from ._common import WarningFlash
@@ -370,6 +371,11 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        # Virtual energy is only available for local player
+        if minfo.multicar.focus:
+            self.update_unavailable()
+            return
+
         is_low_energy = minfo.energy.estimatedLaps <= self.wcfg["low_energy_lap_threshold"]
         if self.wcfg["show_low_energy_warning_flash"] and minfo.energy.estimatedValidConsumption:
             is_low_energy = self.warn_flash.state(is_low_energy)
@@ -451,6 +457,25 @@ class Realtime(Overlay):
                 )
 
     # GUI update methods
+    def update_unavailable(self):
+        """Show unavailable energy data of focused non-player car"""
+        targets = [
+            self.bar_curr, self.bar_need, self.bar_laps,
+            self.bar_mins, self.bar_used, self.bar_save,
+        ]
+        if self.wcfg["show_estimated_pitstop_count"]:
+            targets += self.bar_pits, self.bar_early
+        if self.wcfg["show_delta_and_end_remaining"]:
+            targets += self.bar_delta, self.bar_end
+        if self.wcfg["show_fuel_ratio_and_bias"]:
+            targets += self.bar_ratio, self.bar_bias
+        for target in targets:
+            if target.last != TEXT_NA:
+                target.last = TEXT_NA
+                target.setText(TEXT_NA)
+        self.bar_curr.updateStyle(self.bar_style_curr[0])
+        self.bar_need.updateStyle(self.bar_style_need[0])
+
     def update_energy(self, target, data, color=None, sign=""):
         """Update energy data"""
         if target.last != data:
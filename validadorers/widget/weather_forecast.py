@@ -34,7 +34,7 @@ from ..const_common import (
     TEXT_NA,
 )
 from ..const_file import ImageFile
-from ..process.weather import WeatherNode, forecast_sky_type
+from ..process.weather import WeatherTimeline, forecast_sky_type
 from ..units import set_unit_temperature
 from ._base import Overlay
 from ._painter import split_pixmap_icon
@@ -156,7 +156,8 @@ class Realtime(Overlay):
         """Update when vehicle on track"""
         # Read weather data
         is_lap_type = api.read.session.lap_type()
-        forecast_info = api.read.session.weather_forecast()
+        timeline = api.read.session.weather_timeline()
+        forecast_info = timeline.nodes
         forecast_count = min(len(forecast_info), MAX_FORECASTS)
 
         if forecast_count < 1:
@@ -165,7 +166,7 @@ class Realtime(Overlay):
         if is_lap_type:
             index_offset = 0
         else:  # time type race, add index offset to ignore negative estimated time
-            index_offset = self.set_forecast_time(forecast_info)
+            index_offset = self.set_forecast_time(timeline)
 
         # Forecast
         for index in range(self.total_slot):
@@ -258,20 +259,14 @@ class Realtime(Overlay):
                     self.bars_rain[slot_index].setHidden(unavailable)
 
     # Additional methods
-    def set_forecast_time(self, forecast_info: tuple[WeatherNode, ...]) -> int:
-        """Set forecast estimated time"""
-        index_offset = 0
+    def set_forecast_time(self, timeline: WeatherTimeline) -> int:
+        """Set forecast estimated time, return index offset of last started forecast"""
         session_length = api.read.session.end()
         elapsed_time = api.read.session.elapsed()
-        for index, forecast in enumerate(forecast_info):
-            if index == 0:
-                continue
-            # Seconds away = next node start percent * session length - elapsed time
-            _time = self.estimated_time[index] = round(
-                (forecast.start_percent * session_length - elapsed_time) / 60)
-            if _time <= 0:
-                index_offset += 1
-        return index_offset
+        node_minutes = timeline.node_minutes(elapsed_time, session_length)
+        for index in range(1, min(len(node_minutes), MAX_FORECASTS)):
+            self.estimated_time[index] = node_minutes[index]
+        return max(timeline.node_at(elapsed_time, session_length), 0)
 
 
 def create_weather_icon_set(icon_size: int):